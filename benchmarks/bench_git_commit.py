@@ -0,0 +1,86 @@
+"""Compara commit porcelain (git add .) e plumbing em um repo sintetico.
+
+Uso: python -m benchmarks.bench_git_commit --challenges 10000 --rounds 5
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import statistics
+import subprocess
+import tempfile
+import time
+from pathlib import Path
+
+from src.git_client import GitClient
+
+
+def _git(repo: Path, *args: str) -> None:
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+def build_repo(root: Path, challenges: int) -> Path:
+    """Cria um repo com `challenges` pastas de 4 arquivos e um commit inicial."""
+    repo = root / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "bench@example.com")
+    _git(repo, "config", "user.name", "bench")
+    for i in range(challenges):
+        folder = repo / "challenges" / f"2025-{i % 12 + 1:02d}" / f"codeforces_{i}_A_p{i}"
+        folder.mkdir(parents=True)
+        for name in ("README.md", "solution.py", "test_solution.py", "notes.md"):
+            (folder / name).write_text(f"{name} {i}\n", encoding="utf-8")
+    (repo / "INDEX.md").write_text("# Desafios\n", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "seed")
+    return repo
+
+
+def add_challenge(repo: Path, tag: str) -> Path:
+    """Simula o RepoWriter: uma pasta nova e uma linha no INDEX.md."""
+    folder = repo / "challenges" / "2026-01" / f"codeforces_bench_{tag}"
+    folder.mkdir(parents=True)
+    for name in ("README.md", "solution.py", "test_solution.py", "notes.md"):
+        (folder / name).write_text(f"{name} {tag}\n", encoding="utf-8")
+    with (repo / "INDEX.md").open("a", encoding="utf-8") as handle:
+        handle.write(f"- [{tag}](challenges/2026-01/codeforces_bench_{tag})\n")
+    return folder
+
+
+def measure(repo: Path, mode: str, rounds: int) -> list[float]:
+    """Tempo de stage + commit de um desafio novo, por rodada."""
+    client = GitClient(repo_path=repo, remote=None, branch="main", mode=mode)
+    timings = []
+    for i in range(rounds):
+        folder = add_challenge(repo, f"{mode}{i}")
+        start = time.perf_counter()
+        if mode == "plumbing":
+            client.add_paths([folder, repo / "INDEX.md"])
+        else:
+            client.add_all()
+        client.commit(f"bench {mode} {i}")
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--challenges", type=int, default=10_000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+    logging.getLogger("git").setLevel(logging.WARNING)
+    with tempfile.TemporaryDirectory() as tmp:
+        start = time.perf_counter()
+        repo = build_repo(Path(tmp), args.challenges)
+        print(f"repo sintetico com {args.challenges} desafios em {time.perf_counter() - start:.1f}s")
+        for mode in ("porcelain", "plumbing"):
+            timings = measure(repo, mode, args.rounds)
+            print(
+                f"{mode:>9}: mediana {statistics.median(timings) * 1000:.1f} ms"
+                f" | min {min(timings) * 1000:.1f} ms | max {max(timings) * 1000:.1f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
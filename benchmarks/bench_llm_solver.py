@@ -0,0 +1,49 @@
+"""Mede o LLMSolver com o backend stub: lote frio (backend) e re-execucao (cache).
+
+Uso: python -m benchmarks.bench_llm_solver --problems 200 --latency 0.05 --in-flight 4
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from benchmarks.bench_template_render import build_problems
+from src.solver.cache import SolutionCache
+from src.solver.llm_solver import LLMSolver
+from src.solver.stub_backend import StubBackend
+
+
+def run(solver: LLMSolver, problems, language: str, workers: int) -> float:
+    """Gera o lote com `workers` threads e retorna o tempo total."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(lambda problem: solver.generate(problem, language), problems))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--problems", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="Latencia simulada do backend (s)")
+    parser.add_argument("--in-flight", type=int, default=4)
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--language", default="python")
+    args = parser.parse_args()
+    logging.getLogger("solver").setLevel(logging.WARNING)
+    problems = build_problems(args.problems)
+    with tempfile.TemporaryDirectory() as tmp:
+        backend = StubBackend(latency_seconds=args.latency)
+        solver = LLMSolver(backend=backend, cache=SolutionCache(Path(tmp)), max_in_flight=args.in_flight)
+        cold = run(solver, problems, args.language, args.workers)
+        calls = backend.calls
+        warm = run(solver, problems, args.language, args.workers)
+    print(f"frio:   {cold * 1000:.0f} ms | {calls} chamadas ao backend (max {args.in_flight} simultaneas)")
+    print(f"cache:  {warm * 1000:.0f} ms | {backend.calls - calls} chamadas ao backend")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""Compara json.loads do payload inteiro com o parse em streaming do problemset.
+
+Cada metodo roda em um processo proprio para medir o pico de RSS isoladamente.
+
+Uso: python -m benchmarks.bench_problemset_parse --problems 10000
+     python -m benchmarks.bench_problemset_parse --payload problemset.json
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+TAGS = ["math", "greedy", "dp", "graphs", "strings", "brute force", "implementation", "sortings"]
+
+
+def build_payload(path: Path, problems: int) -> None:
+    """Gera um payload no formato de problemset.problems (com problemStatistics)."""
+    rng = random.Random(42)
+    items = []
+    stats = []
+    for i in range(problems):
+        contest_id, index = 2000 - i // 5, "ABCDE"[i % 5]
+        item = {
+            "contestId": contest_id,
+            "problemsetName": None,
+            "index": index,
+            "name": f"Problem {i}",
+            "type": "PROGRAMMING",
+            "points": 500.0 + (i % 5) * 250,
+            "tags": rng.sample(TAGS, 3),
+        }
+        if i % 7:
+            item["rating"] = 800 + (i % 28) * 100
+        items.append(item)
+        stats.append({"contestId": contest_id, "index": index, "solvedCount": rng.randint(0, 50000)})
+    payload = {"status": "OK", "result": {"problems": items, "problemStatistics": stats}}
+    path.write_text(json.dumps(payload), encoding="utf-8")
+
+
+def peak_rss_kb() -> int:
+    """Pico de RSS do processo (VmHWM no Linux; ru_maxrss herda o valor do pai no exec)."""
+    try:
+        with open("/proc/self/status", encoding="ascii") as handle:
+            for line in handle:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    import resource
+
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def worker(method: str, path: Path) -> None:
+    """Executa um metodo e imprime tempo e RSS (kB) em JSON."""
+    from src.providers.problemset import ProblemRecord, parse_problemset
+
+    baseline = peak_rss_kb()
+    start = time.perf_counter()
+    with path.open("rb") as handle:
+        if method == "full":
+            problems = json.loads(handle.read())["result"]["problems"]
+            records = [ProblemRecord.from_dict(problem) for problem in problems]
+        else:
+            records = parse_problemset(iter(lambda: handle.read(1 << 16), b""))
+    elapsed = time.perf_counter() - start
+    peak = peak_rss_kb()
+    print(json.dumps({"seconds": elapsed, "peak_kb": peak, "delta_kb": peak - baseline, "records": len(records)}))
+
+
+def measure(method: str, path: Path) -> dict:
+    """Roda o worker em subprocesso."""
+    result = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_problemset_parse", "--worker", method, "--payload", str(path)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--problems", type=int, default=10_000)
+    parser.add_argument("--payload", help="Payload gravado da API (padrao: sintetico)")
+    parser.add_argument("--worker", choices=("full", "stream"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        worker(args.worker, Path(args.payload))
+        return
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(args.payload) if args.payload else Path(tmp) / "problemset.json"
+        if not args.payload:
+            build_payload(path, args.problems)
+        print(f"payload: {path.stat().st_size / 1e6:.1f} MB")
+        for method in ("full", "stream"):
+            stats = measure(method, path)
+            print(
+                f"{method:>6}: {stats['seconds'] * 1000:.0f} ms | pico RSS {stats['peak_kb'] / 1024:.1f} MB"
+                f" (+{stats['delta_kb'] / 1024:.1f} MB) | {stats['records']} problemas"
+            )
+
+
+if __name__ == "__main__":
+    main()
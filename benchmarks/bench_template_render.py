@@ -0,0 +1,67 @@
+"""Mede a geracao de artefatos do TemplateSolver para um lote de problemas.
+
+Compara o motor com cache (templates compilados uma vez por linguagem) com um motor
+novo a cada problema (le e compila os arquivos toda vez).
+
+Uso: python -m benchmarks.bench_template_render --problems 1000
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import time
+from typing import List
+
+from src.providers.base import Problem
+from src.solver.template_engine import SOLUTION_FILES, TemplateEngine
+from src.solver.template_solver import TemplateSolver
+
+TAGS = ["math", "greedy", "dp", "graphs", "strings", "brute force", "implementation", "sortings"]
+
+
+def build_problems(count: int) -> List[Problem]:
+    """Problemas sinteticos com nomes e tags variados."""
+    return [
+        Problem(
+            source="codeforces",
+            contest_id=2000 - i // 5,
+            index="ABCDE"[i % 5],
+            name=f"Problem {i}: Sum {{of}} $values",
+            rating=800 + (i % 28) * 100,
+            tags=tuple(TAGS[i % 8:i % 8 + 3]),
+            url=f"https://codeforces.com/problemset/problem/{2000 - i // 5}/{'ABCDE'[i % 5]}",
+        )
+        for i in range(count)
+    ]
+
+
+def run(problems: List[Problem], language: str, cached: bool) -> float:
+    """Gera os artefatos do lote e retorna o tempo total em segundos."""
+    solver = TemplateSolver()
+    solver.engine.get(language)
+    start = time.perf_counter()
+    for problem in problems:
+        if not cached:
+            solver.engine = TemplateEngine()
+        solver.generate(problem, language)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--problems", type=int, default=1000)
+    parser.add_argument("--language", choices=sorted(SOLUTION_FILES), action="append")
+    args = parser.parse_args()
+    logging.getLogger("solver").setLevel(logging.WARNING)
+    problems = build_problems(args.problems)
+    for language in args.language or list(SOLUTION_FILES):
+        cold = run(problems, language, cached=False)
+        warm = run(problems, language, cached=True)
+        print(
+            f"{language:>6}: cache {warm * 1000:.1f} ms | sem cache {cold * 1000:.1f} ms"
+            f" | {args.problems} problemas ({warm / args.problems * 1e6:.1f} us/problema)"
+        )
+
+
+if __name__ == "__main__":
+    main()
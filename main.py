@@ -1,42 +1,135 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
+import json
 from pathlib import Path
+from typing import List
 
 from dotenv import load_dotenv
 
+from src.async_runtime import AsyncRuntime
 from src.git_client import GitClient
-from src.providers.codeforces import CodeforcesProvider
+from src.http_client import HttpClient
+from src.providers.registry import build_registry
+from src.providers.statements import StatementCache, StatementFetcher
+from src.push_queue import PushQueue
 from src.repo_writer import RepoWriter
 from src.scheduler import Scheduler
-from src.settings import Settings
+from src.settings import JobSettings, Settings
+from src.settings_watcher import SettingsWatcher
+from src.solver.base import Solver
+from src.solver.cache import SolutionCache
+from src.solver.llm_solver import LLMSolver
+from src.solver.stub_backend import StubBackend
 from src.solver.template_solver import TemplateSolver
-from src.state_store import StateStore
-from src.utils.logger import get_logger
+from src.sqlite_state_store import SqliteStateStore
+from src.state_store import StateBackend, StateStore
+from src.utils.logger import configure_logging, get_logger
+from src.utils.metrics import MetricsServer, configure_metrics, get_metrics
+from src.utils.time import WEEKDAYS
 
 
 logger = get_logger("main")
 
 
+def build_state_store(settings: Settings, read_only: bool = False) -> StateBackend:
+    """Instancia o backend de historico configurado em state_backend."""
+    state_dir = Path(settings.repo_path) / "state"
+    if settings.state_backend == "sqlite":
+        return SqliteStateStore(path=state_dir / "state.sqlite3", read_only=read_only)
+    return StateStore(path=state_dir / "state.jsonl", read_only=read_only)
+
+
+def build_solver(settings: Settings, http: HttpClient) -> Solver:
+    """Instancia o solver configurado em settings.solver."""
+    cache_dir = Path(settings.repo_path) / settings.cache_dir
+    statements = None
+    if settings.statements.enabled:
+        statements = StatementFetcher(cache=StatementCache(root=cache_dir / "statements"), http=http)
+    templates = TemplateSolver(statements=statements)
+    config = settings.solver
+    if config.backend == "template":
+        return templates
+    backend = StubBackend(model=config.model or "stub-1", latency_seconds=config.stub_latency_seconds)
+    return LLMSolver(
+        backend=backend,
+        cache=SolutionCache(root=cache_dir / "solutions"),
+        templates=templates,
+        max_in_flight=config.max_in_flight,
+        timeout_seconds=config.timeout_seconds,
+        baseline=config.backend == "stub",
+    )
+
+
+def setup_logging(settings: Settings) -> None:
+    """Liga o listener de logs com o formato e o arquivo configurados."""
+    config = settings.logging
+    configure_logging(
+        level=config.level,
+        json_format=config.format == "json",
+        file_path=Path(settings.repo_path) / config.file if config.file else None,
+        max_bytes=config.max_bytes,
+        backup_count=config.backup_count,
+    )
+
+
 def build_scheduler(settings_path: Path) -> Scheduler:
     """Constroi o Scheduler e dependencias."""
     settings = Settings.load(str(settings_path))
     repo_path = Path(settings.repo_path)
-    state_store = StateStore(path=repo_path / "state" / "state.json")
-    provider = CodeforcesProvider()
-    solver = TemplateSolver()
-    writer = RepoWriter(repo_path=repo_path)
-    git_client = GitClient(repo_path=repo_path, remote=settings.git_remote, branch=settings.git_branch)
+    state_store = build_state_store(settings)
+    configure_metrics(settings.metrics.enabled)
+    http = HttpClient(
+        timeout=settings.http.timeout_seconds,
+        rate_per_second=settings.http.rate_per_second,
+        burst=settings.http.burst,
+        failure_threshold=settings.http.failure_threshold,
+        reset_seconds=settings.http.reset_seconds,
+        pool_size=settings.http.pool_size,
+    )
+    providers = build_registry(settings, http)
+    solver = build_solver(settings, http)
+    writer = RepoWriter(repo_path=repo_path, fsync=settings.writer.fsync)
+    git_client = GitClient(
+        repo_path=repo_path,
+        remote=settings.git_remote,
+        branch=settings.git_branch,
+        mode=settings.git_mode,
+    )
+    push_queue = None
+    if settings.push.mode == "background":
+        push_queue = PushQueue(
+            git_client=git_client,
+            state_path=repo_path / settings.cache_dir / "push_queue.json",
+            backoff_seconds=settings.push.backoff_seconds,
+            max_backoff_seconds=settings.push.max_backoff_seconds,
+        )
+        push_queue.start()
     return Scheduler(
         settings=settings,
         state_store=state_store,
-        provider=provider,
+        provider=providers.get(providers.names[0]),
+        providers=providers,
         solver=solver,
         writer=writer,
         git_client=git_client,
+        push_queue=push_queue,
+        settings_watcher=SettingsWatcher(settings_path, settings) if settings.scheduler.reload else None,
     )
 
 
+def start_metrics_server(scheduler: Scheduler) -> None:
+    """Sobe o GET /metrics dedicado (so nos modos de longa duracao, uma vez)."""
+    config = scheduler.settings.metrics
+    if not config.enabled or config.port is None or scheduler.metrics_server is not None:
+        return
+    scheduler.metrics_server = MetricsServer(get_metrics(), config.host, config.port)
+    scheduler.metrics_server.start()
+    host, port = scheduler.metrics_server.address
+    logger.info("📊 Metricas em http://%s:%s/metrics", host, port)
+
+
 def pick_job(settings: Settings, day: str | None, time_str: str | None):
     """Seleciona job por dia/horario (opcional)."""
     if not day:
@@ -52,6 +145,44 @@ def pick_job(settings: Settings, day: str | None, time_str: str | None):
     raise RuntimeError(f"Nenhum job em {day} {time_str}")
 
 
+def pick_batch_jobs(
+    settings: Settings,
+    day: str | None,
+    time_str: str | None,
+    all_jobs: bool = False,
+) -> List[JobSettings]:
+    """Seleciona os jobs do modo lote (todos com --all, senao o job escolhido)."""
+    ordered = [job for weekday in WEEKDAYS for job in settings.schedule.get(weekday, [])]
+    if all_jobs:
+        return ordered
+    return [pick_job(settings, day, time_str) or ordered[0]]
+
+
+def build_backfill_job(settings: Settings, args: argparse.Namespace) -> JobSettings:
+    """Monta o job do backfill a partir dos filtros da CLI ou de um job do schedule."""
+    if args.difficulty or args.rating:
+        return JobSettings(
+            time="00:00",
+            difficulty=args.difficulty,
+            rating_range=tuple(args.rating) if args.rating else None,
+            tags=args.tags or None,
+        )
+    return pick_batch_jobs(settings, args.day, args.time)[0]
+
+
+def show_state(settings: Settings, args: argparse.Namespace) -> None:
+    """Consulta o historico sem interferir no scheduler em execucao."""
+    store = build_state_store(settings, read_only=True)
+    store.load()
+    if args.failures:
+        report = store.failure_counts_by_job()
+    elif args.used_source:
+        report = sorted(store.used_ids(args.used_source))
+    else:
+        report = store.completed_since(args.days)
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
 def main() -> None:
     """CLI principal."""
     load_dotenv()
@@ -62,17 +193,64 @@ def main() -> None:
     run_once = sub.add_parser("run_once", help="Executa um job imediato")
     run_once.add_argument("--day", help="Dia da semana (opcional)")
     run_once.add_argument("--time", help="Horario HH:MM (opcional)")
+    run_once.add_argument("--all", action="store_true", help="Roda todos os jobs do schedule em paralelo")
+    run_once.add_argument("--count", type=int, default=1, help="Repeticoes de cada job (modo lote)")
+
+    run_sched = sub.add_parser("run_scheduler", help="Executa o loop do scheduler")
+    run_sched.add_argument("--async", dest="use_async", action="store_true", help="Usa o runtime asyncio")
+
+    backfill = sub.add_parser("backfill", help="Gera N desafios em commits agrupados (retomavel)")
+    backfill.add_argument("--count", type=int, required=True, help="Quantidade total de desafios")
+    backfill.add_argument("--day", help="Usa o job deste dia como filtro")
+    backfill.add_argument("--time", help="Horario HH:MM do job (opcional)")
+    backfill.add_argument("--difficulty", help="easy|medium|hard (ignora --day)")
+    backfill.add_argument("--rating", type=int, nargs=2, metavar=("MIN", "MAX"), help="Faixa de rating")
+    backfill.add_argument("--tags", nargs="*", help="Tags obrigatorias")
+    backfill.add_argument("--chunk-size", type=int, help="Desafios por commit (padrao: 25)")
+    backfill.add_argument("--name", help="Id do backfill para retomar (padrao: derivado do filtro)")
 
-    sub.add_parser("run_scheduler", help="Executa o loop do scheduler")
+    state = sub.add_parser("state", help="Consulta o historico de desafios")
+    state.add_argument("--days", type=int, default=7, help="Concluidos nos ultimos N dias")
+    state.add_argument("--failures", action="store_true", help="Contagem de falhas por job")
+    state.add_argument("--used-source", help="Ids ja usados de uma fonte (ex.: codeforces)")
+
+    sub.add_parser("reindex", help="Reconstroi INDEX.md e o manifesto a partir de challenges/")
 
     args = parser.parse_args()
+    setup_logging(Settings.load(args.settings))
+    if args.command == "state":
+        show_state(Settings.load(args.settings), args)
+        return
+    if args.command == "reindex":
+        RepoWriter(repo_path=Path(Settings.load(args.settings).repo_path)).reindex()
+        return
     scheduler = build_scheduler(Path(args.settings))
+    try:
+        run_command(scheduler, args)
+    finally:
+        scheduler.close()
+
 
-    if args.command == "run_once":
+def run_command(scheduler: Scheduler, args: argparse.Namespace) -> None:
+    """Despacha os subcomandos que usam o Scheduler."""
+    if args.command == "backfill":
+        settings = Settings.load(args.settings)
+        job = build_backfill_job(settings, args)
+        scheduler.run_backfill(job, args.count, chunk_size=args.chunk_size, batch_id=args.name)
+    elif args.command == "run_once":
         settings = Settings.load(args.settings)
+        if args.all or args.count > 1:
+            jobs = pick_batch_jobs(settings, args.day, args.time, all_jobs=args.all)
+            scheduler.run_batch(jobs * args.count)
+            return
         job = pick_job(settings, args.day, args.time)
         scheduler.run_once(job=job)
+    elif args.use_async or scheduler.settings.runtime.mode == "async":
+        if scheduler.settings.runtime.status_port is None:
+            start_metrics_server(scheduler)
+        asyncio.run(AsyncRuntime(scheduler=scheduler).run_forever())
     else:
+        start_metrics_server(scheduler)
         scheduler.run_scheduler()
 
 
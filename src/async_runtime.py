@@ -0,0 +1,279 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from src.providers.base import Problem
+from src.scheduler import Scheduler, job_id, stage_pending, track_stage
+from src.settings import JobSettings
+from src.state_store import job_key
+from src.utils.logger import get_logger, log_context
+from src.utils.metrics import JOB_SECONDS, JOBS_TOTAL, RETRIES_TOTAL, get_metrics
+from src.utils.time import now_in_tz
+
+
+logger = get_logger("async")
+
+
+@dataclass
+class AsyncRuntime:
+    """Runtime asyncio do modo agendado.
+
+    Os jobs rodam como tasks concorrentes: pytest e git usam
+    `asyncio.create_subprocess_exec`, selecao/escrita (CPU e cache local) rodam em
+    threads auxiliares e o commit fica serializado por um `asyncio.Lock`. A espera
+    pelo proximo disparo e cancelavel e atende disparos manuais e o endpoint de status.
+    """
+    scheduler: Scheduler
+    completed: int = field(default=0, init=False)
+    failed: int = field(default=0, init=False)
+    _triggers: Optional[asyncio.Queue] = field(default=None, init=False, repr=False)
+    _slots: Optional[asyncio.Semaphore] = field(default=None, init=False, repr=False)
+    _git_lock: Optional[asyncio.Lock] = field(default=None, init=False, repr=False)
+    _tasks: Set[asyncio.Task] = field(default_factory=set, init=False, repr=False)
+    _running: Dict[int, str] = field(default_factory=dict, init=False, repr=False)
+    _ids: Iterator[int] = field(default_factory=itertools.count, init=False, repr=False)
+    _reserved: Set[str] = field(default_factory=set, init=False, repr=False)
+    _job_locks: Dict[str, asyncio.Lock] = field(default_factory=dict, init=False, repr=False)
+    _server: Optional[asyncio.AbstractServer] = field(default=None, init=False, repr=False)
+    _started_at: Optional[str] = field(default=None, init=False, repr=False)
+
+    @property
+    def status_address(self) -> Optional[Tuple[str, int]]:
+        """Endereco em que o endpoint de status esta ouvindo."""
+        if self._server is None or not self._server.sockets:
+            return None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+
+    async def start(self) -> None:
+        """Prepara filas, schedule compilado e o endpoint de status."""
+        settings = self.scheduler.settings
+        self._triggers = asyncio.Queue()
+        self._slots = asyncio.Semaphore(settings.runtime.max_concurrent_jobs)
+        self._git_lock = asyncio.Lock()
+        self._started_at = datetime.now().isoformat()
+        self.scheduler._schedule = self.scheduler._compile_schedule()
+        if settings.runtime.status_port is not None:
+            self._server = await asyncio.start_server(
+                self._handle_http, settings.runtime.status_host, settings.runtime.status_port
+            )
+            host, port = self.status_address
+            logger.info("📡 Status em http://%s:%s/status", host, port)
+
+    async def stop(self) -> None:
+        """Cancela jobs em andamento e fecha o endpoint."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        for task in list(self._tasks):
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def run_forever(self) -> None:
+        """Loop principal: espera o proximo disparo ou um disparo manual."""
+        logger.info("🕒 Iniciando loop de scheduler (asyncio)")
+        await self.start()
+        try:
+            for job, firing in await asyncio.to_thread(self.scheduler.interrupted_jobs):
+                self._spawn(job, firing)
+            while True:
+                await self._tick()
+        finally:
+            await self.stop()
+
+    def trigger(self, job: JobSettings) -> None:
+        """Enfileira um job para execucao imediata."""
+        self._triggers.put_nowait(job)
+
+    async def run_job(self, job: JobSettings, firing: Optional[str] = None) -> Optional[Problem]:
+        """Executa um job com retry; retorna o problema ou None em falha definitiva.
+
+        Os retries retomam do checkpoint do job (mesmo problema, so as etapas pendentes);
+        execucoes do mesmo job rodam uma por vez, pois compartilham o checkpoint.
+        """
+        scheduler = self.scheduler
+        metrics = get_metrics()
+        key = job_key(job.model_dump())
+        async with self._job_lock(key), self._slots:
+            token = next(self._ids)
+            self._running[token] = f"{job.difficulty or job.rating_range}@{job.time}"
+            try:
+                with log_context(job=job_id(key)), metrics.timer(JOB_SECONDS):
+                    await asyncio.to_thread(scheduler.begin_job, job, firing)
+                    for attempt in range(scheduler.settings.max_retries + 1):
+                        try:
+                            problem = await self._attempt(job, key, firing)
+                        except Exception as exc:  # noqa: BLE001
+                            if attempt >= scheduler.settings.max_retries:
+                                logger.error("🚨 Job falhou apos retries: %s", exc)
+                                await asyncio.to_thread(scheduler.record_failure, job, exc)
+                                self._release(key)
+                                await asyncio.to_thread(scheduler.abandon_job, key)
+                                metrics.inc(JOBS_TOTAL, status="failed")
+                                self.failed += 1
+                                return None
+                            wait_seconds = scheduler.settings.backoff_seconds * (2**attempt)
+                            logger.warning("⚠️ Tentativa %s falhou, retry em %ss", attempt + 1, wait_seconds)
+                            metrics.inc(RETRIES_TOTAL)
+                            await asyncio.sleep(wait_seconds)
+                            continue
+                        await asyncio.to_thread(scheduler.finish_job, key, problem)
+                        self.completed += 1
+                        metrics.inc(JOBS_TOTAL, status="ok")
+                        logger.info("✅ Job finalizado com sucesso")
+                        return problem
+            finally:
+                self._running.pop(token, None)
+                scheduler.flush_metrics()
+        return None
+
+    def status(self) -> dict:
+        """Resumo para o endpoint /status."""
+        upcoming = self.scheduler._schedule.peek() if self.scheduler._schedule else None
+        http = getattr(getattr(self.scheduler.provider, "cache", None), "http", None)
+        return {
+            "started_at": self._started_at,
+            "running": sorted(self._running.values()),
+            "completed": self.completed,
+            "failed": self.failed,
+            "pending_triggers": self._triggers.qsize() if self._triggers else 0,
+            "next_run": upcoming[1].isoformat() if upcoming else None,
+            "http": http.metrics.snapshot() if http is not None else None,
+        }
+
+    async def _tick(self) -> None:
+        """Uma rodada do loop: dispara jobs vencidos ou atende um disparo manual."""
+        scheduler = self.scheduler
+        settings = scheduler.settings
+        _, next_time = scheduler._schedule.peek()
+        timeout = min(max(0.0, next_time.timestamp() - time.time()), settings.scheduler.max_sleep_seconds)
+        if scheduler.settings_watcher is not None:
+            timeout = min(timeout, settings.scheduler.reload_interval_seconds)
+        try:
+            job = await asyncio.wait_for(self._triggers.get(), timeout)
+        except asyncio.TimeoutError:
+            job = None
+        if job is not None:
+            logger.info("🚀 Disparo manual recebido")
+            self._spawn(job)
+            return
+        if scheduler.reload_settings():
+            return
+        for firing in scheduler._schedule.pop_due(now_in_tz(settings.timezone)):
+            self._spawn(firing.job, firing.fire_at.isoformat())
+
+    def _spawn(self, job: JobSettings, firing: Optional[str] = None) -> None:
+        """Cria a task do job e guarda a referencia ate terminar."""
+        task = asyncio.create_task(self.run_job(job, firing))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    def _release(self, key: str) -> None:
+        """Devolve aos candidatos o problema reservado por um job que sera abandonado."""
+        checkpoint = self.scheduler.state_store.get_checkpoint(key)
+        if checkpoint is not None:
+            self._reserved.discard(Problem.from_dict(checkpoint["problem"]).problem_id)
+
+    def _job_lock(self, key: str) -> asyncio.Lock:
+        """Lock por chave de job (limitado aos jobs distintos do schedule)."""
+        return self._job_locks.setdefault(key, asyncio.Lock())
+
+    async def _attempt(self, job: JobSettings, key: str, firing: Optional[str]) -> Problem:
+        """Executa as etapas pendentes do checkpoint: select, solve, write, test, commit e push."""
+        scheduler = self.scheduler
+        self._reserved.update(await asyncio.to_thread(lambda: set(scheduler.state_store.used_ids())))
+        checkpoint = await asyncio.to_thread(
+            scheduler.select_stage, job, key, self._reserved, self._reserved, firing
+        )
+        problem = Problem.from_dict(checkpoint["problem"])
+        with log_context(problem_id=problem.problem_id):
+            if stage_pending(checkpoint, "written"):
+                checkpoint = await asyncio.to_thread(scheduler.generate_stage, job, key, checkpoint)
+            challenge_dir = Path(checkpoint["challenge_dir"])
+            if stage_pending(checkpoint, "tested"):
+                with track_stage("test"):
+                    logger.info("🧪 Rodando testes pytest")
+                    scheduler.check_tests(await scheduler.test_runner.arun(challenge_dir))
+                    await asyncio.to_thread(scheduler.run_benchmark, challenge_dir)
+                checkpoint = await asyncio.to_thread(scheduler.advance, key, checkpoint, "tested")
+            if stage_pending(checkpoint, "committed"):
+                with track_stage("commit"):
+                    await self._commit(job, problem, checkpoint)
+                checkpoint = await asyncio.to_thread(scheduler.advance, key, checkpoint, "committed")
+            if stage_pending(checkpoint, "pushed"):
+                with track_stage("push"):
+                    await self._push()
+                await asyncio.to_thread(scheduler.advance, key, checkpoint, "pushed")
+        return problem
+
+    async def _commit(self, job: JobSettings, problem: Problem, checkpoint: dict) -> None:
+        """Atualiza o indice e commita; um commit por vez."""
+        scheduler = self.scheduler
+        challenge_dir = Path(checkpoint["challenge_dir"])
+        async with self._git_lock:
+            if not await asyncio.to_thread(scheduler.needs_commit, checkpoint):
+                return
+            await asyncio.to_thread(scheduler.writer.update_index, [(problem, challenge_dir)])
+            await scheduler.git_client.acommit_paths(
+                [challenge_dir, *scheduler.writer.index_paths],
+                scheduler.commit_message(job, problem),
+            )
+
+    async def _push(self) -> None:
+        """Push direto (assincrono) ou via fila em background."""
+        scheduler = self.scheduler
+        if scheduler.push_queue is not None:
+            scheduler.push_queue.enqueue()
+            return
+        async with self._git_lock:
+            await scheduler.git_client.apush()
+
+    def _find_job(self, day: Optional[str], time_str: Optional[str]) -> JobSettings:
+        """Localiza um job do schedule por dia e horario (opcional)."""
+        jobs = self.scheduler.settings.schedule.get((day or "").lower(), [])
+        for job in jobs:
+            if time_str is None or job.time == time_str:
+                return job
+        raise LookupError(f"job nao encontrado: {day} {time_str or ''}".strip())
+
+    async def _handle_http(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """HTTP minimo: GET /status, GET /metrics e POST /trigger?day=monday&time=09:00."""
+        try:
+            request_line = (await reader.readline()).decode("latin-1").split()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+            method, target = (request_line + ["", ""])[:2]
+            url = urlsplit(target)
+            query = {key: values[0] for key, values in parse_qs(url.query).items()}
+            content_type = "application/json"
+            if method == "GET" and url.path == "/status":
+                code, body = 200, self.status()
+            elif method == "GET" and url.path == "/metrics":
+                code, body = 200, get_metrics().render_prometheus()
+                content_type = "text/plain; version=0.0.4; charset=utf-8"
+            elif method == "POST" and url.path == "/trigger":
+                try:
+                    self.trigger(self._find_job(query.get("day"), query.get("time")))
+                    code, body = 202, {"queued": True}
+                except LookupError as exc:
+                    code, body = 404, {"error": str(exc)}
+            else:
+                code, body = 404, {"error": "not found"}
+            payload = (body if isinstance(body, str) else json.dumps(body)).encode("utf-8")
+            reason = {200: "OK", 202: "Accepted", 404: "Not Found"}[code]
+            writer.write(
+                f"HTTP/1.1 {code} {reason}\r\nContent-Type: {content_type}\r\n"
+                f"Content-Length: {len(payload)}\r\nConnection: close\r\n\r\n".encode("latin-1") + payload
+            )
+            await writer.drain()
+        finally:
+            writer.close()
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import signal
+import subprocess
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - Windows
+    resource = None
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger("executor")
+
+
+PERF_FILE = "perf.jsonl"
+SAMPLES_DIR = "samples"
+
+# Aplica os rlimits no proprio filho (preexec_fn nao e seguro com threads).
+_LIMITED_BOOTSTRAP = (
+    "import resource, runpy, sys\n"
+    "cpu, memory = int(sys.argv[1]), int(sys.argv[2])\n"
+    "resource.setrlimit(resource.RLIMIT_CPU, (cpu, cpu + 1))\n"
+    "resource.setrlimit(resource.RLIMIT_AS, (memory, memory))\n"
+    "sys.argv = sys.argv[3:]\n"
+    "runpy.run_path(sys.argv[0], run_name='__main__')\n"
+)
+
+# Sinais enviados pelo kernel ao estourar RLIMIT_CPU (soft e hard).
+_CPU_LIMIT_SIGNALS = {getattr(signal, name) for name in ("SIGXCPU", "SIGKILL") if hasattr(signal, name)}
+
+
+@dataclass
+class CaseResult:
+    """Medicoes de um caso de exemplo."""
+    name: str
+    status: str
+    exit_code: Optional[int]
+    wall_seconds: float
+    cpu_seconds: Optional[float]
+    peak_rss_kb: Optional[int]
+    output_matches: Optional[bool] = None
+
+
+@dataclass
+class ExecutionReport:
+    """Resultado da execucao de todos os casos de um desafio."""
+    challenge_dir: str
+    time_limit_seconds: float
+    memory_limit_mb: int
+    cases: List[CaseResult] = field(default_factory=list)
+
+    @property
+    def exceeded(self) -> List[CaseResult]:
+        """Casos que estouraram tempo ou memoria."""
+        return [case for case in self.cases if case.status in ("tle", "mle")]
+
+
+@dataclass
+class SolutionExecutor:
+    """Roda solution.py em processo filho com rlimits de CPU/memoria e mede cada caso."""
+    time_limit_seconds: float = 2.0
+    memory_limit_mb: int = 256
+    wall_factor: float = 3.0
+
+    def benchmark(self, challenge_dir: Path) -> ExecutionReport:
+        """Executa todos os exemplos de `samples/` e grava o historico em perf.jsonl."""
+        report = ExecutionReport(
+            challenge_dir=str(challenge_dir),
+            time_limit_seconds=self.time_limit_seconds,
+            memory_limit_mb=self.memory_limit_mb,
+        )
+        samples = load_samples(challenge_dir)
+        if not samples:
+            logger.info("⏭️ Sem exemplos em samples/, pulando benchmark")
+            return report
+        solution_path = challenge_dir / "solution.py"
+        if not solution_path.exists():
+            logger.info("⏭️ Benchmark so mede solution.py, pulando")
+            return report
+        for name, input_text, expected in samples:
+            report.cases.append(self.run_case(solution_path, name, input_text, expected))
+        self._append_perf(challenge_dir, report)
+        return report
+
+    def run_case(
+        self,
+        solution_path: Path,
+        name: str,
+        input_text: str,
+        expected: Optional[str] = None,
+    ) -> CaseResult:
+        """Roda um caso e coleta tempo de parede, CPU e pico de RSS."""
+        wall_limit = self.time_limit_seconds * self.wall_factor + 1.0
+        start = time.perf_counter()
+        proc = subprocess.Popen(
+            self._command(solution_path),
+            cwd=solution_path.parent,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+        )
+        streams: dict = {}
+        pumps = [
+            threading.Thread(target=_feed, args=(proc.stdin, input_text.encode("utf-8"))),
+            threading.Thread(target=_drain, args=(proc.stdout, streams, "stdout")),
+            threading.Thread(target=_drain, args=(proc.stderr, streams, "stderr")),
+        ]
+        for pump in pumps:
+            pump.start()
+        killer = threading.Timer(wall_limit, proc.kill)
+        killer.start()
+        try:
+            exit_code, cpu_seconds, peak_rss_kb = _wait(proc)
+        finally:
+            killer.cancel()
+            for pump in pumps:
+                pump.join()
+        wall_seconds = time.perf_counter() - start
+        stderr = streams.get("stderr", b"").decode("utf-8", "replace")
+        status = self._classify(exit_code, wall_seconds, wall_limit, cpu_seconds, peak_rss_kb, stderr)
+        output_matches = None
+        if expected is not None:
+            actual = streams.get("stdout", b"").decode("utf-8", "replace")
+            output_matches = actual.split() == expected.split()
+        return CaseResult(
+            name=name,
+            status=status,
+            exit_code=exit_code,
+            wall_seconds=round(wall_seconds, 4),
+            cpu_seconds=round(cpu_seconds, 4) if cpu_seconds is not None else None,
+            peak_rss_kb=peak_rss_kb,
+            output_matches=output_matches,
+        )
+
+    def _command(self, solution_path: Path) -> List[str]:
+        """Linha de comando do filho; com `resource`, limita CPU e espaco de enderecamento."""
+        if resource is None:
+            return [sys.executable, solution_path.name]
+        cpu = str(math.ceil(self.time_limit_seconds))
+        memory = str(self.memory_limit_mb * 1024 * 1024)
+        return [sys.executable, "-c", _LIMITED_BOOTSTRAP, cpu, memory, solution_path.name]
+
+    def _classify(
+        self,
+        exit_code: Optional[int],
+        wall_seconds: float,
+        wall_limit: float,
+        cpu_seconds: Optional[float],
+        peak_rss_kb: Optional[int],
+        stderr: str,
+    ) -> str:
+        """Traduz o resultado do processo em ok/tle/mle/re."""
+        if wall_seconds >= wall_limit or (cpu_seconds is not None and cpu_seconds > self.time_limit_seconds):
+            return "tle"
+        if exit_code is not None and -exit_code in _CPU_LIMIT_SIGNALS:
+            return "tle"
+        if "MemoryError" in stderr or (
+            peak_rss_kb is not None and peak_rss_kb > self.memory_limit_mb * 1024
+        ):
+            return "mle"
+        if exit_code != 0:
+            return "re"
+        return "ok"
+
+    def _append_perf(self, challenge_dir: Path, report: ExecutionReport) -> None:
+        """Acrescenta a execucao em perf.jsonl para acompanhar a evolucao."""
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "time_limit_seconds": report.time_limit_seconds,
+            "memory_limit_mb": report.memory_limit_mb,
+            "cases": [asdict(case) for case in report.cases],
+        }
+        with (challenge_dir / PERF_FILE).open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
+
+
+def load_samples(challenge_dir: Path) -> List[Tuple[str, str, Optional[str]]]:
+    """Le pares samples/NN.in e samples/NN.out (saida opcional)."""
+    samples_dir = challenge_dir / SAMPLES_DIR
+    if not samples_dir.is_dir():
+        return []
+    samples = []
+    for input_path in sorted(samples_dir.glob("*.in")):
+        output_path = input_path.with_suffix(".out")
+        expected = output_path.read_text(encoding="utf-8") if output_path.exists() else None
+        samples.append((input_path.stem, input_path.read_text(encoding="utf-8"), expected))
+    return samples
+
+
+def _wait(proc: subprocess.Popen) -> Tuple[Optional[int], Optional[float], Optional[int]]:
+    """Aguarda o filho coletando rusage (os.wait4) quando disponivel."""
+    if not hasattr(os, "wait4"):
+        return proc.wait(), None, None
+    _, status, usage = os.wait4(proc.pid, 0)
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return proc.returncode, usage.ru_utime + usage.ru_stime, usage.ru_maxrss
+
+
+def _feed(stream, data: bytes) -> None:
+    """Escreve stdin do filho ignorando pipe fechado."""
+    try:
+        stream.write(data)
+    except (BrokenPipeError, OSError):
+        pass
+    finally:
+        try:
+            stream.close()
+        except OSError:
+            pass
+
+
+def _drain(stream, sink: dict, key: str) -> None:
+    """Le todo o stream do filho."""
+    sink[key] = stream.read()
+    stream.close()
@@ -1,12 +1,14 @@
 from __future__ import annotations
 
-import os
+import asyncio
+import stat
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence
 
 from src.utils.logger import get_logger
+from src.utils.metrics import GIT_SECONDS, get_metrics
 
 
 logger = get_logger("git")
@@ -14,38 +16,163 @@ logger = get_logger("git")
 
 @dataclass
 class GitClient:
-    """Wrapper simples para git CLI com tratamento de erro."""
+    """Wrapper simples para git CLI com tratamento de erro.
+
+    No modo "plumbing" o stage considera somente os caminhos informados
+    (hash-object/update-index) e o commit e montado com write-tree/commit-tree,
+    sem varrer a working tree inteira.
+    """
     repo_path: Path
     remote: Optional[str]
     branch: str
+    mode: str = "porcelain"
 
-    def _run(self, args: list[str]) -> None:
+    def _run(self, args: list[str], input_text: Optional[str] = None) -> str:
         """Executa um comando git dentro do repo."""
-        logger.info(f"🔧 Executando git: {' '.join(args)}")
+        logger.info("🔧 Executando git: %s", ' '.join(args[:3]))
         result = subprocess.run(
             args,
             cwd=self.repo_path,
+            input=input_text,
             capture_output=True,
             text=True,
             check=False,
-            env=os.environ.copy(),
         )
         if result.returncode != 0:
             raise RuntimeError(
                 f"git failed: {result.stdout}\n{result.stderr}"
             )
+        return result.stdout
 
     def add_all(self) -> None:
         """Stage de todos os arquivos."""
         self._run(["git", "add", "."])
 
+    def add_paths(self, paths: Sequence[Path]) -> None:
+        """Stage somente dos caminhos informados."""
+        if self.mode == "plumbing":
+            self._stage_plumbing(paths)
+            return
+        self._run(["git", "add", "--", *(str(path) for path in paths)])
+
+    def has_changes(self, paths: Sequence[Path]) -> bool:
+        """Checa se ha alteracoes (staged ou nao) dentro de `paths`."""
+        output = self._run(["git", "status", "--porcelain", "--", *(self._relative(path) for path in paths)])
+        return bool(output.strip())
+
     def commit(self, message: str) -> None:
         """Cria commit local."""
-        self._run(["git", "commit", "-m", message])
+        with get_metrics().timer(GIT_SECONDS, op="commit"):
+            if self.mode == "plumbing":
+                self._commit_plumbing(message)
+                return
+            self._run(["git", "commit", "-m", message])
 
     def push(self) -> None:
         """Faz push para o remoto configurado."""
         if not self.remote:
             logger.warning("⚠️ git_remote nao definido, pulando push")
             return
-        self._run(["git", "push", self.remote, self.branch])
+        with get_metrics().timer(GIT_SECONDS, op="push"):
+            self._run(["git", "push", self.remote, self.branch])
+
+    async def acommit_paths(self, paths: Sequence[Path], message: str) -> None:
+        """Stage de `paths` + commit sem bloquear o event loop."""
+        if self.mode == "plumbing":
+            # Sequencia curta de comandos encadeados; roda em thread.
+            await asyncio.to_thread(self.add_paths, paths)
+            await asyncio.to_thread(self.commit, message)
+            return
+        await self._arun(["git", "add", "--", *(str(path) for path in paths)])
+        with get_metrics().timer(GIT_SECONDS, op="commit"):
+            await self._arun(["git", "commit", "-m", message])
+
+    async def apush(self) -> None:
+        """Versao assincrona do push."""
+        if not self.remote:
+            logger.warning("⚠️ git_remote nao definido, pulando push")
+            return
+        with get_metrics().timer(GIT_SECONDS, op="push"):
+            await self._arun(["git", "push", self.remote, self.branch])
+
+    async def _arun(self, args: list[str]) -> str:
+        """Executa um comando git com asyncio; cancelar a task mata o processo."""
+        logger.info("🔧 Executando git: %s", ' '.join(args[:3]))
+        proc = await asyncio.create_subprocess_exec(
+            *args,
+            cwd=self.repo_path,
+            stdin=asyncio.subprocess.DEVNULL,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+        )
+        try:
+            stdout, stderr = await proc.communicate()
+        except asyncio.CancelledError:
+            proc.kill()
+            await proc.wait()
+            raise
+        if proc.returncode != 0:
+            raise RuntimeError(
+                f"git failed: {stdout.decode('utf-8', 'replace')}\n{stderr.decode('utf-8', 'replace')}"
+            )
+        return stdout.decode("utf-8", "replace")
+
+    def _stage_plumbing(self, paths: Sequence[Path]) -> None:
+        """Grava blobs e atualiza o index apenas para arquivos novos/alterados/removidos em `paths`."""
+        pathspecs = [self._relative(path) for path in paths]
+        listed = self._run(
+            ["git", "ls-files", "-z", "--others", "--modified", "--exclude-standard", "--", *pathspecs]
+        )
+        removed = self._run(["git", "ls-files", "-z", "--deleted", "--", *pathspecs])
+        deleted = {name for name in removed.split("\0") if name}
+        if deleted:
+            self._run(
+                ["git", "update-index", "-z", "--remove", "--stdin"],
+                input_text="\0".join(sorted(deleted)) + "\0",
+            )
+        files = sorted({name for name in listed.split("\0") if name} - deleted)
+        if not files:
+            return
+        blobs = self._run(
+            ["git", "hash-object", "-w", "--stdin-paths"],
+            input_text="\n".join(files) + "\n",
+        ).split()
+        entries = [
+            f"{_file_mode(self.repo_path / name)} {blob}\t{name}" for name, blob in zip(files, blobs)
+        ]
+        self._run(["git", "update-index", "--add", "--index-info"], input_text="\n".join(entries) + "\n")
+
+    def _commit_plumbing(self, message: str) -> None:
+        """write-tree + commit-tree + update-ref, equivalente a `git commit`."""
+        tree = self._run(["git", "write-tree"]).strip()
+        parents = self._head()
+        if parents and self._run(["git", "rev-parse", f"{parents[0]}^{{tree}}"]).strip() == tree:
+            raise RuntimeError("git failed: nada para commitar")
+        args = ["git", "commit-tree", tree]
+        for parent in parents:
+            args += ["-p", parent]
+        commit = self._run([*args, "-m", message]).strip()
+        self._run(["git", "update-ref", "-m", f"commit: {message}", "HEAD", commit, *parents[:1]])
+
+    def _head(self) -> List[str]:
+        """Commit atual de HEAD (lista vazia em repo sem commits)."""
+        result = subprocess.run(
+            ["git", "rev-parse", "--verify", "-q", "HEAD"],
+            cwd=self.repo_path,
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        return [result.stdout.strip()] if result.returncode == 0 else []
+
+    def _relative(self, path: Path) -> str:
+        """Caminho relativo ao repo no formato do git."""
+        path = Path(path)
+        if path.is_absolute():
+            path = path.relative_to(self.repo_path)
+        return path.as_posix()
+
+
+def _file_mode(path: Path) -> str:
+    """Modo git do arquivo (executavel ou normal)."""
+    return "100755" if path.stat().st_mode & stat.S_IXUSR else "100644"
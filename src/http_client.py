@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.utils.logger import get_logger
+from src.utils.metrics import HTTP_SECONDS, HTTP_TOTAL, get_metrics
+
+
+logger = get_logger("http")
+
+
+class CircuitOpenError(requests.RequestException):
+    """Circuito aberto: a chamada falha sem tocar a rede."""
+
+
+@dataclass
+class TokenBucket:
+    """Rate limiter token bucket (thread-safe); `acquire` bloqueia ate haver token."""
+    rate_per_second: float
+    capacity: float = 1.0
+    _tokens: float = field(default=0.0, init=False, repr=False)
+    _updated: float = field(default_factory=time.monotonic, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._tokens = self.capacity
+
+    def acquire(self) -> float:
+        """Consome um token; retorna quanto tempo esperou."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate_per_second)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return waited
+                wait_seconds = (1.0 - self._tokens) / self.rate_per_second
+            time.sleep(wait_seconds)
+            waited += wait_seconds
+
+
+@dataclass
+class CircuitBreaker:
+    """Abre apos `failure_threshold` falhas seguidas; libera uma tentativa apos `reset_seconds`."""
+    failure_threshold: int = 5
+    reset_seconds: float = 60.0
+    state: str = field(default="closed", init=False)
+    _failures: int = field(default=0, init=False, repr=False)
+    _opened_at: float = field(default=0.0, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def before_call(self) -> None:
+        """Levanta CircuitOpenError enquanto o circuito estiver aberto."""
+        with self._lock:
+            if self.state != "open":
+                return
+            remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+            if remaining > 0:
+                raise CircuitOpenError(f"circuito aberto, nova tentativa em {remaining:.0f}s")
+            self.state = "half_open"
+
+    def record_success(self) -> None:
+        """Fecha o circuito."""
+        with self._lock:
+            self._failures = 0
+            self.state = "closed"
+
+    def record_failure(self) -> None:
+        """Conta a falha; abre ao atingir o limite (ou se a tentativa de teste falhar)."""
+        with self._lock:
+            self._failures += 1
+            if self.state == "half_open" or self._failures >= self.failure_threshold:
+                if self.state != "open":
+                    logger.warning("🔌 Circuito aberto apos %s falhas", self._failures)
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+@dataclass
+class HttpMetrics:
+    """Contadores de requisicoes, bytes e latencia."""
+    requests: int = 0
+    errors: int = 0
+    rejected: int = 0
+    bytes_received: int = 0
+    wire_bytes: int = 0
+    latency_total_seconds: float = 0.0
+    latency_max_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+    status_counts: Dict[int, int] = field(default_factory=dict)
+
+    def snapshot(self) -> dict:
+        """Copia serializavel, com latencia media."""
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "rejected": self.rejected,
+            "bytes_received": self.bytes_received,
+            "wire_bytes": self.wire_bytes,
+            "latency_avg_seconds": self.latency_total_seconds / self.requests if self.requests else 0.0,
+            "latency_max_seconds": self.latency_max_seconds,
+            "throttled_seconds": self.throttled_seconds,
+            "status_counts": dict(self.status_counts),
+        }
+
+
+@dataclass
+class HttpClient:
+    """Session compartilhada com pool de conexoes, gzip, rate limit e circuit breaker."""
+    timeout: float = 30.0
+    rate_per_second: float = 0.5
+    burst: int = 1
+    failure_threshold: int = 5
+    reset_seconds: float = 60.0
+    pool_size: int = 4
+    metrics: HttpMetrics = field(default_factory=HttpMetrics, init=False)
+    _session: Optional[requests.Session] = field(default=None, init=False, repr=False)
+    _bucket: TokenBucket = field(init=False, repr=False)
+    _breaker: CircuitBreaker = field(init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._bucket = TokenBucket(rate_per_second=self.rate_per_second, capacity=self.burst)
+        self._breaker = CircuitBreaker(failure_threshold=self.failure_threshold, reset_seconds=self.reset_seconds)
+
+    @property
+    def breaker(self) -> CircuitBreaker:
+        """Circuit breaker da API."""
+        return self._breaker
+
+    def get(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        stream: bool = False,
+    ) -> requests.Response:
+        """GET com rate limit; 5xx, 429 e erros de rede contam para o circuit breaker.
+
+        Com `stream=True` o corpo nao e lido aqui: use `iter_bytes` para consumi-lo.
+        """
+        try:
+            self._breaker.before_call()
+        except CircuitOpenError:
+            with self._lock:
+                self.metrics.rejected += 1
+            raise
+        waited = self._bucket.acquire()
+        with self._lock:
+            self.metrics.throttled_seconds += waited
+        start = time.perf_counter()
+        try:
+            resp = self._get_session().get(url, headers=headers, timeout=timeout or self.timeout, stream=stream)
+        except requests.RequestException:
+            self._record(time.perf_counter() - start, None)
+            self._breaker.record_failure()
+            raise
+        self._record(time.perf_counter() - start, resp, count_body=not stream)
+        if resp.status_code >= 500 or resp.status_code == 429:
+            self._breaker.record_failure()
+        else:
+            self._breaker.record_success()
+        return resp
+
+    def iter_bytes(self, resp: requests.Response, chunk_size: int = 1 << 16) -> Iterator[bytes]:
+        """Itera o corpo (ja descomprimido) de uma resposta em stream, contando os bytes."""
+        for chunk in resp.iter_content(chunk_size):
+            with self._lock:
+                self.metrics.bytes_received += len(chunk)
+            yield chunk
+
+    def close(self) -> None:
+        """Fecha as conexoes do pool."""
+        with self._lock:
+            if self._session is not None:
+                self._session.close()
+                self._session = None
+
+    def _get_session(self) -> requests.Session:
+        """Cria a Session sob demanda (keep-alive e gzip)."""
+        with self._lock:
+            if self._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=self.pool_size, pool_maxsize=self.pool_size)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip", "User-Agent": "AutoFeedr-V2"})
+                self._session = session
+            return self._session
+
+    def _record(self, elapsed: float, resp: Optional[requests.Response], count_body: bool = True) -> None:
+        """Atualiza as metricas de uma requisicao."""
+        registry = get_metrics()
+        registry.observe(HTTP_SECONDS, elapsed)
+        registry.inc(HTTP_TOTAL, status=str(resp.status_code) if resp is not None else "error")
+        with self._lock:
+            metrics = self.metrics
+            metrics.requests += 1
+            metrics.latency_total_seconds += elapsed
+            metrics.latency_max_seconds = max(metrics.latency_max_seconds, elapsed)
+            if resp is None:
+                metrics.errors += 1
+                return
+            metrics.status_counts[resp.status_code] = metrics.status_counts.get(resp.status_code, 0) + 1
+            if resp.status_code >= 400:
+                metrics.errors += 1
+            size = len(resp.content) if count_body else 0
+            metrics.bytes_received += size
+            metrics.wire_bytes += int(resp.headers.get("Content-Length") or size)
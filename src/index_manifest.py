@@ -0,0 +1,123 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+from src.utils.fs import atomic_write_text
+from src.utils.logger import get_logger
+
+
+logger = get_logger("index")
+
+
+INDEX_HEADER = "# Desafios\n\nEste arquivo lista os desafios gerados por data.\n"
+
+_README_FIELDS = {
+    "- Rating:": "rating",
+    "- Tags:": "tags",
+}
+_FOLDER_PATTERN = re.compile(r"^(?P<source>[a-z0-9]+)_(?P<contest_id>[A-Za-z0-9-]+)_(?P<index>[A-Za-z0-9]+)_(?P<slug>.+)$")
+
+
+@dataclass
+class IndexManifest:
+    """Manifesto (problem_id -> entrada) usado para gerar o INDEX.md sem varrer o disco."""
+    path: Path
+    entries: Dict[str, dict] = field(default_factory=dict)
+
+    def load(self) -> bool:
+        """Carrega o manifesto; retorna False se ainda nao existir."""
+        if not self.path.exists():
+            return False
+        with self.path.open("r", encoding="utf-8") as handle:
+            self.entries = json.load(handle)
+        return True
+
+    def upsert(self, entry: dict) -> bool:
+        """Insere/atualiza uma entrada; retorna False se nada mudou (retry idempotente)."""
+        if self.entries.get(entry["problem_id"]) == entry:
+            return False
+        self.entries[entry["problem_id"]] = entry
+        return True
+
+    def save(self, fsync: str = "none") -> None:
+        """Grava o manifesto de forma atomica."""
+        atomic_write_text(self.path, json.dumps(self.entries, indent=1, ensure_ascii=False) + "\n", fsync=fsync)
+
+    def render(self) -> str:
+        """Monta o INDEX.md agrupado por mes, com rating e tags."""
+        months: Dict[str, list] = {}
+        for entry in self.entries.values():
+            months.setdefault(entry["month"], []).append(entry)
+        parts = [INDEX_HEADER]
+        for month in sorted(months):
+            parts.append(f"\n## {month}\n\n| Desafio | Rating | Tags |\n| --- | --- | --- |\n")
+            for entry in months[month]:
+                name = _escape(entry["name"])
+                tags = _escape(", ".join(entry.get("tags") or [])) or "N/A"
+                parts.append(f"| [{name}]({entry['path']}) | {entry.get('rating') or 'N/A'} | {tags} |\n")
+        return "".join(parts)
+
+    def write_index(self, index_path: Path, fsync: str = "none") -> None:
+        """Regenera o INDEX.md a partir do manifesto (tmp + replace)."""
+        atomic_write_text(index_path, self.render(), fsync=fsync)
+
+    def rebuild_from_disk(self, repo_path: Path) -> int:
+        """Reconstroi as entradas lendo challenges/ em uma unica passada."""
+        self.entries = {}
+        for entry in scan_challenges(repo_path):
+            self.entries[entry["problem_id"]] = entry
+        return len(self.entries)
+
+
+def scan_challenges(repo_path: Path) -> Iterator[dict]:
+    """Percorre challenges/<mes>/<pasta> com os.scandir, lendo so o cabecalho do README."""
+    root = repo_path / "challenges"
+    if not root.is_dir():
+        return
+    with os.scandir(root) as months:
+        for month in sorted(months, key=lambda item: item.name):
+            if not month.is_dir():
+                continue
+            with os.scandir(month.path) as folders:
+                for folder in sorted(folders, key=lambda item: item.name):
+                    match = _FOLDER_PATTERN.match(folder.name)
+                    if not folder.is_dir() or match is None:
+                        continue
+                    yield _entry_from_folder(repo_path, Path(folder.path), month.name, match)
+
+
+def _entry_from_folder(repo_path: Path, folder: Path, month: str, match: re.Match) -> dict:
+    """Extrai nome/rating/tags do README.md gerado pelo TemplateSolver."""
+    meta: Dict[str, Optional[str]] = {}
+    readme = folder / "README.md"
+    if readme.exists():
+        with readme.open("r", encoding="utf-8") as handle:
+            for line in handle:
+                line = line.strip()
+                if line.startswith("# ") and "name" not in meta:
+                    meta["name"] = line[2:]
+                for prefix, key in _README_FIELDS.items():
+                    if line.startswith(prefix):
+                        meta[key] = line[len(prefix):].strip()
+                if line.startswith("## Resumo"):
+                    break
+    rating = meta.get("rating")
+    tags = meta.get("tags")
+    return {
+        "problem_id": f"{match['source']}:{match['contest_id']}:{match['index']}",
+        "name": meta.get("name") or match["slug"],
+        "month": month,
+        "path": folder.relative_to(repo_path).as_posix(),
+        "rating": int(rating) if rating and rating.isdigit() else None,
+        "tags": [tag.strip() for tag in tags.split(",")] if tags and tags != "N/A" else [],
+    }
+
+
+def _escape(text: str) -> str:
+    """Escapa caracteres que quebram a tabela markdown."""
+    return text.replace("|", "\\|")
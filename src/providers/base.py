@@ -1,29 +1,64 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Optional, Protocol, Tuple
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Collection, Dict, Iterable, List, Optional, Protocol, Tuple
 
 
-@dataclass
+# Sequencias de caracteres nao alfanumericos viram um unico "-"; \x00 separa nomes em lote.
+_SLUG_SEPARATORS = re.compile(r"(?:[^\w\x00]|_)+")
+
+# Slugs calculados em lote na indexacao do catalogo, reaproveitados por slugify.
+SLUG_CACHE_MAX = 50_000
+_slug_cache: Dict[str, str] = {}
+
+# Campos derivados de Problem que nao entram no construtor.
+_DERIVED_FIELDS = ("problem_id", "slug")
+
+
+def slugify(name: str) -> str:
+    """Slug minusculo com hifens (sem hifens repetidos ou nas pontas)."""
+    slug = _slug_cache.get(name)
+    if slug is None:
+        slug = _SLUG_SEPARATORS.sub("-", name.replace("\x00", "").lower()).strip("-")
+    return slug
+
+
+def slugify_many(names: Iterable[str]) -> List[str]:
+    """Slugs de varios nomes com uma unica passada de regex sobre o texto unido."""
+    names = [name.replace("\x00", "") for name in names]
+    joined = "\x00".join(names).lower()
+    slugs = [slug.strip("-") for slug in _SLUG_SEPARATORS.sub("-", joined).split("\x00")]
+    if len(_slug_cache) + len(names) > SLUG_CACHE_MAX:
+        _slug_cache.clear()
+    _slug_cache.update(zip(names, slugs))
+    return slugs
+
+
+@dataclass(frozen=True, slots=True)
 class Problem:
+    """Problema imutavel; problem_id e slug sao derivados na criacao (nao entram no construtor)."""
     source: str
     contest_id: int
     index: str
     name: str
     rating: Optional[int]
-    tags: List[str]
+    tags: Tuple[str, ...]
     url: str
+    problem_id: str = field(init=False, compare=False, repr=False)
+    slug: str = field(init=False, compare=False, repr=False)
 
-    @property
-    def problem_id(self) -> str:
-        return f"{self.source}:{self.contest_id}:{self.index}"
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "tags", tuple(sys.intern(tag) for tag in self.tags))
+        object.__setattr__(self, "problem_id", f"{self.source}:{self.contest_id}:{self.index}")
+        slug = slugify(self.name) or f"{self.contest_id}{self.index}".lower()
+        object.__setattr__(self, "slug", slug)
 
-    @property
-    def slug(self) -> str:
-        safe = "".join(ch.lower() if ch.isalnum() else "-" for ch in self.name).strip("-")
-        while "--" in safe:
-            safe = safe.replace("--", "-")
-        return safe or f"{self.contest_id}{self.index}".lower()
+    @classmethod
+    def from_dict(cls, payload: dict) -> "Problem":
+        """Reconstroi a partir de asdict() (checkpoints), descartando os campos derivados."""
+        return cls(**{key: value for key, value in payload.items() if key not in _DERIVED_FIELDS})
 
 
 class ProblemProvider(Protocol):
@@ -34,6 +69,6 @@ class ProblemProvider(Protocol):
         difficulty: Optional[str],
         rating_range: Optional[Tuple[int, int]],
         tags: Optional[List[str]],
-        used_ids: List[str],
+        used_ids: Collection[str],
     ) -> Problem:
         ...
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+import requests
+
+from src.http_client import HttpClient
+from src.providers.problemset import ProblemRecord, parse_problemset
+from src.utils.fs import atomic_write_text
+from src.utils.logger import get_logger
+from src.utils.metrics import CACHE_TOTAL, get_metrics
+
+
+logger = get_logger("cache")
+
+
+@dataclass
+class ProblemsetSnapshot:
+    """Ultima copia valida do problemset e seus metadados HTTP."""
+    problems: List[ProblemRecord]
+    version: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+@dataclass
+class ProblemsetCache:
+    """Cache em disco do problemset com TTL e revalidacao condicional."""
+    path: Path
+    url: str
+    ttl_seconds: int = 3600
+    timeout: float = 30
+    http: Optional[HttpClient] = None
+    _snapshot: Optional[ProblemsetSnapshot] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def get(self) -> ProblemsetSnapshot:
+        """Retorna o snapshot atual, revalidando somente quando o TTL expira."""
+        with self._lock:
+            return self._get_locked()
+
+    def _get_locked(self) -> ProblemsetSnapshot:
+        """Implementacao de get(); chamadas concorrentes fazem um unico download."""
+        snapshot = self._snapshot or self._read_disk()
+        if snapshot is not None and not self._is_stale(snapshot):
+            self._snapshot = snapshot
+            get_metrics().inc(CACHE_TOTAL, cache="problemset", result="hit")
+            return snapshot
+        try:
+            refreshed = self._refresh(snapshot)
+        except (requests.RequestException, RuntimeError, ValueError) as exc:
+            if snapshot is None:
+                raise
+            logger.warning("⚠️ Falha ao revalidar problemset (%s), usando snapshot em cache", exc)
+            get_metrics().inc(CACHE_TOTAL, cache="problemset", result="stale")
+        else:
+            result = "revalidated" if refreshed is snapshot else "miss"
+            get_metrics().inc(CACHE_TOTAL, cache="problemset", result=result)
+            snapshot = refreshed
+        self._snapshot = snapshot
+        return snapshot
+
+    def invalidate(self) -> None:
+        """Forca revalidacao na proxima leitura."""
+        if self._snapshot is not None:
+            self._snapshot.fetched_at = 0.0
+
+    def _is_stale(self, snapshot: ProblemsetSnapshot) -> bool:
+        """Checa se o snapshot passou do TTL."""
+        return time.time() - snapshot.fetched_at >= self.ttl_seconds
+
+    def _refresh(self, snapshot: Optional[ProblemsetSnapshot]) -> ProblemsetSnapshot:
+        """Baixa o problemset, usando If-None-Match/If-Modified-Since se possivel."""
+        headers = {}
+        if snapshot is not None:
+            if snapshot.etag:
+                headers["If-None-Match"] = snapshot.etag
+            if snapshot.last_modified:
+                headers["If-Modified-Since"] = snapshot.last_modified
+        logger.info("🧠 Buscando problemas no Codeforces")
+        if self.http is None:
+            self.http = HttpClient(timeout=self.timeout)
+        resp = self.http.get(self.url, headers=headers, timeout=self.timeout, stream=True)
+        try:
+            if resp.status_code == 304 and snapshot is not None:
+                logger.info("♻️ Problemset nao mudou, renovando TTL do cache")
+                snapshot.fetched_at = time.time()
+                self._write_meta(snapshot)
+                return snapshot
+            resp.raise_for_status()
+            digest = hashlib.sha1()
+            problems = parse_problemset(_hashing(self.http.iter_bytes(resp), digest))
+        finally:
+            resp.close()
+        fresh = ProblemsetSnapshot(
+            problems=problems,
+            version=resp.headers.get("ETag") or digest.hexdigest(),
+            fetched_at=time.time(),
+            etag=resp.headers.get("ETag"),
+            last_modified=resp.headers.get("Last-Modified"),
+        )
+        self._write_disk(fresh)
+        return fresh
+
+    @property
+    def meta_path(self) -> Path:
+        """Arquivo lateral com ETag/TTL, para renovar sem reescrever o payload."""
+        return self.path.with_name(f"{self.path.name}.meta")
+
+    def _read_disk(self) -> Optional[ProblemsetSnapshot]:
+        """Carrega o snapshot salvo em disco, se existir e for legivel."""
+        if not self.path.exists():
+            return None
+        try:
+            with self.path.open("r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+            snapshot = ProblemsetSnapshot(
+                problems=[ProblemRecord.from_dict(problem) for problem in payload["problems"]],
+                version=payload["version"],
+                fetched_at=0.0,
+            )
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            logger.warning("⚠️ Cache do problemset ilegivel, ignorando: %s", exc)
+            return None
+        try:
+            meta = json.loads(self.meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return snapshot
+        if meta.get("version") == snapshot.version:
+            snapshot.fetched_at = meta.get("fetched_at", 0.0)
+            snapshot.etag = meta.get("etag")
+            snapshot.last_modified = meta.get("last_modified")
+        return snapshot
+
+    def _write_disk(self, snapshot: ProblemsetSnapshot) -> None:
+        """Persiste payload e metadados."""
+        payload = {"version": snapshot.version, "problems": [problem.to_dict() for problem in snapshot.problems]}
+        atomic_write_text(self.path, json.dumps(payload, ensure_ascii=False))
+        self._write_meta(snapshot)
+
+    def _write_meta(self, snapshot: ProblemsetSnapshot) -> None:
+        """Persiste somente os metadados de revalidacao."""
+        meta = {
+            "version": snapshot.version,
+            "fetched_at": snapshot.fetched_at,
+            "etag": snapshot.etag,
+            "last_modified": snapshot.last_modified,
+        }
+        atomic_write_text(self.meta_path, json.dumps(meta))
+
+
+def _hashing(chunks: Iterable[bytes], digest) -> Iterator[bytes]:
+    """Repassa os chunks atualizando o hash (versao quando nao ha ETag)."""
+    for chunk in chunks:
+        digest.update(chunk)
+        yield chunk
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import random
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+from typing import Collection, Dict, FrozenSet, List, Optional, Sequence, Tuple, Union
+
+from src.providers.base import slugify_many
+from src.providers.problemset import ProblemRecord
+
+
+CandidateKey = Tuple[Optional[int], Optional[int], Tuple[str, ...]]
+
+# Tentativas de amostragem por rejeicao antes de filtrar explicitamente.
+MAX_REJECTION_TRIES = 32
+
+
+@dataclass
+class ProblemIndex:
+    """Indice em memoria do problemset: buckets por rating e posting lists por tag."""
+    version: str
+    problems: List[ProblemRecord]
+    ids: List[str]
+    ratings: List[int]
+    by_rating: Dict[int, List[int]]
+    by_tag: Dict[str, FrozenSet[int]]
+    _candidates: Dict[CandidateKey, Tuple[int, ...]] = field(default_factory=dict, repr=False)
+
+    @classmethod
+    def build(
+        cls,
+        problems: Sequence[Union[ProblemRecord, dict]],
+        version: str,
+        source: str = "codeforces",
+    ) -> "ProblemIndex":
+        """Constroi o indice descartando problemas sem rating ou identificador; os slugs saem em lote."""
+        kept: List[ProblemRecord] = []
+        ids: List[str] = []
+        by_rating: Dict[int, List[int]] = {}
+        tag_lists: Dict[str, List[int]] = {}
+        for problem in problems:
+            if isinstance(problem, dict):
+                problem = ProblemRecord.from_dict(problem)
+            rating = problem.rating
+            if rating is None or not problem.contest_id or not problem.index:
+                continue
+            position = len(kept)
+            kept.append(problem)
+            ids.append(f"{source}:{problem.contest_id}:{problem.index}")
+            by_rating.setdefault(rating, []).append(position)
+            for tag in problem.tags:
+                tag_lists.setdefault(tag, []).append(position)
+        slugify_many(problem.name for problem in kept if problem.name)
+        return cls(
+            version=version,
+            problems=kept,
+            ids=ids,
+            ratings=sorted(by_rating),
+            by_rating=by_rating,
+            by_tag={tag: frozenset(positions) for tag, positions in tag_lists.items()},
+        )
+
+    def candidates(
+        self,
+        rating_from: Optional[int],
+        rating_to: Optional[int],
+        tags: Optional[Collection[str]],
+    ) -> Tuple[int, ...]:
+        """Resolve as posicoes elegiveis para o filtro, com memoizacao por filtro."""
+        key: CandidateKey = (rating_from, rating_to, tuple(sorted(set(tags or ()))))
+        cached = self._candidates.get(key)
+        if cached is not None:
+            return cached
+        lo = bisect_left(self.ratings, rating_from) if rating_from else 0
+        hi = bisect_right(self.ratings, rating_to) if rating_to else len(self.ratings)
+        positions = [pos for rating in self.ratings[lo:hi] for pos in self.by_rating[rating]]
+        if key[2]:
+            postings = sorted((self.by_tag.get(tag, frozenset()) for tag in key[2]), key=len)
+            required = postings[0].intersection(*postings[1:])
+            positions = [pos for pos in positions if pos in required]
+        result = tuple(positions)
+        self._candidates[key] = result
+        return result
+
+    def pick(
+        self,
+        rating_from: Optional[int],
+        rating_to: Optional[int],
+        tags: Optional[Collection[str]],
+        exclude: Collection[str],
+        rng: Optional[random.Random] = None,
+    ) -> Optional[Tuple[str, ProblemRecord]]:
+        """Sorteia uniformemente um problema elegivel fora de `exclude`."""
+        rng = rng or random
+        candidates = self.candidates(rating_from, rating_to, tags)
+        if not candidates:
+            return None
+        for _ in range(MAX_REJECTION_TRIES):
+            position = rng.choice(candidates)
+            if self.ids[position] not in exclude:
+                return self.ids[position], self.problems[position]
+        remaining = [pos for pos in candidates if self.ids[pos] not in exclude]
+        if not remaining:
+            return None
+        position = rng.choice(remaining)
+        return self.ids[position], self.problems[position]
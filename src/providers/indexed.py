@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import Callable, Collection, List, Optional, Sequence, Tuple, Union
+
+from src.providers.base import Problem
+from src.providers.index import ProblemIndex
+from src.providers.problemset import ProblemRecord
+from src.utils.logger import get_logger
+
+
+logger = get_logger("providers")
+
+
+DIFFICULTY_MAP = {
+    "easy": (800, 1200),
+    "medium": (1300, 1700),
+    "hard": (1800, 2300),
+}
+
+
+class IndexedProvider(ABC):
+    """Base dos providers que selecionam de um catalogo indexado por rating/tags."""
+    source = "codeforces"
+    url_template = "https://codeforces.com/problemset/problem/{contest_id}/{index}"
+    # Prefixo do nome de problemas sem titulo (padrao: source em maiusculas).
+    label: Optional[str] = None
+
+    def __init__(self) -> None:
+        self._index: Optional[ProblemIndex] = None
+
+    def fetch_problem(
+        self,
+        difficulty: Optional[str],
+        rating_range: Optional[Tuple[int, int]],
+        tags: Optional[List[str]],
+        used_ids: Collection[str],
+    ) -> Problem:
+        """Busca e seleciona um problema valido segundo filtros."""
+        rating_from, rating_to = self._resolve_rating(difficulty, rating_range)
+        picked = self._get_index().pick(rating_from, rating_to, tags, exclude=used_ids)
+        if picked is None:
+            raise RuntimeError("Nenhum problema encontrado com os filtros atuais")
+        _, chosen = picked
+        contest_id = chosen.contest_id
+        index = chosen.index
+        return Problem(
+            source=self.source,
+            contest_id=contest_id,
+            index=index,
+            name=chosen.name or f"{self.label or self.source.upper()} {contest_id}{index}",
+            rating=chosen.rating,
+            tags=chosen.tags,
+            url=self.url_template.format(source=self.source, contest_id=contest_id, index=index),
+        )
+
+    @abstractmethod
+    def _get_index(self) -> ProblemIndex:
+        """Indice atual do catalogo (implementado por cada provider)."""
+
+    def _indexed(self, version: str, load: Callable[[], Sequence[Union[ProblemRecord, dict]]]) -> ProblemIndex:
+        """Reconstroi o indice somente quando a versao do catalogo muda."""
+        if self._index is None or self._index.version != version:
+            logger.info("🗂️ Reindexando catalogo de %s por rating/tags", self.source)
+            self._index = ProblemIndex.build(load(), version, source=self.source)
+        return self._index
+
+    def _resolve_rating(
+        self,
+        difficulty: Optional[str],
+        rating_range: Optional[Tuple[int, int]],
+    ) -> Tuple[Optional[int], Optional[int]]:
+        """Resolve difficulty para faixa de rating."""
+        if rating_range:
+            return rating_range[0], rating_range[1]
+        if difficulty:
+            return DIFFICULTY_MAP.get(difficulty.lower(), (None, None))
+        return None, None
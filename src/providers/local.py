@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+from typing import List, Optional
+
+from src.providers.index import ProblemIndex
+from src.providers.indexed import IndexedProvider
+from src.providers.problemset import ProblemRecord
+from src.utils.logger import get_logger
+
+
+logger = get_logger("providers")
+
+
+LOCAL_URL_TEMPLATE = "local://{source}/{contest_id}/{index}"
+
+
+class LocalJsonProvider(IndexedProvider):
+    """Catalogo em um arquivo JSON local (dump da API ou lista de problemas).
+
+    Aceita o formato de problemset.problems, {"problems": [...]} ou uma lista;
+    o arquivo e relido somente quando mtime/tamanho mudam.
+    """
+
+    def __init__(self, path: Path, source: str, url_template: Optional[str] = None) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.source = source
+        self.url_template = url_template or LOCAL_URL_TEMPLATE
+
+    def _get_index(self) -> ProblemIndex:
+        """Indice do arquivo, versionado por mtime e tamanho."""
+        stat = os.stat(self.path)
+        return self._indexed(f"{stat.st_mtime_ns}:{stat.st_size}", self._load)
+
+    def _load(self) -> List[ProblemRecord]:
+        """Le o dump e converte para registros compactos."""
+        with self.path.open("r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+        if isinstance(payload, dict):
+            payload = payload.get("result", payload).get("problems", [])
+        return [ProblemRecord.from_dict(problem) for problem in payload]
+
+
+class DirectoryProvider(IndexedProvider):
+    """Catalogo em um diretorio com um arquivo JSON por problema."""
+
+    def __init__(self, path: Path, source: str, url_template: Optional[str] = None) -> None:
+        super().__init__()
+        self.path = Path(path)
+        self.source = source
+        self.url_template = url_template or LOCAL_URL_TEMPLATE
+
+    def _get_index(self) -> ProblemIndex:
+        """Indice do diretorio; adicionar ou remover arquivos muda o mtime da pasta."""
+        stat = os.stat(self.path)
+        return self._indexed(str(stat.st_mtime_ns), self._load)
+
+    def _load(self) -> List[ProblemRecord]:
+        """Le cada *.json do diretorio, ignorando arquivos invalidos."""
+        records = []
+        with os.scandir(self.path) as entries:
+            for entry in sorted(entries, key=lambda item: item.name):
+                if not entry.name.endswith(".json") or not entry.is_file():
+                    continue
+                try:
+                    with open(entry.path, "r", encoding="utf-8") as handle:
+                        records.append(ProblemRecord.from_dict(json.load(handle)))
+                except (OSError, ValueError, AttributeError) as exc:
+                    logger.warning("⚠️ Problema ignorado em %s: %s", entry.name, exc)
+        return records
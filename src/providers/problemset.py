@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+import sys
+from dataclasses import dataclass
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+
+# A partir deste tamanho o trecho ja consumido do buffer e descartado.
+_COMPACT_AT = 1 << 16
+
+_PROBLEMS_KEY = re.compile(r'"problems"\s*:\s*\[')
+_STATUS = re.compile(r'"status"\s*:\s*"([A-Za-z]+)"')
+_WHITESPACE = " \t\r\n"
+
+
+@dataclass(frozen=True, slots=True)
+class ProblemRecord:
+    """Somente os campos do problemset que o servico usa (tags internadas)."""
+    contest_id: Optional[int]
+    index: Optional[str]
+    name: Optional[str]
+    rating: Optional[int]
+    tags: Tuple[str, ...]
+
+    @classmethod
+    def from_dict(cls, payload: dict) -> "ProblemRecord":
+        """Converte um problema no formato da API (contestId, index, ...)."""
+        index = payload.get("index")
+        return cls(
+            contest_id=payload.get("contestId"),
+            index=sys.intern(index) if index else index,
+            name=payload.get("name"),
+            rating=payload.get("rating"),
+            tags=tuple(sys.intern(tag) for tag in payload.get("tags", ())),
+        )
+
+    def to_dict(self) -> dict:
+        """Formato da API, usado no cache em disco."""
+        return {
+            "contestId": self.contest_id,
+            "index": self.index,
+            "name": self.name,
+            "rating": self.rating,
+            "tags": list(self.tags),
+        }
+
+
+def parse_problemset(chunks: Iterable[bytes]) -> List[ProblemRecord]:
+    """Le o payload de problemset.problems em streaming e devolve os registros compactos."""
+    return list(iter_problem_records(chunks))
+
+
+def iter_problem_records(chunks: Iterable[bytes]) -> Iterator[ProblemRecord]:
+    """Decodifica um problema por vez de result.problems e para no fim do array.
+
+    O restante do payload (problemStatistics) nao e lido nem decodificado.
+    """
+    buffer = _StreamBuffer(chunks)
+    buffer.seek_problems()
+    decoder = json.JSONDecoder()
+    while True:
+        char = buffer.next_char()
+        if char is None:
+            raise ValueError("payload do problemset truncado")
+        if char == ",":
+            buffer.pos += 1
+            continue
+        if char == "]":
+            return
+        try:
+            payload, end = decoder.raw_decode(buffer.text, buffer.pos)
+        except json.JSONDecodeError:
+            if buffer.fill():
+                continue
+            raise
+        buffer.pos = end
+        yield ProblemRecord.from_dict(payload)
+
+
+class _StreamBuffer:
+    """Texto decodificado incrementalmente a partir de chunks de bytes."""
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+
+    def fill(self) -> bool:
+        """Acrescenta o proximo chunk; False quando o stream acabou."""
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            tail = self._decoder.decode(b"", final=True)
+            self.text += tail
+            return bool(tail)
+        if self.pos >= _COMPACT_AT:
+            self.text = self.text[self.pos:]
+            self.pos = 0
+        self.text += self._decoder.decode(chunk)
+        return True
+
+    def next_char(self) -> Optional[str]:
+        """Avanca espacos e retorna o proximo caractere significativo."""
+        while True:
+            while self.pos < len(self.text) and self.text[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.text):
+                return self.text[self.pos]
+            if not self.fill():
+                return None
+
+    def seek_problems(self) -> None:
+        """Posiciona logo apos `"problems": [`, validando o status da resposta."""
+        search_from = 0
+        while True:
+            match = _PROBLEMS_KEY.search(self.text, search_from)
+            status = _STATUS.search(self.text, 0, match.start() if match else len(self.text))
+            if status and status.group(1) != "OK":
+                self._raise_api_error()
+            if match:
+                self.pos = match.end()
+                return
+            search_from = max(0, len(self.text) - 32)
+            if not self.fill():
+                self._raise_api_error()
+
+    def _raise_api_error(self) -> None:
+        """Le o resto do payload para compor a mensagem de erro da API."""
+        while self.fill():
+            pass
+        try:
+            payload = json.loads(self.text)
+        except ValueError:
+            payload = self.text[:200]
+        raise RuntimeError(f"Codeforces API error: {payload}")
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from typing import TYPE_CHECKING, Collection, Dict, List, Optional, Sequence, Tuple
+
+from src.providers.base import Problem, ProblemProvider
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from src.http_client import HttpClient
+    from src.settings import Settings
+
+
+logger = get_logger("providers")
+
+
+class ProviderRegistry:
+    """Providers por nome; um job pode consultar varios em paralelo."""
+
+    def __init__(self, providers: Optional[Dict[str, ProblemProvider]] = None, max_workers: int = 4) -> None:
+        self._providers: Dict[str, ProblemProvider] = dict(providers or {})
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def names(self) -> List[str]:
+        """Nomes registrados, na ordem de cadastro."""
+        return list(self._providers)
+
+    def register(self, name: str, provider: ProblemProvider) -> None:
+        """Registra (ou substitui) um provider."""
+        self._providers[name] = provider
+
+    def get(self, name: str) -> ProblemProvider:
+        """Provider pelo nome."""
+        try:
+            return self._providers[name]
+        except KeyError:
+            raise KeyError(f"provider nao registrado: {name}") from None
+
+    def fetch_problem(
+        self,
+        difficulty: Optional[str],
+        rating_range: Optional[Tuple[int, int]],
+        tags: Optional[List[str]],
+        used_ids: Collection[str],
+        providers: Optional[Sequence[str]] = None,
+        budget_seconds: float = 10.0,
+    ) -> Problem:
+        """Consulta os providers do job; com mais de um, fica com o primeiro resultado valido.
+
+        Os providers rodam em paralelo e a espera total e limitada a `budget_seconds`.
+        """
+        names = list(providers or self.names[:1])
+        if len(names) == 1:
+            return self.get(names[0]).fetch_problem(difficulty, rating_range, tags, used_ids)
+        pool = self._get_pool()
+        pending: Dict[Future, str] = {
+            pool.submit(self.get(name).fetch_problem, difficulty, rating_range, tags, used_ids): name
+            for name in names
+        }
+        deadline = time.monotonic() + budget_seconds
+        errors: List[str] = []
+        while pending:
+            done, _ = wait(pending, timeout=max(0.0, deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                name = pending.pop(future)
+                try:
+                    problem = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    errors.append(f"{name}: {exc}")
+                    continue
+                for late in pending:
+                    late.cancel()
+                logger.info("🔀 Problema escolhido do provider %s", name)
+                return problem
+        if pending:
+            errors.append(f"sem resposta em {budget_seconds:.1f}s: {', '.join(pending.values())}")
+        raise RuntimeError(f"Nenhum provider retornou problema ({'; '.join(errors)})")
+
+    def close(self) -> None:
+        """Encerra o pool do fan-out sem esperar consultas atrasadas."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        """Pool criado sob demanda para o fan-out."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(max_workers=self._max_workers, thread_name_prefix="provider")
+        return self._pool
+
+
+def build_registry(settings: "Settings", http: Optional["HttpClient"] = None) -> ProviderRegistry:
+    """Instancia os providers declarados em settings.providers, cada um com cache/indice proprio."""
+    from src.providers.cache import ProblemsetCache
+    from src.providers.codeforces import CodeforcesProvider
+    from src.providers.local import DirectoryProvider, LocalJsonProvider
+
+    repo_path = Path(settings.repo_path)
+    registry = ProviderRegistry(max_workers=max(1, len(settings.providers)))
+    for name, config in settings.providers.items():
+        source = config.source or name
+        if config.type == "codeforces":
+            cache_name = "problemset.json" if name == "codeforces" else f"problemset_{name}.json"
+            cache = ProblemsetCache(
+                path=repo_path / settings.cache_dir / cache_name,
+                url=config.url or CodeforcesProvider.base_url,
+                ttl_seconds=settings.problemset_cache_ttl_seconds,
+                timeout=settings.http.timeout_seconds,
+                http=http,
+            )
+            provider: ProblemProvider = CodeforcesProvider(cache=cache)
+            provider.source = source
+            if config.url_template:
+                provider.url_template = config.url_template
+        elif config.type == "local_json":
+            provider = LocalJsonProvider(repo_path / config.path, source, config.url_template)
+        else:
+            provider = DirectoryProvider(repo_path / config.path, source, config.url_template)
+        registry.register(name, provider)
+    return registry
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import gzip
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import List, Optional
+
+import requests
+
+from src.http_client import HttpClient
+from src.providers.base import Problem
+from src.utils.fs import atomic_write_bytes
+from src.utils.logger import get_logger
+from src.utils.metrics import CACHE_TOTAL, get_metrics
+
+
+logger = get_logger("statements")
+
+
+@dataclass(frozen=True)
+class Sample:
+    input: str
+    output: str
+
+
+def parse_samples(html: str) -> List[Sample]:
+    """Extrai os pares de exemplo (div.input/div.output > pre) da pagina do problema.
+
+    Cobre o markup antigo (linhas separadas por <br>) e o atual (uma div por linha).
+    """
+    parser = _SampleParser()
+    parser.feed(html)
+    parser.close()
+    return [Sample(input=_normalize(inp), output=_normalize(out)) for inp, out in zip(parser.inputs, parser.outputs)]
+
+
+def _normalize(text: str) -> str:
+    """Remove espacos no fim das linhas e garante uma quebra de linha final."""
+    lines = [line.rstrip() for line in text.strip("\n").split("\n")]
+    return "\n".join(lines).strip("\n") + "\n"
+
+
+class _SampleParser(HTMLParser):
+    """Coleta o texto dos <pre> que seguem div.input e div.output."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.inputs: List[str] = []
+        self.outputs: List[str] = []
+        self._section: Optional[str] = None
+        self._buffer: Optional[List[str]] = None
+
+    def handle_starttag(self, tag, attrs):
+        if self._buffer is not None:
+            if tag == "br":
+                self._buffer.append("\n")
+            return
+        if tag == "div":
+            classes = (dict(attrs).get("class") or "").split()
+            if "input" in classes:
+                self._section = "input"
+            elif "output" in classes:
+                self._section = "output"
+        elif tag == "pre" and self._section:
+            self._buffer = []
+
+    def handle_endtag(self, tag):
+        if self._buffer is None:
+            return
+        if tag == "div":
+            self._buffer.append("\n")
+        elif tag == "pre":
+            target = self.inputs if self._section == "input" else self.outputs
+            target.append("".join(self._buffer))
+            self._buffer = None
+            self._section = None
+
+    def handle_data(self, data):
+        if self._buffer is not None:
+            self._buffer.append(data)
+
+
+@dataclass
+class StatementCache:
+    """Exemplos por problem_id em JSON comprimido (<root>/<fonte>/<contest>_<indice>.json.gz).
+
+    Paginas sem exemplos (markup novo, pagina de desafio anti-bot) expiram apos
+    `empty_ttl_seconds` para serem buscadas de novo.
+    """
+    root: Path
+    empty_ttl_seconds: float = 24 * 3600
+
+    def get(self, problem_id: str) -> Optional[List[Sample]]:
+        """Exemplos gravados; None quando o problema ainda nao foi buscado ou a lista vazia expirou."""
+        path = self._path(problem_id)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning("⚠️ Cache de enunciado ilegivel em %s: %s", path.name, exc)
+            return None
+        samples = [Sample(**sample) for sample in payload.get("samples", [])]
+        if not samples and self._expired(payload.get("fetched_at")):
+            return None
+        return samples
+
+    def put(self, problem_id: str, url: str, samples: List[Sample]) -> None:
+        """Grava os exemplos (lista vazia evita nova busca ate expirar)."""
+        payload = {
+            "problem_id": problem_id,
+            "url": url,
+            "fetched_at": datetime.now(timezone.utc).isoformat(),
+            "samples": [{"input": sample.input, "output": sample.output} for sample in samples],
+        }
+        data = gzip.compress(json.dumps(payload, ensure_ascii=False).encode("utf-8"), mtime=0)
+        atomic_write_bytes(self._path(problem_id), data)
+
+    def _expired(self, fetched_at: Optional[str]) -> bool:
+        """Se a busca registrada ja passou de `empty_ttl_seconds`."""
+        try:
+            fetched = datetime.fromisoformat(fetched_at)
+        except (TypeError, ValueError):
+            return True
+        return (datetime.now(timezone.utc) - fetched).total_seconds() > self.empty_ttl_seconds
+
+    def _path(self, problem_id: str) -> Path:
+        """Arquivo do problema."""
+        source, _, rest = problem_id.partition(":")
+        return Path(self.root) / source / f"{rest.replace(':', '_')}.json.gz"
+
+
+@dataclass
+class StatementFetcher:
+    """Busca a pagina do problema (pelo HttpClient, com rate limit) e guarda os exemplos."""
+    cache: StatementCache
+    http: HttpClient
+
+    def samples(self, problem: Problem) -> List[Sample]:
+        """Exemplos do problema; com cache, nao toca a rede. Falhas retornam lista vazia."""
+        cached = self.cache.get(problem.problem_id)
+        if cached is not None:
+            get_metrics().inc(CACHE_TOTAL, cache="statements", result="hit")
+            return cached
+        if not problem.url.startswith(("http://", "https://")):
+            return []
+        get_metrics().inc(CACHE_TOTAL, cache="statements", result="miss")
+        logger.info("📄 Buscando exemplos de %s", problem.problem_id)
+        try:
+            resp = self.http.get(problem.url, headers={"Accept": "text/html"})
+        except requests.RequestException as exc:
+            logger.warning("⚠️ Enunciado de %s indisponivel: %s", problem.problem_id, exc)
+            return []
+        if resp.status_code != 200:
+            logger.warning("⚠️ Enunciado de %s respondeu HTTP %s", problem.problem_id, resp.status_code)
+            return []
+        samples = parse_samples(resp.text)
+        self.cache.put(problem.problem_id, problem.url, samples)
+        logger.info("🧪 %s exemplos encontrados para %s", len(samples), problem.problem_id)
+        return samples
@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import json
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.git_client import GitClient
+from src.utils.fs import atomic_write_text
+from src.utils.logger import get_logger
+
+
+logger = get_logger("push")
+
+
+@dataclass
+class PushQueue:
+    """Fila de push em background: agrupa commits pendentes em um unico `git push`."""
+    git_client: GitClient
+    state_path: Path
+    backoff_seconds: float = 5.0
+    max_backoff_seconds: float = 300.0
+    pushes: int = field(default=0, init=False)
+    _pending: bool = field(default=False, init=False, repr=False)
+    _attempts: int = field(default=0, init=False, repr=False)
+    _wakeup: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _idle: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _stopping: threading.Event = field(default_factory=threading.Event, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _thread: Optional[threading.Thread] = field(default=None, init=False, repr=False)
+
+    def start(self) -> None:
+        """Inicia o worker e retoma um push pendente de execucoes anteriores."""
+        if self._thread is not None:
+            return
+        if not self._pending:
+            self._idle.set()
+        persisted = self._read_state()
+        if persisted.get("pending"):
+            logger.info("📤 Push pendente de execucao anterior, reenfileirando")
+            self._attempts = persisted.get("attempts", 0)
+            self.enqueue()
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._worker, name="push-queue", daemon=True)
+        self._thread.start()
+
+    def enqueue(self) -> None:
+        """Marca que ha commits locais para enviar (chamadas repetidas se agrupam)."""
+        with self._lock:
+            self._pending = True
+            self._idle.clear()
+            self._write_state()
+        self._wakeup.set()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Aguarda a fila esvaziar; retorna False se ainda houver push pendente."""
+        return self._idle.wait(timeout)
+
+    def stop(self, flush_timeout: Optional[float] = None) -> bool:
+        """Tenta esvaziar a fila e encerra o worker; o pendente fica persistido."""
+        flushed = self.flush(flush_timeout) if self._thread is not None else not self._pending
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if not flushed:
+            logger.warning("⚠️ Push ainda pendente; sera retomado na proxima execucao")
+        return flushed
+
+    @property
+    def pending(self) -> bool:
+        """Ha commits aguardando push."""
+        return self._pending
+
+    def _worker(self) -> None:
+        """Loop do worker: espera pedidos e faz um push por rodada, com backoff proprio."""
+        while not self._stopping.is_set():
+            self._wakeup.wait()
+            self._wakeup.clear()
+            if self._stopping.is_set():
+                return
+            with self._lock:
+                if not self._pending:
+                    self._idle.set()
+                    continue
+                self._pending = False
+            try:
+                self.git_client.push()
+            except Exception as exc:  # noqa: BLE001
+                self._attempts += 1
+                wait_seconds = min(self.max_backoff_seconds, self.backoff_seconds * 2 ** (self._attempts - 1))
+                logger.warning("⚠️ Push falhou (%s), nova tentativa em %.0fs", exc, wait_seconds)
+                with self._lock:
+                    self._pending = True
+                    self._write_state(last_error=str(exc))
+                if self._stopping.wait(wait_seconds):
+                    return
+                self._wakeup.set()
+                continue
+            self.pushes += 1
+            self._attempts = 0
+            with self._lock:
+                if not self._pending:
+                    self._write_state()
+                    self._idle.set()
+            logger.info("📤 Push concluido")
+
+    def _read_state(self) -> dict:
+        """Le o estado persistido da fila."""
+        try:
+            return json.loads(self.state_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def _write_state(self, last_error: Optional[str] = None) -> None:
+        """Persiste se ha push pendente (tmp + replace)."""
+        payload = {
+            "pending": self._pending,
+            "attempts": self._attempts,
+            "updated_at": datetime.now().isoformat(),
+            "last_error": last_error,
+        }
+        atomic_write_text(self.state_path, json.dumps(payload))
@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+import shutil
+import threading
+from dataclasses import dataclass, field
 from pathlib import Path
-from zoneinfo import ZoneInfo
+from typing import List, Optional, Sequence, Set, Tuple
 
+from src.index_manifest import IndexManifest
 from src.providers.base import Problem
-from src.solver.template_solver import GeneratedArtifacts
+from src.solver.base import GeneratedArtifacts
+from src.utils.fs import publish_dir, remove_stale_staging
 from src.utils.logger import get_logger
+from src.utils.time import now_in_tz
 
 
 logger = get_logger("writer")
@@ -17,32 +21,114 @@ logger = get_logger("writer")
 class RepoWriter:
     """Escreve a estrutura de pastas e atualiza o indice."""
     repo_path: Path
+    fsync: str = "none"
+    _cleaned: Set[Path] = field(default_factory=set, init=False, repr=False)
+    _index_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _manifest: Optional[IndexManifest] = field(default=None, init=False, repr=False)
 
-    def write_problem(self, problem: Problem, artifacts: GeneratedArtifacts, tz_name: str) -> Path:
-        """Cria a pasta do desafio e salva os arquivos."""
+    @property
+    def index_path(self) -> Path:
+        """Caminho do INDEX.md."""
+        return self.repo_path / "INDEX.md"
+
+    @property
+    def manifest_path(self) -> Path:
+        """Caminho do manifesto usado para gerar o INDEX.md."""
+        return self.repo_path / "state" / "index_manifest.json"
+
+    @property
+    def index_paths(self) -> List[Path]:
+        """Arquivos de indice que entram em cada commit."""
+        return [self.index_path, self.manifest_path]
+
+    def reindex(self) -> int:
+        """Reconstroi manifesto e INDEX.md a partir de challenges/."""
+        with self._index_lock:
+            manifest = IndexManifest(self.manifest_path)
+            total = manifest.rebuild_from_disk(self.repo_path)
+            manifest.save()
+            manifest.write_index(self.index_path)
+            self._manifest = manifest
+        logger.info("🗂️ Indice reconstruido com %s desafios", total)
+        return total
+
+    def write_problem(
+        self,
+        problem: Problem,
+        artifacts: GeneratedArtifacts,
+        tz_name: str,
+        update_index: bool = True,
+    ) -> Path:
+        """Publica a pasta do desafio de forma atomica e, por padrao, atualiza o indice."""
         logger.info("📝 Criando estrutura de pastas do desafio")
-        now = datetime.now(ZoneInfo(tz_name))
-        month_folder = now.strftime("%Y-%m")
-        challenge_dir = (
+        challenge_dir = self._challenge_dir(problem, tz_name)
+        self._publish(challenge_dir, artifacts)
+        if update_index:
+            self.update_index([(problem, challenge_dir)])
+        return challenge_dir
+
+    def discard(self, challenge_dir: Path) -> None:
+        """Remove a pasta de um desafio que falhou antes do commit."""
+        if challenge_dir.exists():
+            logger.info("🧹 Removendo pasta do desafio com falha: %s", challenge_dir.name)
+            shutil.rmtree(challenge_dir, ignore_errors=True)
+
+    def update_index(self, items: Sequence[Tuple[Problem, Path]]) -> None:
+        """Atualiza o manifesto e regenera o INDEX.md (idempotente em retries)."""
+        entries = [
+            {
+                "problem_id": problem.problem_id,
+                "name": problem.name,
+                "month": challenge_dir.parent.name,
+                "path": challenge_dir.relative_to(self.repo_path).as_posix(),
+                "rating": problem.rating,
+                "tags": list(problem.tags),
+            }
+            for problem, challenge_dir in items
+        ]
+        with self._index_lock:
+            manifest = self._load_manifest()
+            changed = [manifest.upsert(entry) for entry in entries]
+            if not any(changed) and all(path.exists() for path in self.index_paths):
+                return
+            manifest.save(fsync=self.fsync)
+            manifest.write_index(self.index_path, fsync=self.fsync)
+
+    def _challenge_dir(self, problem: Problem, tz_name: str) -> Path:
+        """Pasta challenges/<mes>/<fonte>_<contest>_<indice>_<slug>."""
+        month_folder = now_in_tz(tz_name).strftime("%Y-%m")
+        return (
             self.repo_path
             / "challenges"
             / month_folder
             / f"{problem.source}_{problem.contest_id}_{problem.index}_{problem.slug}"
         )
-        challenge_dir.mkdir(parents=True, exist_ok=True)
-        (challenge_dir / "README.md").write_text(artifacts.readme, encoding="utf-8")
-        (challenge_dir / "solution.py").write_text(artifacts.solution, encoding="utf-8")
-        (challenge_dir / "test_solution.py").write_text(artifacts.tests, encoding="utf-8")
-        (challenge_dir / "notes.md").write_text(artifacts.notes, encoding="utf-8")
-        self._update_index(problem, challenge_dir)
-        return challenge_dir
 
-    def _update_index(self, problem: Problem, challenge_dir: Path) -> None:
-        """Acrescenta o desafio ao INDEX.md."""
-        index_path = self.repo_path / "INDEX.md"
-        if not index_path.exists():
-            index_path.write_text("# Desafios\n", encoding="utf-8")
-        rel_path = challenge_dir.relative_to(self.repo_path)
-        line = f"- [{problem.name}]({rel_path.as_posix()})\n"
-        with index_path.open("a", encoding="utf-8") as handle:
-            handle.write(line)
+    def _publish(self, challenge_dir: Path, artifacts: GeneratedArtifacts) -> None:
+        """Monta os arquivos em staging e troca a pasta com os.replace."""
+        month_dir = challenge_dir.parent
+        # A limpeza fica sob o lock: outro thread nao pode montar staging no mes enquanto ela roda.
+        with self._index_lock:
+            if month_dir not in self._cleaned:
+                remove_stale_staging(month_dir)
+                self._cleaned.add(month_dir)
+        files = {
+            "README.md": artifacts.readme,
+            artifacts.solution_filename: artifacts.solution,
+            "test_solution.py": artifacts.tests,
+            "notes.md": artifacts.notes,
+        }
+        for number, (sample_in, sample_out) in enumerate(artifacts.samples, start=1):
+            files[f"samples/{number:02d}.in"] = sample_in
+            files[f"samples/{number:02d}.out"] = sample_out
+        publish_dir(files, challenge_dir, fsync=self.fsync)
+
+    def _load_manifest(self) -> IndexManifest:
+        """Carrega o manifesto uma vez; sem manifesto, reconstroi a partir do disco."""
+        if self._manifest is None:
+            manifest = IndexManifest(self.manifest_path)
+            if not manifest.load():
+                logger.info("🗂️ Manifesto do indice ausente, reconstruindo a partir de challenges/")
+                manifest.rebuild_from_disk(self.repo_path)
+            self._manifest = manifest
+        return self._manifest
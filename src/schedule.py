@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from datetime import datetime, time as dt_time
+from typing import Dict, List, Optional, Tuple
+
+from src.settings import JobSettings
+from src.state_store import job_key
+from src.utils.logger import get_logger
+from src.utils.time import WEEKDAYS, get_zone, next_occurrence, parse_time_hhmm
+
+
+logger = get_logger("schedule")
+
+
+@dataclass(frozen=True)
+class CompiledJob:
+    """Job com dia/horario ja convertidos."""
+    day: str
+    weekday_index: int
+    at: dt_time
+    job: JobSettings
+
+    @classmethod
+    def build(cls, day: str, job: JobSettings) -> "CompiledJob":
+        """Converte dia e HH:MM uma unica vez."""
+        return cls(day=day, weekday_index=WEEKDAYS.index(day), at=parse_time_hhmm(job.time), job=job)
+
+    @property
+    def key(self) -> str:
+        """Identidade do job (dia + definicao), usada no diff do reload."""
+        return f"{self.day}|{job_key(self.job.model_dump())}"
+
+
+@dataclass(order=True)
+class _Entry:
+    fire_ts: float
+    seq: int
+    fire_at: datetime = field(compare=False)
+    compiled: CompiledJob = field(compare=False)
+
+
+@dataclass
+class Firing:
+    """Disparo devido: job, horario previsto e atraso."""
+    job: JobSettings
+    day: str
+    fire_at: datetime
+    late_seconds: float
+    misfired: bool
+
+
+@dataclass
+class CompiledSchedule:
+    """Fila de prioridade (heap) de jobs ordenada pelo proximo disparo.
+
+    Cada disparo rearma somente o job que disparou. O `misfire_policy` decide o que
+    fazer com disparos atrasados alem de `grace_seconds` (ex.: maquina suspensa):
+    "run_once" executa uma vez e descarta as demais ocorrencias perdidas; "skip" pula.
+    """
+    tz_name: str
+    misfire_policy: str = "run_once"
+    grace_seconds: float = 300.0
+    _heap: List[_Entry] = field(default_factory=list, init=False, repr=False)
+    _seq: int = field(default=0, init=False, repr=False)
+
+    @classmethod
+    def compile(
+        cls,
+        schedule: Dict[str, List[JobSettings]],
+        tz_name: str,
+        now: datetime,
+        misfire_policy: str = "run_once",
+        grace_seconds: float = 300.0,
+    ) -> "CompiledSchedule":
+        """Pre-processa o schedule do settings em um heap."""
+        compiled = cls(tz_name=tz_name, misfire_policy=misfire_policy, grace_seconds=grace_seconds)
+        for day, jobs in schedule.items():
+            for job in jobs:
+                compiled.add(CompiledJob.build(day, job), now)
+        return compiled
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def add(self, compiled: CompiledJob, now: datetime) -> None:
+        """Arma um job para a proxima ocorrencia apos `now`."""
+        fire_at = next_occurrence(compiled.weekday_index, compiled.at, get_zone(self.tz_name), now)
+        self._seq += 1
+        heapq.heappush(self._heap, _Entry(fire_at.timestamp(), self._seq, fire_at, compiled))
+
+    def update(self, schedule: Dict[str, List[JobSettings]], now: datetime) -> Tuple[int, int]:
+        """Aplica um novo schedule: mantem os jobs iguais e recalcula so os alterados.
+
+        Retorna (adicionados, removidos).
+        """
+        wanted: Dict[str, CompiledJob] = {}
+        for day, jobs in schedule.items():
+            for job in jobs:
+                compiled = CompiledJob.build(day, job)
+                wanted.setdefault(compiled.key, compiled)
+        kept = [entry for entry in self._heap if entry.compiled.key in wanted]
+        removed = len(self._heap) - len(kept)
+        present = {entry.compiled.key for entry in kept}
+        self._heap = kept
+        heapq.heapify(self._heap)
+        added = 0
+        for key, compiled in wanted.items():
+            if key not in present:
+                self.add(compiled, now)
+                added += 1
+        return added, removed
+
+    def peek(self) -> Optional[Tuple[JobSettings, datetime]]:
+        """Proximo job e horario, sem remover."""
+        if not self._heap:
+            return None
+        entry = self._heap[0]
+        return entry.compiled.job, entry.fire_at
+
+    def pop_due(self, now: datetime) -> List[Firing]:
+        """Remove os disparos vencidos ate `now`, rearmando cada job uma vez."""
+        now_ts = now.timestamp()
+        due: List[Firing] = []
+        while self._heap and self._heap[0].fire_ts <= now_ts:
+            entry = heapq.heappop(self._heap)
+            late = now_ts - entry.fire_ts
+            due.append(
+                Firing(
+                    job=entry.compiled.job,
+                    day=entry.compiled.day,
+                    fire_at=entry.fire_at,
+                    late_seconds=late,
+                    misfired=late > self.grace_seconds,
+                )
+            )
+            self.add(entry.compiled, now)
+        return [firing for firing in due if self._should_run(firing)]
+
+    def _should_run(self, firing: Firing) -> bool:
+        """Aplica a politica de misfire."""
+        if not firing.misfired:
+            return True
+        if self.misfire_policy == "skip":
+            logger.warning(
+                "⏭️ Disparo de %s %s perdido ha %ss, pulando", firing.day, firing.job.time, int(firing.late_seconds)
+            )
+            return False
+        logger.warning(
+            "⏰ Disparo de %s %s atrasado %ss, executando uma vez",
+            firing.day,
+            firing.job.time,
+            int(firing.late_seconds),
+        )
+        return True
@@ -1,35 +1,129 @@
 from __future__ import annotations
 
-import subprocess
+import hashlib
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Collection, Dict, Iterator, List, Optional, Sequence, Set, Tuple
 
+from src.executor import SolutionExecutor
 from src.git_client import GitClient
 from src.providers.base import Problem
-from src.providers.codeforces import CodeforcesProvider
+from src.providers.base import ProblemProvider
+from src.providers.registry import ProviderRegistry
+from src.push_queue import PushQueue
 from src.repo_writer import RepoWriter
+from src.schedule import CompiledSchedule
 from src.settings import JobSettings, Settings
-from src.solver.template_solver import TemplateSolver
-from src.state_store import StateStore
-from src.utils.logger import get_logger
-from src.utils.time import WEEKDAYS, next_datetime_for, now_in_tz
+from src.settings_watcher import SettingsWatcher
+from src.solver.base import Solver
+from src.state_store import StateBackend, job_key
+from src.test_runner import TestReport, TestRunner
+from src.utils.logger import get_logger, log_context
+from src.utils.metrics import JOB_SECONDS, JOBS_TOTAL, RETRIES_TOTAL, STAGE_SECONDS, MetricsServer, get_metrics
+from src.utils.time import WEEKDAYS, now_in_tz
 
 
 logger = get_logger("scheduler")
 
 
+# Etapas de um job, na ordem em que sao registradas no checkpoint.
+STAGES = ("selected", "generated", "written", "tested", "committed", "pushed")
+
+# Desafios por commit no backfill quando --chunk-size nao e informado.
+BACKFILL_CHUNK_SIZE = 25
+
+
+def job_id(key: str) -> str:
+    """Id curto do job para os logs (prefixo do sha1 da chave canonica)."""
+    return hashlib.sha1(key.encode("utf-8")).hexdigest()[:10]
+
+
+@contextmanager
+def track_stage(name: str) -> Iterator[None]:
+    """Marca os logs do bloco com a etapa e registra a duracao na metrica."""
+    with log_context(stage=name), get_metrics().timer(STAGE_SECONDS, stage=name):
+        yield
+
+
+@dataclass
+class BatchReport:
+    """Resultado de um lote: ids concluidos e erros."""
+    completed: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+
+
+def backfill_id(job: JobSettings, count: int) -> str:
+    """Id estavel de um backfill, para retomar apos interrupcao."""
+    digest = hashlib.sha1(f"{job_key(job.model_dump())}|{count}".encode("utf-8")).hexdigest()
+    return f"backfill-{digest[:10]}"
+
+
+def stage_pending(checkpoint: dict, stage: str) -> bool:
+    """True se o checkpoint ainda nao passou de `stage`."""
+    return STAGES.index(checkpoint["stage"]) < STAGES.index(stage)
+
+
+def _batch_key(batch_id: str) -> str:
+    """Chave do checkpoint com as pastas pendentes de um lote."""
+    return f"batch:{batch_id}"
+
+
 @dataclass
 class Scheduler:
     """Agenda e executa jobs com base no settings.json."""
     settings: Settings
-    state_store: StateStore
-    provider: CodeforcesProvider
-    solver: TemplateSolver
+    state_store: StateBackend
+    provider: ProblemProvider
+    solver: Solver
     writer: RepoWriter
     git_client: GitClient
+    test_runner: Optional[TestRunner] = None
+    executor: Optional[SolutionExecutor] = None
+    push_queue: Optional[PushQueue] = None
+    settings_watcher: Optional[SettingsWatcher] = None
+    providers: Optional[ProviderRegistry] = None
+    metrics_server: Optional[MetricsServer] = None
+    _schedule: Optional[CompiledSchedule] = field(default=None, init=False, repr=False)
+    _selection_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _stage_limits: Dict[str, threading.BoundedSemaphore] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.providers is None:
+            self.providers = ProviderRegistry({self.provider.source: self.provider})
+        if self.test_runner is None:
+            self.test_runner = TestRunner(
+                cwd=Path(self.settings.repo_path),
+                mode=self.settings.tests.mode,
+                timeout_seconds=self.settings.tests.timeout_seconds,
+                workers=self.settings.tests.workers,
+            )
+        if self.executor is None:
+            self.executor = SolutionExecutor(
+                time_limit_seconds=self.settings.execution.time_limit_seconds,
+                memory_limit_mb=self.settings.execution.memory_limit_mb,
+            )
+
+    def close(self) -> None:
+        """Libera os pools (testes, providers), o endpoint de metricas e tenta esvaziar a fila de push."""
+        if self.push_queue is not None:
+            self.push_queue.stop(flush_timeout=self.settings.push.flush_timeout_seconds)
+        if self.test_runner is not None:
+            self.test_runner.close()
+        if self.providers is not None:
+            self.providers.close()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
+
+    def flush_metrics(self) -> None:
+        """Acrescenta um snapshot das metricas ao JSONL configurado (se houver)."""
+        path = self.settings.metrics.jsonl_path
+        if path:
+            get_metrics().write_jsonl(Path(self.settings.repo_path) / path)
 
     def run_once(self, job: Optional[JobSettings] = None) -> None:
         """Executa um unico job imediatamente."""
@@ -40,12 +134,102 @@ class Scheduler:
     def run_scheduler(self) -> None:
         """Loop infinito que aguarda o proximo horario agendado."""
         logger.info("🕒 Iniciando loop de scheduler")
+        self._schedule = self._compile_schedule()
+        for job, firing in self.interrupted_jobs():
+            self._execute_job(job, firing=firing)
         while True:
-            next_job, next_time = self._get_next_job()
-            wait_seconds = max(0, (next_time - now_in_tz(self.settings.timezone)).total_seconds())
-            logger.info(f"⏳ Proximo job em {int(wait_seconds)}s ({next_time.isoformat()})")
-            time.sleep(wait_seconds)
-            self._execute_job(next_job)
+            _, next_time = self._schedule.peek()
+            wait_seconds = max(0, next_time.timestamp() - time.time())
+            logger.info("⏳ Proximo job em %ss (%s)", int(wait_seconds), next_time.isoformat())
+            if not self._sleep_until(next_time):
+                continue
+            for firing in self._schedule.pop_due(now_in_tz(self.settings.timezone)):
+                self._execute_job(firing.job, firing=firing.fire_at.isoformat())
+
+    def run_batch(
+        self,
+        jobs: Sequence[JobSettings],
+        chunk_size: int = 1,
+        batch_id: Optional[str] = None,
+    ) -> BatchReport:
+        """Executa varios jobs em paralelo; git fica serializado neste thread."""
+        logger.info("🚀 Rodando lote com %s jobs", len(jobs))
+        self.state_store.load()
+        reserved = set(self.state_store.used_ids())
+        report = BatchReport()
+        pending: List[Tuple[JobSettings, Problem, Path]] = []
+        with ThreadPoolExecutor(max_workers=self.settings.pipeline.max_workers) as pool:
+            futures = {pool.submit(self._prepare_with_retries, job, reserved): job for job in jobs}
+            for future in as_completed(futures):
+                job = futures[future]
+                try:
+                    problem, challenge_dir = future.result()
+                except Exception as exc:  # noqa: BLE001
+                    logger.error("🚨 Job do lote falhou: %s", exc)
+                    get_metrics().inc(JOBS_TOTAL, status="failed")
+                    self.record_failure(job, exc)
+                    report.failed.append(str(exc))
+                    continue
+                pending.append((job, problem, challenge_dir))
+                if len(pending) >= chunk_size:
+                    self._commit_chunk(pending, report, batch_id)
+                    pending = []
+                self._track_pending(batch_id, pending)
+        if pending:
+            self._commit_chunk(pending, report, batch_id)
+        if batch_id:
+            self.state_store.clear_checkpoint(_batch_key(batch_id))
+        if report.completed:
+            with track_stage("push"):
+                self._push()
+        logger.info("✅ Lote finalizado: %s ok, %s falhas", len(report.completed), len(report.failed))
+        self.flush_metrics()
+        return report
+
+    def run_backfill(
+        self,
+        job: JobSettings,
+        count: int,
+        chunk_size: Optional[int] = None,
+        batch_id: Optional[str] = None,
+    ) -> BatchReport:
+        """Gera `count` desafios do job em commits agrupados; retoma de onde parou.
+
+        Pastas prontas mas nao commitadas por uma execucao interrompida sao removidas antes de retomar.
+        """
+        batch_id = batch_id or backfill_id(job, count)
+        self.state_store.load()
+        self._discard_pending(batch_id)
+        done = self.state_store.completed_in_batch(batch_id)
+        remaining = max(0, count - done)
+        logger.info("📚 Backfill %s: %s/%s concluidos, gerando %s", batch_id, done, count, remaining)
+        if not remaining:
+            return BatchReport()
+        return self.run_batch([job] * remaining, chunk_size=chunk_size or BACKFILL_CHUNK_SIZE, batch_id=batch_id)
+
+    def _track_pending(self, batch_id: Optional[str], pending: List[Tuple[JobSettings, Problem, Path]]) -> None:
+        """Registra no state store as pastas do lote ainda nao commitadas."""
+        if not batch_id:
+            return
+        self.state_store.save_checkpoint(
+            _batch_key(batch_id),
+            {
+                "stage": "tested",
+                "pending": [str(challenge_dir) for _, _, challenge_dir in pending],
+                "updated_at": datetime.now().isoformat(),
+            },
+        )
+
+    def _discard_pending(self, batch_id: str) -> None:
+        """Remove as pastas nao commitadas de uma execucao interrompida do lote."""
+        checkpoint = self.state_store.get_checkpoint(_batch_key(batch_id))
+        if checkpoint is None:
+            return
+        for raw in checkpoint.get("pending", []):
+            challenge_dir = Path(raw)
+            if challenge_dir.exists() and self.git_client.has_changes([challenge_dir]):
+                self.writer.discard(challenge_dir)
+        self.state_store.clear_checkpoint(_batch_key(batch_id))
 
     def _pick_first_job(self) -> JobSettings:
         """Seleciona o primeiro job configurado."""
@@ -54,80 +238,382 @@ class Scheduler:
                 return self.settings.schedule[day][0]
         raise RuntimeError("Nenhum job encontrado no schedule")
 
-    def _get_next_job(self) -> Tuple[JobSettings, datetime]:
-        """Calcula o proximo job e horario futuro."""
-        now = now_in_tz(self.settings.timezone)
-        candidates: list[tuple[JobSettings, datetime]] = []
-        for day, jobs in self.settings.schedule.items():
-            for job in jobs:
-                run_at = next_datetime_for(day, job.time, self.settings.timezone, now)
-                candidates.append((job, run_at))
-        candidates.sort(key=lambda item: item[1])
-        return candidates[0]
-
-    def _execute_job(self, job: JobSettings) -> None:
-        """Executa o fluxo completo: provider, solver, testes e git."""
+    def _compile_schedule(self) -> CompiledSchedule:
+        """Monta o heap de disparos a partir do settings."""
+        return CompiledSchedule.compile(
+            self.settings.schedule,
+            self.settings.timezone,
+            now_in_tz(self.settings.timezone),
+            misfire_policy=self.settings.scheduler.misfire_policy,
+            grace_seconds=self.settings.scheduler.misfire_grace_seconds,
+        )
+
+    def _sleep_until(self, target: datetime) -> bool:
+        """Dorme em fatias curtas medindo o relogio real (resiste a suspensao e ajuste de hora).
+
+        Retorna False se o schedule foi recarregado durante a espera.
+        """
+        while True:
+            remaining = target.timestamp() - time.time()
+            if remaining <= 0:
+                return True
+            slice_seconds = min(remaining, self.settings.scheduler.max_sleep_seconds)
+            if self.settings_watcher is not None:
+                slice_seconds = min(slice_seconds, self.settings.scheduler.reload_interval_seconds)
+            time.sleep(slice_seconds)
+            if self.reload_settings():
+                return False
+
+    def reload_settings(self) -> bool:
+        """Aplica um settings.json alterado; so os jobs modificados sao recalculados."""
+        if self.settings_watcher is None:
+            return False
+        new_settings = self.settings_watcher.poll()
+        if new_settings is None:
+            return False
+        previous, self.settings = self.settings, new_settings
+        if self._schedule is None:
+            return True
+        if (
+            new_settings.timezone != previous.timezone
+            or new_settings.scheduler != previous.scheduler
+        ):
+            self._schedule = self._compile_schedule()
+            logger.info("🔄 Schedule recompilado (%s jobs)", len(self._schedule))
+            return True
+        added, removed = self._schedule.update(new_settings.schedule, now_in_tz(new_settings.timezone))
+        logger.info("🔄 Schedule atualizado: %s jobs novos/alterados, %s removidos", added, removed)
+        return True
+
+    def _execute_job(self, job: JobSettings, firing: Optional[str] = None) -> None:
+        """Executa o fluxo completo: provider, solver, testes e git.
+
+        `firing` identifica o disparo (horario previsto; None em execucoes manuais); um
+        checkpoint ja commitado por outro disparo do mesmo job e encerrado antes de comecar,
+        e um interrompido antes do commit e retomado com o mesmo problema.
+        """
+        key = self.begin_job(job, firing)
+        used = self.state_store.used_ids()
+        metrics = get_metrics()
+        try:
+            with log_context(job=job_id(key)), metrics.timer(JOB_SECONDS):
+                for attempt in range(self.settings.max_retries + 1):
+                    try:
+                        problem = self._run_stages(job, key, used, firing)
+                        self.finish_job(key, problem)
+                        metrics.inc(JOBS_TOTAL, status="ok")
+                        logger.info("✅ Job finalizado com sucesso")
+                        return
+                    except Exception as exc:  # noqa: BLE001
+                        if attempt < self.settings.max_retries:
+                            self._backoff(attempt)
+                            continue
+                        logger.error("🚨 Job falhou: %s", exc)
+                        metrics.inc(JOBS_TOTAL, status="failed")
+                        self.record_failure(job, exc)
+                        self.abandon_job(key)
+        finally:
+            self.flush_metrics()
+
+    def _run_stages(
+        self,
+        job: JobSettings,
+        key: str,
+        used: Collection[str],
+        firing: Optional[str] = None,
+    ) -> Problem:
+        """Executa somente as etapas pendentes, retomando do checkpoint com o mesmo problema."""
+        checkpoint = self.select_stage(job, key, used, firing=firing)
+        problem = Problem.from_dict(checkpoint["problem"])
+        with log_context(problem_id=problem.problem_id):
+            if stage_pending(checkpoint, "written"):
+                checkpoint = self.generate_stage(job, key, checkpoint)
+            challenge_dir = Path(checkpoint["challenge_dir"])
+            if stage_pending(checkpoint, "tested"):
+                with self._stage("test"):
+                    self._run_tests(challenge_dir)
+                    self.run_benchmark(challenge_dir)
+                checkpoint = self.advance(key, checkpoint, "tested")
+            if stage_pending(checkpoint, "committed"):
+                if self.needs_commit(checkpoint):
+                    with track_stage("commit"):
+                        self._commit(job, problem, challenge_dir)
+                checkpoint = self.advance(key, checkpoint, "committed")
+            if stage_pending(checkpoint, "pushed"):
+                with track_stage("push"):
+                    self._push()
+                self.advance(key, checkpoint, "pushed")
+        return problem
+
+    def interrupted_jobs(self) -> List[Tuple[JobSettings, Optional[str]]]:
+        """Jobs do schedule com checkpoint pendente (crash ou restart), com o disparo original."""
+        self.state_store.load()
+        found: Dict[str, Tuple[JobSettings, Optional[str]]] = {}
+        for day in WEEKDAYS:
+            for job in self.settings.schedule.get(day, []):
+                key = job_key(job.model_dump())
+                checkpoint = self.state_store.get_checkpoint(key)
+                if checkpoint is not None and key not in found:
+                    found[key] = (job, checkpoint.get("firing"))
+        return list(found.values())
+
+    def begin_job(self, job: JobSettings, firing: Optional[str] = None) -> str:
+        """Recarrega o historico e devolve a chave do job.
+
+        Um checkpoint de outro disparo ja commitado e encerrado (o proximo push o envia);
+        um interrompido antes do commit e mantido para ser retomado com o mesmo problema.
+        """
         self.state_store.load()
-        used = [item["problem_id"] for item in self.state_store.data.get("completed", [])]
-        last_error: Exception | None = None
-        for attempt in range(self.settings.max_retries + 1):
-            try:
-                problem = self.provider.fetch_problem(
-                    difficulty=job.difficulty,
-                    rating_range=job.rating_range,
-                    tags=job.tags,
-                    used_ids=used,
-                )
-                artifacts = self.solver.generate(problem, job.language)
-                challenge_dir = self.writer.write_problem(problem, artifacts, self.settings.timezone)
+        key = job_key(job.model_dump())
+        checkpoint = self.state_store.get_checkpoint(key)
+        if checkpoint is None or checkpoint.get("firing") == firing:
+            return key
+        problem = Problem.from_dict(checkpoint["problem"])
+        if not stage_pending(checkpoint, "committed"):
+            logger.info("♻️ %s ja commitado por um disparo anterior; o proximo push o envia", problem.problem_id)
+            self.finish_job(key, problem)
+        else:
+            logger.info("♻️ Retomando %s interrompido no disparo %s", problem.problem_id, checkpoint.get("firing"))
+        return key
+
+    def select_stage(
+        self,
+        job: JobSettings,
+        key: str,
+        used: Collection[str],
+        reserved: Optional[Set[str]] = None,
+        firing: Optional[str] = None,
+    ) -> dict:
+        """Etapa select: retoma o checkpoint do job ou escolhe um problema e grava o checkpoint."""
+        checkpoint = self.state_store.get_checkpoint(key)
+        if checkpoint is not None:
+            problem = Problem.from_dict(checkpoint["problem"])
+            logger.info("♻️ Retomando %s apos a etapa %s", problem.problem_id, checkpoint["stage"])
+            return checkpoint
+        with track_stage("select"):
+            problem = self._select(job, used, reserved)
+        return self._checkpoint(key, "selected", problem, firing=firing)
+
+    def generate_stage(self, job: JobSettings, key: str, checkpoint: dict) -> dict:
+        """Etapas solve e write; devolve o checkpoint `written` com a pasta publicada (sem indice)."""
+        problem = Problem.from_dict(checkpoint["problem"])
+        with self._stage("solve"):
+            artifacts = self.solver.generate(problem, job.language)
+        checkpoint = self.advance(key, checkpoint, "generated")
+        with self._stage("write"):
+            challenge_dir = self.writer.write_problem(
+                problem, artifacts, self.settings.timezone, update_index=False
+            )
+        return self.advance(key, checkpoint, "written", challenge_dir)
+
+    def advance(self, key: str, checkpoint: dict, stage: str, challenge_dir: Optional[Path] = None) -> dict:
+        """Marca `stage` como concluida, mantendo problema, pasta e disparo do checkpoint."""
+        if challenge_dir is None and checkpoint.get("challenge_dir"):
+            challenge_dir = Path(checkpoint["challenge_dir"])
+        problem = Problem.from_dict(checkpoint["problem"])
+        return self._checkpoint(key, stage, problem, challenge_dir, checkpoint.get("firing"))
+
+    def needs_commit(self, checkpoint: dict) -> bool:
+        """False quando um commit anterior ja levou a pasta (crash entre o commit e o checkpoint)."""
+        paths = [Path(checkpoint["challenge_dir"]), *self.writer.index_paths]
+        return self.git_client.has_changes(paths)
+
+    def finish_job(self, key: str, problem: Problem) -> None:
+        """Registra o desafio no historico e remove o checkpoint (apos o push)."""
+        self.record_completion(problem)
+        self.state_store.clear_checkpoint(key)
+
+    def abandon_job(self, key: str) -> None:
+        """Descarta o checkpoint de um job que falhou antes do commit, com a pasta escrita."""
+        checkpoint = self.state_store.get_checkpoint(key)
+        if checkpoint is None or not stage_pending(checkpoint, "committed"):
+            return
+        if checkpoint.get("challenge_dir"):
+            self.writer.discard(Path(checkpoint["challenge_dir"]))
+        self.state_store.clear_checkpoint(key)
+
+    def _checkpoint(
+        self,
+        key: str,
+        stage: str,
+        problem: Problem,
+        challenge_dir: Optional[Path] = None,
+        firing: Optional[str] = None,
+    ) -> dict:
+        """Persiste a ultima etapa concluida do job."""
+        record = {
+            "stage": stage,
+            "problem": asdict(problem),
+            "challenge_dir": str(challenge_dir) if challenge_dir else None,
+            "firing": firing,
+            "updated_at": datetime.now().isoformat(),
+        }
+        self.state_store.save_checkpoint(key, record)
+        return record
+
+    def _prepare_with_retries(self, job: JobSettings, reserved: Set[str]) -> Tuple[Problem, Path]:
+        """Roda selecao, geracao, escrita e testes com o retry do settings (mesmo problema nos retries)."""
+        problem: Optional[Problem] = None
+        with log_context(job=job_id(job_key(job.model_dump()))):
+            for attempt in range(self.settings.max_retries + 1):
+                try:
+                    if problem is None:
+                        with track_stage("select"):
+                            problem = self._select(job, reserved, reserved)
+                    with log_context(problem_id=problem.problem_id):
+                        return problem, self._prepare(job, problem)
+                except Exception:  # noqa: BLE001
+                    if attempt >= self.settings.max_retries:
+                        raise
+                    self._backoff(attempt)
+
+    def _prepare(self, job: JobSettings, problem: Problem) -> Path:
+        """Etapas sem git: gera, escreve e testa o desafio; remove a pasta se falhar."""
+        with self._stage("solve"):
+            artifacts = self.solver.generate(problem, job.language)
+        with self._stage("write"):
+            challenge_dir = self.writer.write_problem(
+                problem, artifacts, self.settings.timezone, update_index=False
+            )
+        try:
+            with self._stage("test"):
                 self._run_tests(challenge_dir)
-                self.git_client.add_all()
-                commit_msg = self._format_commit_message(job, problem)
+                self.run_benchmark(challenge_dir)
+        except BaseException:
+            self.writer.discard(challenge_dir)
+            raise
+        return challenge_dir
+
+    def _select(
+        self,
+        job: JobSettings,
+        used: Collection[str],
+        reserved: Optional[Set[str]] = None,
+    ) -> Problem:
+        """Seleciona um problema; com `reserved`, reserva o id para jobs concorrentes."""
+        with self._selection_lock:
+            problem = self.providers.fetch_problem(
+                difficulty=job.difficulty,
+                rating_range=job.rating_range,
+                tags=job.tags,
+                used_ids=used,
+                providers=job.providers,
+                budget_seconds=self.settings.provider_budget_seconds,
+            )
+            if reserved is not None:
+                reserved.add(problem.problem_id)
+        return problem
+
+    def _commit_chunk(
+        self,
+        items: List[Tuple[JobSettings, Problem, Path]],
+        report: BatchReport,
+        batch_id: Optional[str],
+    ) -> None:
+        """Commita um grupo de desafios prontos e registra cada um no historico."""
+        paths = [challenge_dir for _, _, challenge_dir in items] + self.writer.index_paths
+        metrics = get_metrics()
+        try:
+            with track_stage("commit"):
+                self.writer.update_index([(problem, challenge_dir) for _, problem, challenge_dir in items])
+                self.git_client.add_paths(paths)
+                if len(items) == 1:
+                    job, problem, _ = items[0]
+                    commit_msg = self.commit_message(job, problem)
+                else:
+                    commit_msg = f"chore(cf): add {len(items)} challenges ({batch_id or 'batch'})"
                 self.git_client.commit(commit_msg)
-                self.git_client.push()
-                self.state_store.mark_completed(
-                    {
-                        "problem_id": problem.problem_id,
-                        "source": problem.source,
-                        "contest_id": problem.contest_id,
-                        "index": problem.index,
-                        "slug": problem.slug,
-                        "timestamp": datetime.now().isoformat(),
-                    }
-                )
-                logger.info("✅ Job finalizado com sucesso")
-                return
-            except Exception as exc:  # noqa: BLE001
-                last_error = exc
-                if attempt < self.settings.max_retries:
-                    wait_seconds = self.settings.backoff_seconds * (2**attempt)
-                    logger.warning(f"⚠️ Tentativa {attempt + 1} falhou, retry em {wait_seconds}s")
-                    time.sleep(wait_seconds)
-                    continue
-                logger.error(f"🚨 Job falhou: {exc}")
-                self.state_store.mark_failed(
-                    {
-                        "timestamp": datetime.now().isoformat(),
-                        "error": str(exc),
-                        "job": job.model_dump(),
-                    }
-                )
-        return
+        except Exception as exc:  # noqa: BLE001
+            logger.error("🚨 Commit do lote falhou: %s", exc)
+            for job, _, _ in items:
+                self.record_failure(job, exc)
+                report.failed.append(str(exc))
+            metrics.inc(JOBS_TOTAL, len(items), status="failed")
+            return
+        for _, problem, _ in items:
+            self.record_completion(problem, batch_id=batch_id)
+            report.completed.append(problem.problem_id)
+        metrics.inc(JOBS_TOTAL, len(items), status="ok")
+
+    def _commit(self, job: JobSettings, problem: Problem, challenge_dir: Path) -> None:
+        """Atualiza o indice, faz stage e commit local; no modo plumbing, somente os arquivos gerados."""
+        self.writer.update_index([(problem, challenge_dir)])
+        if self.git_client.mode == "plumbing":
+            self.git_client.add_paths([challenge_dir, *self.writer.index_paths])
+        else:
+            self.git_client.add_all()
+        commit_msg = self.commit_message(job, problem)
+        self.git_client.commit(commit_msg)
+
+    def _push(self) -> None:
+        """Envia os commits: direto ou via fila em background (fora do retry do job)."""
+        if self.push_queue is not None:
+            self.push_queue.enqueue()
+            return
+        self.git_client.push()
+
+    def record_completion(self, problem: Problem, batch_id: Optional[str] = None) -> None:
+        """Registra o desafio concluido no historico."""
+        record = {
+            "problem_id": problem.problem_id,
+            "source": problem.source,
+            "contest_id": problem.contest_id,
+            "index": problem.index,
+            "slug": problem.slug,
+            "timestamp": datetime.now().isoformat(),
+        }
+        if batch_id:
+            record["batch"] = batch_id
+        self.state_store.mark_completed(record)
+
+    def record_failure(self, job: JobSettings, exc: Exception) -> None:
+        """Registra a falha definitiva de um job."""
+        self.state_store.mark_failed(
+            {
+                "timestamp": datetime.now().isoformat(),
+                "error": str(exc),
+                "job": job.model_dump(),
+            }
+        )
+
+    def _backoff(self, attempt: int) -> None:
+        """Espera exponencial entre tentativas."""
+        wait_seconds = self.settings.backoff_seconds * (2**attempt)
+        logger.warning("⚠️ Tentativa %s falhou, retry em %ss", attempt + 1, wait_seconds)
+        get_metrics().inc(RETRIES_TOTAL)
+        time.sleep(wait_seconds)
+
+    @contextmanager
+    def _stage(self, name: str) -> Iterator[None]:
+        """Limita a concorrencia de uma etapa conforme settings.pipeline."""
+        semaphore = self._stage_limits.get(name)
+        if semaphore is None:
+            limit = getattr(self.settings.pipeline, f"{name}_concurrency")
+            semaphore = self._stage_limits.setdefault(name, threading.BoundedSemaphore(limit))
+        with semaphore, track_stage(name):
+            yield
 
     def _run_tests(self, challenge_dir: Path) -> None:
         """Roda pytest somente no diretorio do desafio."""
         logger.info("🧪 Rodando testes pytest")
-        result = subprocess.run(
-            ["pytest", str(challenge_dir)],
-            capture_output=True,
-            text=True,
-            check=False,
-            cwd=self.settings.repo_path,
-        )
-        if result.returncode != 0:
-            raise RuntimeError(f"pytest falhou:\n{result.stdout}\n{result.stderr}")
+        self.check_tests(self.test_runner.run(challenge_dir))
+
+    def check_tests(self, report: TestReport) -> None:
+        """Loga o resumo e falha o job se o pytest nao passou."""
+        logger.info("🧪 %s", report.summary())
+        if not report.ok:
+            raise RuntimeError(f"pytest falhou ({report.summary()}):\n{report.output}")
+
+    def run_benchmark(self, challenge_dir: Path) -> None:
+        """Mede a solucao nos exemplos e falha se estourar tempo/memoria."""
+        if not self.settings.execution.enabled:
+            return
+        report = self.executor.benchmark(challenge_dir)
+        if report.exceeded:
+            details = ", ".join(f"{case.name}={case.status}" for case in report.exceeded)
+            raise RuntimeError(f"Solucao excedeu os limites configurados: {details}")
 
-    def _format_commit_message(self, job: JobSettings, problem: Problem) -> str:
+    def commit_message(self, job: JobSettings, problem: Problem) -> str:
         """Renderiza a mensagem de commit conforme template."""
         template = job.commit_message_template or "chore(cf): add {slug}"
         return template.format(
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List, Optional, Tuple
-from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Dict, List, Literal, Optional, Tuple
+import re
+
+from pydantic import BaseModel, Field, field_validator, model_serializer, model_validator
 
 
 class JobSettings(BaseModel):
@@ -10,8 +12,9 @@ class JobSettings(BaseModel):
     difficulty: Optional[str] = Field(default=None, description="easy|medium|hard")
     rating_range: Optional[Tuple[int, int]] = None
     tags: Optional[List[str]] = None
-    language: str = Field(default="python")
+    language: Literal["python", "cpp", "java", "go"] = Field(default="python")
     commit_message_template: Optional[str] = None
+    providers: Optional[List[str]] = Field(default=None, description="Providers consultados (padrao: o primeiro)")
 
     @field_validator("time")
     @classmethod
@@ -32,15 +35,158 @@ class JobSettings(BaseModel):
             raise ValueError("job must set difficulty or rating_range")
         return self
 
+    @model_serializer(mode="wrap")
+    def omit_default_providers(self, handler):
+        """Sem `providers`, o dump fica igual ao anterior (mantem job_key/backfill_id)."""
+        data = handler(self)
+        if data.get("providers") is None:
+            data.pop("providers", None)
+        return data
+
+
+class ProviderSettings(BaseModel):
+    """Um provider do registry: API do Codeforces, dump JSON local ou diretorio."""
+    type: Literal["codeforces", "local_json", "directory"] = "codeforces"
+    path: Optional[str] = None
+    url: Optional[str] = None
+    source: Optional[str] = None
+    url_template: Optional[str] = None
+
+    @model_validator(mode="after")
+    def validate_path(self):
+        if self.type != "codeforces" and not self.path:
+            raise ValueError(f"provider {self.type} requires path")
+        return self
+
+
+class PipelineSettings(BaseModel):
+    """Limites de concorrencia do modo em lote."""
+    max_workers: int = Field(default=4, ge=1)
+    solve_concurrency: int = Field(default=4, ge=1)
+    write_concurrency: int = Field(default=2, ge=1)
+    test_concurrency: int = Field(default=2, ge=1)
+
+
+class TestRunnerSettings(BaseModel):
+    """Como os testes de cada desafio sao executados."""
+    mode: Literal["subprocess", "inprocess"] = "inprocess"
+    workers: int = Field(default=2, ge=1)
+    timeout_seconds: float = Field(default=120.0, gt=0)
+
+
+class ExecutionSettings(BaseModel):
+    """Limites do executor que mede a solucao nos exemplos."""
+    enabled: bool = True
+    time_limit_seconds: float = Field(default=2.0, gt=0)
+    memory_limit_mb: int = Field(default=256, ge=16)
+
+
+class PushSettings(BaseModel):
+    """Push sincrono ou via fila em background."""
+    mode: Literal["sync", "background"] = "sync"
+    backoff_seconds: float = Field(default=5.0, ge=0)
+    max_backoff_seconds: float = Field(default=300.0, ge=0)
+    flush_timeout_seconds: float = Field(default=60.0, ge=0)
+
+
+class WriterSettings(BaseModel):
+    """Politica de durabilidade da escrita dos desafios."""
+    fsync: Literal["none", "files", "full"] = "none"
+
+
+class SchedulerSettings(BaseModel):
+    """Comportamento do loop agendado."""
+    misfire_policy: Literal["run_once", "skip"] = "run_once"
+    misfire_grace_seconds: float = Field(default=300.0, ge=0)
+    max_sleep_seconds: float = Field(default=60.0, gt=0)
+    reload: bool = True
+    reload_interval_seconds: float = Field(default=5.0, gt=0)
+
+
+class HttpSettings(BaseModel):
+    """Cliente HTTP da API: rate limit e circuit breaker."""
+    timeout_seconds: float = Field(default=30.0, gt=0)
+    rate_per_second: float = Field(default=0.5, gt=0)
+    burst: int = Field(default=1, ge=1)
+    failure_threshold: int = Field(default=5, ge=1)
+    reset_seconds: float = Field(default=60.0, ge=0)
+    pool_size: int = Field(default=4, ge=1)
+
+
+class StatementSettings(BaseModel):
+    """Exemplos extraidos da pagina do problema (cache em <cache_dir>/statements)."""
+    enabled: bool = True
+
+
+class MetricsSettings(BaseModel):
+    """Metricas de etapas, caches e HTTP (Prometheus em /metrics e/ou arquivo JSONL)."""
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: Optional[int] = Field(default=None, ge=0, le=65535)
+    jsonl_path: Optional[str] = None
+
+
+class LoggingSettings(BaseModel):
+    """Logs via fila: nivel (AUTOFEEDR_LOG_LEVEL tem precedencia), formato e arquivo rotativo."""
+    level: str = "INFO"
+    format: Literal["text", "json"] = "text"
+    file: Optional[str] = None
+    max_bytes: int = Field(default=10 * 1024 * 1024, ge=1024)
+    backup_count: int = Field(default=5, ge=0)
+
+    @field_validator("level")
+    @classmethod
+    def validate_level(cls, value: str) -> str:
+        if value.upper() not in ("DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"):
+            raise ValueError(f"nivel de log invalido: {value}")
+        return value.upper()
+
+
+class SolverSettings(BaseModel):
+    """Gerador da solucao: templates baseline ou backend de LLM com cache de respostas."""
+    backend: Literal["template", "stub"] = "template"
+    model: Optional[str] = None
+    max_in_flight: int = Field(default=2, ge=1)
+    timeout_seconds: float = Field(default=120.0, gt=0)
+    stub_latency_seconds: float = Field(default=0.0, ge=0)
+
+
+class RuntimeSettings(BaseModel):
+    """Runtime do modo agendado (sincrono ou asyncio) e endpoint de status."""
+    mode: Literal["sync", "async"] = "sync"
+    max_concurrent_jobs: int = Field(default=2, ge=1)
+    status_host: str = "127.0.0.1"
+    status_port: Optional[int] = Field(default=None, ge=0, le=65535)
+
 
 class Settings(BaseModel):
     """Config principal do sistema."""
     repo_path: str
     git_remote: Optional[str] = None
     git_branch: str = "main"
+    git_mode: Literal["porcelain", "plumbing"] = "porcelain"
     timezone: str = "America/Sao_Paulo"
     max_retries: int = 2
     backoff_seconds: int = 10
+    cache_dir: str = ".cache"
+    problemset_cache_ttl_seconds: int = 3600
+    state_backend: Literal["jsonl", "sqlite"] = "jsonl"
+    pipeline: PipelineSettings = Field(default_factory=PipelineSettings)
+    tests: TestRunnerSettings = Field(default_factory=TestRunnerSettings)
+    execution: ExecutionSettings = Field(default_factory=ExecutionSettings)
+    push: PushSettings = Field(default_factory=PushSettings)
+    writer: WriterSettings = Field(default_factory=WriterSettings)
+    scheduler: SchedulerSettings = Field(default_factory=SchedulerSettings)
+    runtime: RuntimeSettings = Field(default_factory=RuntimeSettings)
+    http: HttpSettings = Field(default_factory=HttpSettings)
+    solver: SolverSettings = Field(default_factory=SolverSettings)
+    statements: StatementSettings = Field(default_factory=StatementSettings)
+    metrics: MetricsSettings = Field(default_factory=MetricsSettings)
+    logging: LoggingSettings = Field(default_factory=LoggingSettings)
+    providers: Dict[str, ProviderSettings] = Field(
+        default_factory=lambda: {"codeforces": ProviderSettings(type="codeforces")}
+    )
+    provider_budget_seconds: float = Field(default=10.0, gt=0)
     schedule: Dict[str, List[JobSettings]]
 
     @field_validator("schedule")
@@ -51,6 +197,21 @@ class Settings(BaseModel):
             raise ValueError("schedule cannot be empty")
         return value
 
+    @model_validator(mode="after")
+    def validate_providers(self):
+        """Jobs so podem citar providers declarados; a fonte vira nome de pasta."""
+        if not self.providers:
+            raise ValueError("providers cannot be empty")
+        for name, provider in self.providers.items():
+            if not re.fullmatch(r"[a-z0-9]+", provider.source or name):
+                raise ValueError(f"provider source must be [a-z0-9]+: {provider.source or name}")
+        for jobs in self.schedule.values():
+            for job in jobs:
+                unknown = set(job.providers or ()) - set(self.providers)
+                if unknown:
+                    raise ValueError(f"unknown providers: {', '.join(sorted(unknown))}")
+        return self
+
     @classmethod
     def load(cls, path: str) -> "Settings":
         """Carrega settings.json."""
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Optional, Tuple
+
+from pydantic import ValidationError
+
+from src.settings import Settings
+from src.utils.logger import get_logger
+
+
+logger = get_logger("settings")
+
+
+# Campos usados na construcao das dependencias; mudam somente com restart.
+RESTART_FIELDS = (
+    "repo_path",
+    "git_remote",
+    "git_branch",
+    "git_mode",
+    "cache_dir",
+    "problemset_cache_ttl_seconds",
+    "state_backend",
+    "tests",
+    "execution",
+    "pipeline",
+    "push",
+    "writer",
+    "runtime",
+    "http",
+    "providers",
+    "solver",
+    "statements",
+    "metrics",
+    "logging",
+)
+
+
+@dataclass
+class SettingsWatcher:
+    """Observa o settings.json por mtime e revalida a cada alteracao."""
+    path: Path
+    current: Settings
+    _signature: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._signature = self._stat()
+
+    def poll(self) -> Optional[Settings]:
+        """Retorna o novo Settings se o arquivo mudou e e valido; senao None."""
+        signature = self._stat()
+        if signature is None or signature == self._signature:
+            return None
+        self._signature = signature
+        try:
+            loaded = Settings.load(str(self.path))
+        except (OSError, ValueError, ValidationError) as exc:
+            logger.error("🚨 settings.json invalido, mantendo config atual: %s", exc)
+            return None
+        pinned = {name: getattr(self.current, name) for name in RESTART_FIELDS}
+        changed = [name for name, value in pinned.items() if getattr(loaded, name) != value]
+        if changed:
+            logger.warning("⚠️ Campos que exigem restart foram ignorados: %s", ', '.join(changed))
+        loaded = loaded.model_copy(update=pinned)
+        if loaded == self.current:
+            return None
+        self.current = loaded
+        logger.info("🔄 settings.json recarregado")
+        return loaded
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """(mtime_ns, tamanho) do arquivo; None se nao existir."""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
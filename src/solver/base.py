@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import List, Protocol, Tuple
+
+from src.providers.base import Problem
+
+
+@dataclass
+class GeneratedArtifacts:
+    readme: str
+    solution: str
+    tests: str
+    notes: str
+    solution_filename: str = "solution.py"
+    samples: List[Tuple[str, str]] = field(default_factory=list)
+
+
+class Solver(Protocol):
+    """Contrato para geradores de artefatos de um desafio."""
+
+    def generate(self, problem: Problem, language: str) -> GeneratedArtifacts:
+        ...
+
+
+class LLMBackend(Protocol):
+    """Contrato para backends de LLM usados pelo LLMSolver."""
+    model: str
+
+    def complete(self, prompt: str, timeout: float) -> str:
+        ...
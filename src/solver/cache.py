@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Optional
+
+from src.utils.fs import atomic_write_text
+from src.utils.logger import get_logger
+
+
+logger = get_logger("solver")
+
+
+def prompt_hash(prompt: str) -> str:
+    """sha256 do prompt."""
+    return hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+
+
+def cache_key(problem_id: str, model: str, prompt_digest: str) -> str:
+    """Endereco da resposta: sha256 de problem_id, modelo e hash do prompt."""
+    return hashlib.sha256(f"{problem_id}\x00{model}\x00{prompt_digest}".encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    problem_id: str
+    model: str
+    prompt_hash: str
+    response: str
+    elapsed_seconds: float
+
+
+@dataclass
+class SolutionCache:
+    """Respostas do LLM enderecadas por conteudo, um JSON por chave (<root>/<ab>/<chave>.json)."""
+    root: Path
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Resposta gravada para a chave; entradas corrompidas contam como ausentes."""
+        path = self._path(key)
+        try:
+            with path.open("r", encoding="utf-8") as handle:
+                return CachedResponse(**json.load(handle))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, TypeError) as exc:
+            logger.warning("⚠️ Cache do solver ilegivel em %s: %s", path.name, exc)
+            return None
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Grava a resposta de forma atomica."""
+        atomic_write_text(self._path(key), json.dumps(asdict(entry), ensure_ascii=False))
+
+    def _path(self, key: str) -> Path:
+        """Arquivo da chave, particionado pelos dois primeiros caracteres."""
+        return Path(self.root) / key[:2] / f"{key}.json"
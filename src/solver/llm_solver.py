@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import re
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from src.providers.base import Problem
+from src.solver.base import GeneratedArtifacts, LLMBackend
+from src.solver.cache import CachedResponse, SolutionCache, cache_key, prompt_hash
+from src.solver.template_solver import TemplateSolver, problem_fields
+from src.utils.logger import get_logger
+from src.utils.metrics import CACHE_TOTAL, get_metrics
+
+
+logger = get_logger("solver")
+
+
+_CODE_BLOCK = re.compile(r"```[\w+#-]*[ \t]*\n(.*?)```", re.DOTALL)
+
+
+class SolverTimeoutError(TimeoutError):
+    """O backend (ou a fila de requisicoes em andamento) excedeu o timeout."""
+
+
+class LLMSolver:
+    """Gera a solucao com um backend de LLM; README, testes e notas vem dos templates.
+
+    Respostas ficam no SolutionCache, entao retries e re-execucoes nao chamam o backend
+    de novo. No maximo `max_in_flight` chamadas rodam ao mesmo tempo, e pedidos
+    simultaneos para a mesma chave esperam a primeira resposta. Com `baseline`
+    (backends placeholder, como o stub), os casos de exemplo ficam xfail.
+    """
+
+    def __init__(
+        self,
+        backend: LLMBackend,
+        cache: SolutionCache,
+        templates: Optional[TemplateSolver] = None,
+        max_in_flight: int = 2,
+        timeout_seconds: float = 120.0,
+        baseline: bool = False,
+    ) -> None:
+        self.backend = backend
+        self.cache = cache
+        self.templates = templates or TemplateSolver()
+        self.timeout_seconds = timeout_seconds
+        self.baseline = baseline
+        self._in_flight = threading.BoundedSemaphore(max_in_flight)
+        self._key_locks: Dict[str, _KeyLock] = {}
+        self._lock = threading.Lock()
+
+    def generate(self, problem: Problem, language: str) -> GeneratedArtifacts:
+        """Artefatos do template com a solucao gerada pelo backend."""
+        artifacts = self.templates.render(problem, language, baseline=self.baseline)
+        fields = {**problem_fields(problem), "language": language, "samples": format_samples(artifacts.samples)}
+        prompt = self.templates.engine.get(language).prompt.render(fields)
+        response = self._complete(problem.problem_id, prompt)
+        artifacts.solution = extract_code(response)
+        return artifacts
+
+    def _complete(self, problem_id: str, prompt: str) -> str:
+        """Resposta do cache ou do backend (com limite de concorrencia e timeout)."""
+        digest = prompt_hash(prompt)
+        key = cache_key(problem_id, self.backend.model, digest)
+        metrics = get_metrics()
+        cached = self.cache.get(key)
+        if cached is not None:
+            logger.info("♻️ Solucao de %s reaproveitada do cache (%s)", problem_id, self.backend.model)
+            metrics.inc(CACHE_TOTAL, cache="solutions", result="hit")
+            return cached.response
+        deadline = time.monotonic() + self.timeout_seconds
+        with self._key_lock(key, deadline):
+            cached = self.cache.get(key)
+            if cached is not None:
+                metrics.inc(CACHE_TOTAL, cache="solutions", result="hit")
+                return cached.response
+            metrics.inc(CACHE_TOTAL, cache="solutions", result="miss")
+            if not self._in_flight.acquire(timeout=_remaining(deadline)):
+                raise SolverTimeoutError(f"fila do solver cheia por {self.timeout_seconds:.0f}s")
+            try:
+                logger.info("🤖 Gerando solucao de %s com %s", problem_id, self.backend.model)
+                start = time.perf_counter()
+                response = self.backend.complete(prompt, timeout=_remaining(deadline))
+                elapsed = time.perf_counter() - start
+            finally:
+                self._in_flight.release()
+            self.cache.put(
+                key,
+                CachedResponse(
+                    problem_id=problem_id,
+                    model=self.backend.model,
+                    prompt_hash=digest,
+                    response=response,
+                    elapsed_seconds=round(elapsed, 4),
+                ),
+            )
+            return response
+
+    @contextmanager
+    def _key_lock(self, key: str, deadline: float) -> Iterator[None]:
+        """Lock por chave, para que pedidos iguais simultaneos gerem uma unica vez.
+
+        A espera respeita o prazo do pedido; a entrada sai do dicionario com o ultimo usuario.
+        """
+        with self._lock:
+            entry = self._key_locks.setdefault(key, _KeyLock())
+            entry.users += 1
+        try:
+            if not entry.lock.acquire(timeout=_remaining(deadline)):
+                raise SolverTimeoutError(f"espera pela mesma chave passou de {self.timeout_seconds:.0f}s")
+            try:
+                yield
+            finally:
+                entry.lock.release()
+        finally:
+            with self._lock:
+                entry.users -= 1
+                if not entry.users:
+                    del self._key_locks[key]
+
+
+class _KeyLock:
+    """Lock de uma chave e quantos pedidos o usam."""
+    __slots__ = ("lock", "users")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.users = 0
+
+
+def _remaining(deadline: float) -> float:
+    """Segundos ate o prazo (nunca negativo)."""
+    return max(0.0, deadline - time.monotonic())
+
+
+def format_samples(samples: List[Tuple[str, str]]) -> str:
+    """Exemplos no formato usado pelo prompt."""
+    if not samples:
+        return "N/A"
+    blocks = [f"Entrada:\n{sample_in}Saida:\n{sample_out}" for sample_in, sample_out in samples]
+    return "\n".join(blocks).rstrip("\n")
+
+
+def extract_code(response: str) -> str:
+    """Primeiro bloco de codigo da resposta (ou a resposta inteira, sem cercas)."""
+    match = _CODE_BLOCK.search(response)
+    code = (match.group(1) if match else response).strip("\n")
+    if not code.strip():
+        raise ValueError("Resposta do LLM sem codigo")
+    return code
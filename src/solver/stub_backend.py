@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+import time
+from dataclasses import dataclass, field
+
+
+_LANGUAGE = re.compile(r"^Linguagem:\s*(\w+)", re.MULTILINE)
+
+# Programas deterministicos: somam todos os inteiros da entrada.
+_PROGRAMS = {
+    "python": """import sys
+
+
+def solve() -> None:
+    print(sum(int(token) for token in sys.stdin.read().split()))
+
+
+if __name__ == '__main__':
+    solve()""",
+    "cpp": """#include <bits/stdc++.h>
+using namespace std;
+
+int main() {
+    long long value, total = 0;
+    while (cin >> value) {
+        total += value;
+    }
+    cout << total << '\\n';
+    return 0;
+}""",
+    "java": """import java.io.BufferedReader;
+import java.io.IOException;
+import java.io.InputStreamReader;
+
+public class Solution {
+    public static void main(String[] args) throws IOException {
+        BufferedReader reader = new BufferedReader(new InputStreamReader(System.in));
+        long total = 0;
+        String line;
+        while ((line = reader.readLine()) != null) {
+            for (String token : line.trim().split("\\\\s+")) {
+                if (!token.isEmpty()) {
+                    total += Long.parseLong(token);
+                }
+            }
+        }
+        System.out.println(total);
+    }
+}""",
+    "go": """package main
+
+import (
+	"bufio"
+	"fmt"
+	"os"
+)
+
+func main() {
+	reader := bufio.NewReader(os.Stdin)
+	var value, total int64
+	for {
+		if _, err := fmt.Fscan(reader, &value); err != nil {
+			break
+		}
+		total += value
+	}
+	fmt.Println(total)
+}""",
+}
+
+_COMMENTS = {"python": "#", "cpp": "//", "java": "//", "go": "//"}
+
+
+@dataclass
+class StubBackend:
+    """Backend local e deterministico: a mesma entrada gera sempre a mesma resposta.
+
+    Serve para exercitar e medir o pipeline offline; `latency_seconds` simula o tempo
+    de resposta de um modelo real.
+    """
+    model: str = "stub-1"
+    latency_seconds: float = 0.0
+    calls: int = field(default=0, init=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def complete(self, prompt: str, timeout: float) -> str:
+        """Resposta com o programa da linguagem pedida no prompt."""
+        with self._lock:
+            self.calls += 1
+        if self.latency_seconds > timeout:
+            time.sleep(timeout)
+            raise TimeoutError(f"{self.model} sem resposta em {timeout:.1f}s")
+        time.sleep(self.latency_seconds)
+        match = _LANGUAGE.search(prompt)
+        language = match.group(1) if match and match.group(1) in _PROGRAMS else "python"
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()[:12]
+        header = f"{_COMMENTS[language]} Gerado por {self.model} (prompt {digest})"
+        return f"```{language}\n{header}\n{_PROGRAMS[language]}\n```"
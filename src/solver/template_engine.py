@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from string import Template
+from typing import Dict, List, Mapping, Optional
+
+
+TEMPLATES_DIR = Path(__file__).resolve().parent / "templates"
+
+# Linguagem -> nome do arquivo da solucao (o template fica em templates/<linguagem>/<arquivo>.tmpl).
+SOLUTION_FILES = {
+    "python": "solution.py",
+    "cpp": "solution.cpp",
+    "java": "Solution.java",
+    "go": "solution.go",
+}
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    """Template `$campo` convertido uma vez em format string; render e um unico str.format_map."""
+    name: str
+    source: str
+
+    @classmethod
+    def compile(cls, name: str, text: str) -> "CompiledTemplate":
+        """Escapa chaves literais e troca `$campo`/`${campo}` por `{campo}`."""
+        parts = []
+        last = 0
+        for match in Template.pattern.finditer(text):
+            parts.append(text[last:match.start()].replace("{", "{{").replace("}", "}}"))
+            last = match.end()
+            if match.group("escaped") is not None:
+                parts.append("$")
+                continue
+            field = match.group("named") or match.group("braced")
+            if field is None:
+                raise ValueError(f"placeholder invalido em {name}: {match.group(0)!r}")
+            parts.append("{" + field + "}")
+        parts.append(text[last:].replace("{", "{{").replace("}", "}}"))
+        return cls(name=name, source="".join(parts))
+
+    def render(self, fields: Mapping[str, object]) -> str:
+        """Substitui os campos do problema."""
+        return self.source.format_map(fields)
+
+
+@dataclass(frozen=True)
+class LanguageTemplates:
+    """Templates compilados de uma linguagem."""
+    language: str
+    solution_filename: str
+    readme: CompiledTemplate
+    solution: CompiledTemplate
+    tests: CompiledTemplate
+    notes: CompiledTemplate
+    prompt: CompiledTemplate
+
+
+class TemplateEngine:
+    """Carrega e compila os templates uma vez por linguagem (cache thread-safe)."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root) if root else TEMPLATES_DIR
+        self._cache: Dict[str, LanguageTemplates] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def languages(self) -> List[str]:
+        """Linguagens com template de solucao."""
+        return [language for language, filename in SOLUTION_FILES.items() if self._path(language, filename).exists()]
+
+    def get(self, language: str) -> LanguageTemplates:
+        """Templates compilados da linguagem; le os arquivos somente na primeira chamada."""
+        cached = self._cache.get(language)
+        if cached is not None:
+            return cached
+        with self._lock:
+            if language not in self._cache:
+                self._cache[language] = self._load(language)
+            return self._cache[language]
+
+    def _load(self, language: str) -> LanguageTemplates:
+        """Le e compila os templates comuns e os da linguagem."""
+        filename = SOLUTION_FILES.get(language)
+        if filename is None:
+            raise ValueError(f"Linguagem nao suportada: {language}")
+        return LanguageTemplates(
+            language=language,
+            solution_filename=filename,
+            readme=self._compile("common", "README.md"),
+            solution=self._compile(language, filename),
+            tests=self._compile(language, "test_solution.py"),
+            notes=self._compile("common", "notes.md"),
+            prompt=self._compile("common", "prompt.md"),
+        )
+
+    def _compile(self, folder: str, filename: str) -> CompiledTemplate:
+        """Compila um arquivo `.tmpl` (sem a quebra de linha final)."""
+        path = self._path(folder, filename)
+        text = path.read_text(encoding="utf-8")
+        return CompiledTemplate.compile(f"{folder}/{filename}", text[:-1] if text.endswith("\n") else text)
+
+    def _path(self, folder: str, filename: str) -> Path:
+        """Caminho do template."""
+        return self.root / folder / f"{filename}.tmpl"
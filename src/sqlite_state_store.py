@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import json
+import sqlite3
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AbstractSet, Dict, List, Optional, Set
+
+from src.state_store import StateStore, job_key
+from src.utils.logger import get_logger
+
+
+logger = get_logger("state")
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS completed (
+    problem_id TEXT PRIMARY KEY,
+    source TEXT,
+    contest_id INTEGER,
+    problem_index TEXT,
+    slug TEXT,
+    timestamp TEXT,
+    batch TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_completed_source ON completed (source);
+CREATE INDEX IF NOT EXISTS idx_completed_contest ON completed (contest_id);
+CREATE INDEX IF NOT EXISTS idx_completed_timestamp ON completed (timestamp);
+CREATE INDEX IF NOT EXISTS idx_completed_batch ON completed (batch);
+CREATE TABLE IF NOT EXISTS failed (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    timestamp TEXT,
+    job_key TEXT,
+    reason TEXT,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_failed_timestamp ON failed (timestamp);
+CREATE INDEX IF NOT EXISTS idx_failed_job ON failed (job_key);
+CREATE INDEX IF NOT EXISTS idx_failed_reason ON failed (reason);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    job_key TEXT PRIMARY KEY,
+    stage TEXT,
+    updated_at TEXT,
+    record TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class SqliteStateStore:
+    """Historico em SQLite (WAL) com colunas indexadas e consultas sem carregar tudo."""
+    path: Path
+    read_only: bool = False
+    _conn: Optional[sqlite3.Connection] = field(default=None, init=False, repr=False)
+    _used: Set[str] = field(default_factory=set, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def load(self) -> None:
+        """Abre o banco, cria o schema e importa o historico JSON se estiver vazio."""
+        conn = self._connect()
+        if not self.read_only:
+            with self._lock:
+                conn.executescript(SCHEMA)
+            self._import_json_if_empty()
+        with self._lock:
+            rows = conn.execute("SELECT problem_id FROM completed").fetchall()
+        self._used = {row[0] for row in rows}
+
+    def close(self) -> None:
+        """Fecha a conexao."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def is_completed(self, problem_id: str) -> bool:
+        """Checa se problema ja foi concluido."""
+        return problem_id in self._used
+
+    def used_ids(self, source: Optional[str] = None) -> AbstractSet[str]:
+        """Ids ja concluidos; com `source`, consulta direto pelo indice."""
+        if source is None:
+            return self._used
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT problem_id FROM completed WHERE source = ?", (source,)
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_completed(self, record: dict) -> None:
+        """Registra desafio concluido."""
+        logger.info("✅ Registrando desafio como concluido")
+        with self._lock, self._connect() as conn:
+            _insert_completed(conn, record)
+        self._used.add(record["problem_id"])
+
+    def mark_failed(self, record: dict) -> None:
+        """Registra falha."""
+        logger.error("🚨 Registrando falha de desafio")
+        with self._lock, self._connect() as conn:
+            _insert_failed(conn, record)
+
+    def completed_since(self, days: int) -> List[dict]:
+        """Desafios concluidos nos ultimos N dias."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT record FROM completed WHERE timestamp >= ? ORDER BY timestamp", (cutoff,)
+            ).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def completed_in_batch(self, batch_id: str) -> int:
+        """Quantidade de desafios concluidos por um backfill."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT COUNT(*) FROM completed WHERE batch = ?", (batch_id,)
+            ).fetchone()
+        return row[0]
+
+    def get_checkpoint(self, key: str) -> Optional[dict]:
+        """Checkpoint de etapas de um job em andamento."""
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT record FROM checkpoints WHERE job_key = ?", (key,)
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def save_checkpoint(self, key: str, record: dict) -> None:
+        """Grava/atualiza o checkpoint de um job."""
+        record = {**record, "key": key}
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO checkpoints (job_key, stage, updated_at, record) VALUES (?, ?, ?, ?)",
+                (key, record.get("stage"), record.get("updated_at"), json.dumps(record, ensure_ascii=False)),
+            )
+
+    def clear_checkpoint(self, key: str) -> None:
+        """Remove o checkpoint de um job finalizado."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM checkpoints WHERE job_key = ?", (key,))
+
+    def failure_counts_by_job(self) -> Dict[str, int]:
+        """Quantidade de falhas agrupada por definicao de job."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT job_key, COUNT(*) FROM failed GROUP BY job_key ORDER BY COUNT(*) DESC"
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def failure_counts_by_reason(self, limit: int = 20) -> Dict[str, int]:
+        """Motivos de falha mais frequentes."""
+        with self._lock:
+            rows = self._connect().execute(
+                "SELECT reason, COUNT(*) FROM failed GROUP BY reason ORDER BY COUNT(*) DESC LIMIT ?",
+                (limit,),
+            ).fetchall()
+        return {row[0]: row[1] for row in rows}
+
+    def _connect(self) -> sqlite3.Connection:
+        """Abre (uma vez) a conexao; leitores usam modo somente leitura."""
+        if self._conn is not None:
+            return self._conn
+        if self.read_only:
+            conn = sqlite3.connect(f"file:{self.path.as_posix()}?mode=ro", uri=True, check_same_thread=False)
+        else:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn = conn
+        return conn
+
+    def _import_json_if_empty(self) -> None:
+        """Importa state.jsonl/state.json existentes na primeira abertura."""
+        conn = self._connect()
+        with self._lock:
+            has_rows = conn.execute(
+                "SELECT EXISTS(SELECT 1 FROM completed) OR EXISTS(SELECT 1 FROM failed)"
+                " OR EXISTS(SELECT 1 FROM checkpoints)"
+            ).fetchone()[0]
+        if has_rows:
+            return
+        journal_path = self.path.with_suffix(".jsonl")
+        if not journal_path.exists() and not journal_path.with_suffix(".json").exists():
+            return
+        legacy = StateStore(path=journal_path)
+        legacy.load()
+        completed = legacy.data.get("completed", [])
+        failed = legacy.data.get("failed", [])
+        if not completed and not failed and not legacy.checkpoints:
+            return
+        logger.info("📦 Importando %s concluidos e %s falhas para SQLite", len(completed), len(failed))
+        with self._lock, conn:
+            for record in completed:
+                _insert_completed(conn, record)
+            for record in failed:
+                _insert_failed(conn, record)
+        for key, record in legacy.checkpoints.items():
+            self.save_checkpoint(key, record)
+
+
+def _insert_completed(conn: sqlite3.Connection, record: dict) -> None:
+    """Insere/substitui um registro de conclusao mantendo o JSON original."""
+    conn.execute(
+        "INSERT OR REPLACE INTO completed"
+        " (problem_id, source, contest_id, problem_index, slug, timestamp, batch, record)"
+        " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            record["problem_id"],
+            record.get("source"),
+            record.get("contest_id"),
+            record.get("index"),
+            record.get("slug"),
+            record.get("timestamp"),
+            record.get("batch"),
+            json.dumps(record, ensure_ascii=False),
+        ),
+    )
+
+
+def _insert_failed(conn: sqlite3.Connection, record: dict) -> None:
+    """Insere um registro de falha mantendo o JSON original."""
+    conn.execute(
+        "INSERT INTO failed (timestamp, job_key, reason, record) VALUES (?, ?, ?, ?)",
+        (
+            record.get("timestamp"),
+            job_key(record.get("job") or {}),
+            record.get("error"),
+            json.dumps(record, ensure_ascii=False),
+        ),
+    )
@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 import json
+import os
+import threading
+from collections import Counter
 from dataclasses import dataclass, field
+from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List
+from typing import AbstractSet, Dict, List, Optional, Protocol, Tuple
 
 from src.utils.logger import get_logger
 
@@ -11,38 +15,235 @@ from src.utils.logger import get_logger
 logger = get_logger("state")
 
 
+class StateBackend(Protocol):
+    """Contrato dos armazenamentos de historico usados pelo Scheduler."""
+
+    def load(self) -> None:
+        ...
+
+    def is_completed(self, problem_id: str) -> bool:
+        ...
+
+    def used_ids(self, source: Optional[str] = None) -> AbstractSet[str]:
+        ...
+
+    def mark_completed(self, record: dict) -> None:
+        ...
+
+    def mark_failed(self, record: dict) -> None:
+        ...
+
+    def completed_since(self, days: int) -> List[dict]:
+        ...
+
+    def failure_counts_by_job(self) -> Dict[str, int]:
+        ...
+
+    def completed_in_batch(self, batch_id: str) -> int:
+        ...
+
+    def get_checkpoint(self, key: str) -> Optional[dict]:
+        ...
+
+    def save_checkpoint(self, key: str, record: dict) -> None:
+        ...
+
+    def clear_checkpoint(self, key: str) -> None:
+        ...
+
+
 @dataclass
 class StateStore:
-    """Mantem historico de desafios completos e falhos."""
+    """Mantem historico de desafios completos e falhos em um journal JSONL append-only.
+
+    Com `read_only` o journal so e lido (CLI de consulta): nada e criado, migrado ou compactado.
+    """
     path: Path
+    compact_every: int = 500
+    read_only: bool = False
     data: Dict[str, List[dict]] = field(default_factory=lambda: {"completed": [], "failed": []})
+    checkpoints: Dict[str, dict] = field(default_factory=dict)
+    _completed_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _garbage: int = field(default=0, init=False, repr=False)
+    _signature: Optional[Tuple[int, int]] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    @property
+    def legacy_path(self) -> Path:
+        """Local do state.json antigo (snapshot unico reescrito a cada evento)."""
+        return self.path.with_suffix(".json")
 
     def load(self) -> None:
-        """Carrega state.json se existir."""
+        """Carrega o journal, migrando o state.json antigo na primeira execucao."""
         if not self.path.exists():
-            self.save()
+            self._reset()
+            if self.legacy_path.exists():
+                self._migrate_legacy()
+            elif not self.read_only:
+                self.save()
+            return
+        if self._signature is not None and self._signature == self._stat():
             return
+        self._reset()
+        corrupted = False
         with self.path.open("r", encoding="utf-8") as handle:
-            self.data = json.load(handle)
+            for line_no, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    if self.read_only and not line.endswith("\n"):
+                        # Ultima linha ainda sendo acrescentada pelo scheduler.
+                        continue
+                    logger.warning("⚠️ Linha %s do journal corrompida, ignorando", line_no)
+                    corrupted = True
+                    continue
+                self._apply(entry["op"], entry["record"])
+        self._signature = self._stat()
+        if self.read_only:
+            return
+        if corrupted or self._garbage >= self.compact_every:
+            self.compact()
 
     def save(self) -> None:
-        """Salva state.json."""
+        """Reescreve o journal com somente os registros vivos."""
+        self.compact()
+
+    def compact(self) -> None:
+        """Compacta o journal de forma atomica, descartando entradas substituidas."""
+        self._check_writable()
         self.path.parent.mkdir(parents=True, exist_ok=True)
-        with self.path.open("w", encoding="utf-8") as handle:
-            json.dump(self.data, handle, indent=2, ensure_ascii=False)
+        tmp_path = self.path.with_name(f"{self.path.name}.tmp")
+        with tmp_path.open("w", encoding="utf-8") as handle:
+            for op in ("completed", "failed"):
+                for record in self.data.get(op, []):
+                    handle.write(_encode(op, record))
+            for record in self.checkpoints.values():
+                handle.write(_encode("checkpoint", record))
+        os.replace(tmp_path, self.path)
+        self._garbage = 0
+        self._signature = self._stat()
 
     def is_completed(self, problem_id: str) -> bool:
         """Checa se problema ja foi concluido."""
-        return any(item["problem_id"] == problem_id for item in self.data.get("completed", []))
+        return problem_id in self._completed_index
+
+    def used_ids(self, source: Optional[str] = None) -> AbstractSet[str]:
+        """Ids ja concluidos, com busca O(1)."""
+        if source is None:
+            return self._completed_index.keys()
+        return {pid for pid in self._completed_index if pid.startswith(f"{source}:")}
+
+    def completed_since(self, days: int) -> List[dict]:
+        """Desafios concluidos nos ultimos N dias."""
+        cutoff = (datetime.now() - timedelta(days=days)).isoformat()
+        return [item for item in self.data.get("completed", []) if item.get("timestamp", "") >= cutoff]
+
+    def completed_in_batch(self, batch_id: str) -> int:
+        """Quantidade de desafios concluidos por um backfill."""
+        return sum(1 for item in self.data.get("completed", []) if item.get("batch") == batch_id)
+
+    def failure_counts_by_job(self) -> Dict[str, int]:
+        """Quantidade de falhas agrupada por definicao de job."""
+        return dict(Counter(job_key(item.get("job") or {}) for item in self.data.get("failed", [])))
 
     def mark_completed(self, record: dict) -> None:
         """Registra desafio concluido."""
         logger.info("✅ Registrando desafio como concluido")
-        self.data.setdefault("completed", []).append(record)
-        self.save()
+        self._append("completed", record)
 
     def mark_failed(self, record: dict) -> None:
         """Registra falha."""
         logger.error("🚨 Registrando falha de desafio")
-        self.data.setdefault("failed", []).append(record)
-        self.save()
+        self._append("failed", record)
+
+    def get_checkpoint(self, key: str) -> Optional[dict]:
+        """Checkpoint de etapas de um job em andamento."""
+        return self.checkpoints.get(key)
+
+    def save_checkpoint(self, key: str, record: dict) -> None:
+        """Grava/atualiza o checkpoint de um job."""
+        self._append("checkpoint", {**record, "key": key})
+
+    def clear_checkpoint(self, key: str) -> None:
+        """Remove o checkpoint de um job finalizado."""
+        if key in self.checkpoints:
+            self._append("checkpoint_clear", {"key": key})
+
+    def _append(self, op: str, record: dict) -> None:
+        """Aplica o evento em memoria e acrescenta uma linha ao journal."""
+        self._check_writable()
+        with self._lock:
+            self._apply(op, record)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self.path.open("a", encoding="utf-8") as handle:
+                handle.write(_encode(op, record))
+            self._signature = self._stat()
+            if self._garbage >= self.compact_every:
+                self.compact()
+
+    def _apply(self, op: str, record: dict) -> None:
+        """Atualiza listas e indice; conclusoes repetidas substituem a anterior."""
+        if op == "completed":
+            completed = self.data.setdefault("completed", [])
+            position = self._completed_index.get(record["problem_id"])
+            if position is not None:
+                completed[position] = record
+                self._garbage += 1
+                return
+            self._completed_index[record["problem_id"]] = len(completed)
+            completed.append(record)
+        elif op == "failed":
+            self.data.setdefault("failed", []).append(record)
+        elif op == "checkpoint":
+            if record["key"] in self.checkpoints:
+                self._garbage += 1
+            self.checkpoints[record["key"]] = record
+        elif op == "checkpoint_clear":
+            # A remocao e o checkpoint removido deixam de ser necessarios no journal.
+            self._garbage += 2 if self.checkpoints.pop(record["key"], None) is not None else 1
+        else:
+            logger.warning("⚠️ Operacao desconhecida no journal: %s", op)
+
+    def _migrate_legacy(self) -> None:
+        """Importa o state.json antigo para o journal (executa uma unica vez)."""
+        logger.info("📦 Migrando %s para %s", self.legacy_path.name, self.path.name)
+        with self.legacy_path.open("r", encoding="utf-8") as handle:
+            legacy = json.load(handle)
+        for op in ("completed", "failed"):
+            for record in legacy.get(op, []):
+                self._apply(op, record)
+        if not self.read_only:
+            self.compact()
+
+    def _check_writable(self) -> None:
+        """Impede escritas no journal quando aberto somente para leitura."""
+        if self.read_only:
+            raise RuntimeError(f"{self.path} aberto somente para leitura")
+
+    def _reset(self) -> None:
+        """Limpa o estado em memoria antes de um replay."""
+        self.data = {"completed": [], "failed": []}
+        self.checkpoints = {}
+        self._completed_index = {}
+        self._garbage = 0
+        self._signature = None
+
+    def _stat(self) -> Optional[Tuple[int, int]]:
+        """Assinatura (tamanho, mtime) para evitar replays desnecessarios."""
+        try:
+            stat = self.path.stat()
+        except OSError:
+            return None
+        return stat.st_size, stat.st_mtime_ns
+
+
+def job_key(job: dict) -> str:
+    """Chave canonica de um job (JSON ordenado) para agrupar historico."""
+    return json.dumps(job, sort_keys=True, ensure_ascii=False)
+
+
+def _encode(op: str, record: dict) -> str:
+    """Serializa uma entrada do journal em uma linha."""
+    return json.dumps({"op": op, "record": record}, ensure_ascii=False) + "\n"
@@ -0,0 +1,337 @@
+from __future__ import annotations
+
+import asyncio
+import io
+import multiprocessing
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import xml.etree.ElementTree as ET
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field
+from multiprocessing.pool import Pool
+from pathlib import Path
+from typing import Iterator, List, Optional
+
+from src.utils.logger import get_logger
+
+
+logger = get_logger("tests")
+
+
+# Folga dada ao pool alem do timeout aplicado dentro do worker.
+POOL_GRACE_SECONDS = 5.0
+
+
+@dataclass
+class TestReport:
+    """Resultado estruturado de um pytest em um diretorio de desafio."""
+    __test__ = False
+
+    challenge_dir: str
+    exit_code: int
+    passed: int = 0
+    failed: int = 0
+    skipped: int = 0
+    errors: int = 0
+    duration: float = 0.0
+    timed_out: bool = False
+    output: str = ""
+
+    @property
+    def ok(self) -> bool:
+        """Sucesso somente com exit code 0 e sem timeout."""
+        return self.exit_code == 0 and not self.timed_out
+
+    def summary(self) -> str:
+        """Resumo curto para logs e mensagens de erro."""
+        text = (
+            f"{self.passed} passed, {self.failed} failed, {self.skipped} skipped, "
+            f"{self.errors} errors em {self.duration:.2f}s"
+        )
+        return f"{text} (timeout)" if self.timed_out else text
+
+
+class TestTimeout(BaseException):
+    """Levantada pelo alarme quando o desafio passa do tempo limite."""
+    __test__ = False
+
+
+class _Collector:
+    """Plugin pytest que conta resultados por fase."""
+
+    def __init__(self) -> None:
+        self.passed = 0
+        self.failed = 0
+        self.skipped = 0
+        self.errors = 0
+        self.timed_out = False
+
+    def pytest_runtest_makereport(self, item, call) -> None:
+        if call.excinfo is not None and call.excinfo.errisinstance(TestTimeout):
+            self.timed_out = True
+            item.session.shouldstop = "timeout do desafio"
+
+    def pytest_runtest_logreport(self, report) -> None:
+        if report.when == "call":
+            if report.passed:
+                self.passed += 1
+            elif report.failed:
+                self.failed += 1
+        if report.skipped:
+            self.skipped += 1
+        elif report.failed and report.when != "call":
+            self.errors += 1
+
+    def pytest_collectreport(self, report) -> None:
+        if report.failed:
+            self.errors += 1
+
+
+@dataclass
+class TestRunner:
+    """Roda pytest por desafio em subprocesso, in-process ou em pool de workers aquecidos."""
+    __test__ = False
+
+    cwd: Path
+    mode: str = "inprocess"
+    timeout_seconds: float = 120.0
+    workers: int = 2
+    _pool: Optional[Pool] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def run(self, challenge_dir: Path) -> TestReport:
+        """Roda os testes de um desafio conforme o modo configurado."""
+        if self.mode == "subprocess":
+            return self._run_subprocess(challenge_dir)
+        if threading.current_thread() is threading.main_thread():
+            with self._lock:
+                return TestReport(**_run_inprocess(str(challenge_dir), self.timeout_seconds))
+        return self._run_pooled(challenge_dir)
+
+    def close(self) -> None:
+        """Encerra o pool de workers, se existir."""
+        with self._lock:
+            if self._pool is not None:
+                self._pool.terminate()
+                self._pool.join()
+                self._pool = None
+
+    def _run_pooled(self, challenge_dir: Path) -> TestReport:
+        """Executa um desafio em um worker do pool (seguro para threads)."""
+        pool = self._get_pool()
+        result = pool.apply_async(_run_inprocess, (str(challenge_dir), self.timeout_seconds))
+        return self._collect(challenge_dir, result)
+
+    def _collect(self, challenge_dir: Path, result) -> TestReport:
+        """Aguarda o resultado; se o worker travar, recicla o pool."""
+        try:
+            return TestReport(**result.get(self.timeout_seconds + POOL_GRACE_SECONDS))
+        except multiprocessing.TimeoutError:
+            logger.error("🚨 Worker de testes travou em %s, reciclando pool", challenge_dir)
+            self.close()
+            return TestReport(
+                challenge_dir=str(challenge_dir),
+                exit_code=-1,
+                duration=self.timeout_seconds,
+                timed_out=True,
+            )
+
+    def _get_pool(self) -> Pool:
+        """Cria o pool sob demanda; forkserver evita fork de processo com threads."""
+        with self._lock:
+            if self._pool is None:
+                methods = multiprocessing.get_all_start_methods()
+                ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+                if "forkserver" in methods:
+                    ctx.set_forkserver_preload(["pytest", "src.test_runner"])
+                logger.info("🔥 Iniciando pool com %s workers de teste", self.workers)
+                self._pool = ctx.Pool(processes=self.workers, initializer=_warm_worker)
+            return self._pool
+
+    async def arun(self, challenge_dir: Path) -> TestReport:
+        """Versao assincrona: subprocesso via asyncio ou pool em thread auxiliar."""
+        if self.mode != "subprocess":
+            return await asyncio.to_thread(self.run, challenge_dir)
+        with tempfile.TemporaryDirectory() as tmp:
+            junit_path = Path(tmp) / "report.xml"
+            start = time.perf_counter()
+            proc = await asyncio.create_subprocess_exec(
+                *_pytest_command(challenge_dir, junit_path),
+                cwd=self.cwd,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(proc.communicate(), self.timeout_seconds)
+            except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+                proc.kill()
+                await proc.wait()
+                if isinstance(exc, asyncio.CancelledError):
+                    raise
+                return TestReport(
+                    challenge_dir=str(challenge_dir),
+                    exit_code=-1,
+                    duration=time.perf_counter() - start,
+                    timed_out=True,
+                )
+            return _subprocess_report(
+                challenge_dir,
+                proc.returncode,
+                time.perf_counter() - start,
+                f"{_as_text(stdout)}\n{_as_text(stderr)}",
+                junit_path,
+            )
+
+    def _run_subprocess(self, challenge_dir: Path) -> TestReport:
+        """Modo legado: um processo pytest por desafio, com junitxml para contagens."""
+        with tempfile.TemporaryDirectory() as tmp:
+            junit_path = Path(tmp) / "report.xml"
+            start = time.perf_counter()
+            try:
+                result = subprocess.run(
+                    _pytest_command(challenge_dir, junit_path),
+                    capture_output=True,
+                    text=True,
+                    check=False,
+                    cwd=self.cwd,
+                    timeout=self.timeout_seconds,
+                )
+            except subprocess.TimeoutExpired as exc:
+                return TestReport(
+                    challenge_dir=str(challenge_dir),
+                    exit_code=-1,
+                    duration=time.perf_counter() - start,
+                    timed_out=True,
+                    output=_as_text(exc.stdout),
+                )
+            return _subprocess_report(
+                challenge_dir,
+                result.returncode,
+                time.perf_counter() - start,
+                f"{result.stdout}\n{result.stderr}",
+                junit_path,
+            )
+
+
+def _pytest_command(challenge_dir: Path, junit_path: Path) -> List[str]:
+    """Linha de comando do pytest em subprocesso."""
+    return [
+        sys.executable, "-m", "pytest", str(challenge_dir), "-q",
+        "-p", "no:cacheprovider", f"--junitxml={junit_path}",
+    ]
+
+
+def _subprocess_report(
+    challenge_dir: Path,
+    exit_code: int,
+    duration: float,
+    output: str,
+    junit_path: Path,
+) -> TestReport:
+    """Monta o TestReport de um pytest em subprocesso."""
+    report = TestReport(
+        challenge_dir=str(challenge_dir),
+        exit_code=exit_code,
+        duration=duration,
+        output=output,
+    )
+    if junit_path.exists():
+        _fill_from_junit(report, junit_path)
+    return report
+
+
+def _run_inprocess(challenge_dir: str, timeout_seconds: float) -> dict:
+    """Roda pytest.main isolando sys.path e os modulos solution/test_solution."""
+    import pytest
+
+    collector = _Collector()
+    buffer = io.StringIO()
+    saved_path = list(sys.path)
+    _purge_modules(challenge_dir)
+    start = time.perf_counter()
+    try:
+        with _alarm(timeout_seconds), redirect_stdout(buffer), redirect_stderr(buffer):
+            exit_code = int(
+                pytest.main(
+                    [challenge_dir, "-q", "-p", "no:cacheprovider", "--rootdir", challenge_dir],
+                    plugins=[collector],
+                )
+            )
+    except TestTimeout:
+        collector.timed_out = True
+        exit_code = -1
+    finally:
+        sys.path[:] = saved_path
+        _purge_modules(challenge_dir)
+    return {
+        "challenge_dir": challenge_dir,
+        "exit_code": exit_code,
+        "passed": collector.passed,
+        "failed": collector.failed,
+        "skipped": collector.skipped,
+        "errors": collector.errors,
+        "duration": time.perf_counter() - start,
+        "timed_out": collector.timed_out,
+        "output": buffer.getvalue(),
+    }
+
+
+def _purge_modules(challenge_dir: str) -> None:
+    """Remove de sys.modules tudo que foi importado do diretorio do desafio."""
+    root = os.path.abspath(challenge_dir)
+    for name, module in list(sys.modules.items()):
+        module_file = getattr(module, "__file__", None)
+        if module_file and os.path.abspath(module_file).startswith(root + os.sep):
+            del sys.modules[name]
+    for name in ("solution", "test_solution", "conftest"):
+        sys.modules.pop(name, None)
+
+
+@contextmanager
+def _alarm(seconds: float) -> Iterator[None]:
+    """Interrompe o teste apos `seconds` (somente no main thread em POSIX)."""
+    if not hasattr(signal, "setitimer") or threading.current_thread() is not threading.main_thread():
+        yield
+        return
+
+    def _handler(signum, frame):
+        raise TestTimeout(f"timeout de {seconds}s excedido")
+
+    previous = signal.signal(signal.SIGALRM, _handler)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _warm_worker() -> None:
+    """Pre-importa pytest e plugins no worker."""
+    import pytest  # noqa: F401
+    import _pytest.python  # noqa: F401
+
+
+def _fill_from_junit(report: TestReport, junit_path: Path) -> None:
+    """Preenche contagens a partir do junitxml do pytest."""
+    root = ET.parse(junit_path).getroot()
+    suite = root if root.tag == "testsuite" else root.find("testsuite")
+    if suite is None:
+        return
+    total = int(suite.get("tests", 0))
+    report.failed = int(suite.get("failures", 0))
+    report.errors = int(suite.get("errors", 0))
+    report.skipped = int(suite.get("skipped", 0))
+    report.passed = total - report.failed - report.errors - report.skipped
+
+
+def _as_text(value) -> str:
+    """Normaliza stdout de TimeoutExpired (bytes, str ou None)."""
+    if value is None:
+        return ""
+    return value.decode("utf-8", "replace") if isinstance(value, bytes) else value
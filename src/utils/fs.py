@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+import shutil
+import uuid
+from pathlib import Path
+from typing import Dict
+
+
+# "none": so o replace atomico; "files": fsync de cada arquivo; "full": arquivos e diretorios.
+FSYNC_POLICIES = ("none", "files", "full")
+
+
+def atomic_write_text(path: Path, content: str, fsync: str = "none") -> None:
+    """Escreve via arquivo temporario + os.replace (leitores nunca veem arquivo parcial)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    write_file(tmp_path, content, fsync)
+    os.replace(tmp_path, path)
+    if fsync == "full":
+        fsync_dir(path.parent)
+
+
+def atomic_write_bytes(path: Path, data: bytes, fsync: str = "none") -> None:
+    """Versao binaria de atomic_write_text."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with open(tmp_path, "wb") as handle:
+        handle.write(data)
+        if fsync != "none":
+            handle.flush()
+            os.fsync(handle.fileno())
+    os.replace(tmp_path, path)
+    if fsync == "full":
+        fsync_dir(path.parent)
+
+
+def write_file(path: Path, content: str, fsync: str = "none") -> None:
+    """Grava um arquivo texto com um unico write; fsync conforme a politica."""
+    with open(path, "w", encoding="utf-8") as handle:
+        handle.write(content)
+        if fsync != "none":
+            handle.flush()
+            os.fsync(handle.fileno())
+
+
+def fsync_dir(path: Path) -> None:
+    """Sincroniza a entrada de diretorio (no-op onde nao ha suporte, ex.: Windows)."""
+    if not hasattr(os, "O_DIRECTORY"):
+        return
+    fd = os.open(path, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def publish_dir(files: Dict[str, str], target: Path, fsync: str = "none") -> None:
+    """Monta `files` em um diretorio oculto ao lado de `target` e publica com os.replace.
+
+    Se `target` ja existir, ele e movido para um nome temporario antes do replace
+    e removido depois; um crash nunca deixa uma pasta parcial com o nome final.
+    """
+    target.parent.mkdir(parents=True, exist_ok=True)
+    token = uuid.uuid4().hex[:8]
+    staging = target.with_name(f".staging-{target.name}-{token}")
+    staging.mkdir()
+    try:
+        for name, content in files.items():
+            file_path = staging / name
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            write_file(file_path, content, fsync)
+        if fsync == "full":
+            fsync_dir(staging)
+        previous = None
+        if target.exists():
+            previous = target.with_name(f".replaced-{target.name}-{token}")
+            os.replace(target, previous)
+        os.replace(staging, target)
+    except BaseException:
+        shutil.rmtree(staging, ignore_errors=True)
+        raise
+    if fsync == "full":
+        fsync_dir(target.parent)
+    if previous is not None:
+        shutil.rmtree(previous, ignore_errors=True)
+
+
+def remove_stale_staging(parent: Path) -> int:
+    """Limpa restos de publish_dir interrompido; restaura a pasta antiga se o replace nao ocorreu."""
+    if not parent.is_dir():
+        return 0
+    removed = 0
+    with os.scandir(parent) as items:
+        leftovers = [item.name for item in items if item.name.startswith((".staging-", ".replaced-"))]
+    for name in leftovers:
+        path = parent / name
+        original = parent / name.split("-", 1)[1].rsplit("-", 1)[0]
+        if name.startswith(".replaced-") and not original.exists():
+            os.replace(path, original)
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed += 1
+    return removed
@@ -1,16 +1,165 @@
+import atexit
+import contextvars
+import json
 import logging
+import logging.handlers
+import os
+import queue
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Union
+
+
+LEVEL_ENV = "AUTOFEEDR_LOG_LEVEL"
+TEXT_FORMAT = "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+CONTEXT_FIELDS = ("job", "problem_id", "stage")
+
+_context: contextvars.ContextVar[Dict[str, str]] = contextvars.ContextVar("log_context", default={})
+
+
+class JsonFormatter(logging.Formatter):
+    """Uma linha JSON por registro, com os campos de contexto (job, problem_id, stage)."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for name in CONTEXT_FIELDS:
+            value = getattr(record, name, None)
+            if value is not None:
+                payload[name] = value
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            payload["exc"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def _stream_handler(formatter: logging.Formatter) -> logging.Handler:
+    """Saida em stderr."""
+    handler = logging.StreamHandler()
+    handler.setFormatter(formatter)
+    return handler
+
+
+class _Dispatcher(logging.Handler):
+    """Handler unico dos loggers do servico.
+
+    Com o listener ativo neste processo, so anexa o contexto e enfileira (o formato e a
+    escrita ficam no thread do listener); sem ele (antes de `configure_logging`, ou em
+    processos filhos), escreve direto nos handlers de saida.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+        self.outputs: List[logging.Handler] = [_stream_handler(logging.Formatter(TEXT_FORMAT))]
+        self.listener: Optional[logging.handlers.QueueListener] = None
+        self.listener_pid: Optional[int] = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        for name, value in _context.get().items():
+            setattr(record, name, value)
+        if self.listener is None or self.listener_pid != os.getpid():
+            for handler in self.outputs:
+                if record.levelno >= handler.level:
+                    handler.handle(record)
+            return
+        try:
+            self.queue.put_nowait(self._prepare(record))
+        except Exception:  # noqa: BLE001
+            self.handleError(record)
+
+    def _prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Resolve a mensagem e o traceback antes de cruzar threads (como QueueHandler.prepare)."""
+        message = record.getMessage()
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.msg = message
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+_dispatcher = _Dispatcher()
+_loggers: Dict[str, logging.Logger] = {}
+_lock = threading.Lock()
+_level = logging.getLevelName(os.environ.get(LEVEL_ENV, "INFO").upper())
 
 
 def get_logger(name: str) -> logging.Logger:
     """Cria logger padrao."""
     logger = logging.getLogger(name)
-    if logger.handlers:
-        return logger
-    logger.setLevel(logging.INFO)
-    handler = logging.StreamHandler()
-    formatter = logging.Formatter(
-        "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-    )
-    handler.setFormatter(formatter)
-    logger.addHandler(handler)
+    with _lock:
+        if name in _loggers:
+            return logger
+        logger.setLevel(_level if isinstance(_level, int) else logging.INFO)
+        logger.addHandler(_dispatcher)
+        _loggers[name] = logger
     return logger
+
+
+def configure_logging(
+    level: str = "INFO",
+    json_format: bool = False,
+    file_path: Optional[Union[str, Path]] = None,
+    max_bytes: int = 10 * 1024 * 1024,
+    backup_count: int = 5,
+) -> None:
+    """Liga o QueueListener (um thread escreve stderr e, opcionalmente, arquivo rotativo).
+
+    A variavel AUTOFEEDR_LOG_LEVEL tem precedencia sobre `level`.
+    """
+    global _level
+    resolved = logging.getLevelName(os.environ.get(LEVEL_ENV, level).upper())
+    if not isinstance(resolved, int):
+        raise ValueError(f"nivel de log invalido: {level}")
+    formatter = JsonFormatter() if json_format else logging.Formatter(TEXT_FORMAT)
+    outputs: List[logging.Handler] = [_stream_handler(formatter)]
+    if file_path:
+        path = Path(file_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.handlers.RotatingFileHandler(
+            path, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8"
+        )
+        file_handler.setFormatter(formatter)
+        outputs.append(file_handler)
+    shutdown_logging()
+    with _lock:
+        _level = resolved
+        for logger in _loggers.values():
+            logger.setLevel(resolved)
+        _dispatcher.outputs = outputs
+        listener = logging.handlers.QueueListener(_dispatcher.queue, *outputs, respect_handler_level=True)
+        listener.start()
+        _dispatcher.listener = listener
+        _dispatcher.listener_pid = os.getpid()
+
+
+def shutdown_logging() -> None:
+    """Esvazia a fila, para o listener e fecha os arquivos; volta a escrita direta."""
+    listener = _dispatcher.listener
+    if listener is None or _dispatcher.listener_pid != os.getpid():
+        return
+    _dispatcher.listener = None
+    listener.stop()
+    for handler in _dispatcher.outputs:
+        if isinstance(handler, logging.FileHandler):
+            handler.close()
+
+
+@contextmanager
+def log_context(**fields: str) -> Iterator[None]:
+    """Acrescenta campos (job, problem_id, stage) aos logs emitidos dentro do bloco."""
+    token = _context.set({**_context.get(), **fields})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+atexit.register(shutdown_logging)
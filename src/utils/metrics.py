@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import ContextManager, Dict, List, Optional, Sequence, Tuple
+
+
+# Buckets (segundos) cobrindo de chamadas HTTP rapidas a pytest/push lentos.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+STAGE_SECONDS = "autofeedr_stage_seconds"
+JOB_SECONDS = "autofeedr_job_seconds"
+JOBS_TOTAL = "autofeedr_jobs_total"
+RETRIES_TOTAL = "autofeedr_retries_total"
+CACHE_TOTAL = "autofeedr_cache_requests_total"
+HTTP_SECONDS = "autofeedr_http_request_seconds"
+HTTP_TOTAL = "autofeedr_http_requests_total"
+GIT_SECONDS = "autofeedr_git_seconds"
+
+DESCRIPTIONS = {
+    STAGE_SECONDS: "Duracao de cada etapa do job (select, solve, write, test, commit, push)",
+    JOB_SECONDS: "Duracao total do job, incluindo retries",
+    JOBS_TOTAL: "Jobs finalizados por status",
+    RETRIES_TOTAL: "Novas tentativas de jobs apos falha",
+    CACHE_TOTAL: "Consultas aos caches por resultado",
+    HTTP_SECONDS: "Latencia das requisicoes HTTP",
+    HTTP_TOTAL: "Requisicoes HTTP por status (error = falha de rede)",
+    GIT_SECONDS: "Duracao dos comandos git por operacao",
+}
+
+_NULL_TIMER = nullcontext()
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class _Histogram:
+    """Contagens por bucket (nao cumulativas), soma e total."""
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self, size: int) -> None:
+        self.counts = [0] * size
+        self.sum = 0.0
+        self.count = 0
+
+
+class _Timer:
+    """Mede o bloco com perf_counter e registra no histograma ao sair (inclusive com erro)."""
+    __slots__ = ("_registry", "_name", "_labels", "_start")
+
+    def __init__(self, registry: "MetricsRegistry", name: str, labels: Dict[str, str]) -> None:
+        self._registry = registry
+        self._name = name
+        self._labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._registry.observe(self._name, time.perf_counter() - self._start, **self._labels)
+
+
+class MetricsRegistry:
+    """Contadores e histogramas em memoria, exportaveis em texto Prometheus e JSONL.
+
+    Desabilitado, `inc`/`observe` retornam de imediato e `timer` devolve um
+    context manager vazio compartilhado.
+    """
+
+    def __init__(self, enabled: bool = False, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.enabled = enabled
+        self.buckets = tuple(buckets)
+        self._counters: Dict[LabelKey, float] = {}
+        self._histograms: Dict[LabelKey, _Histogram] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Soma `value` ao contador."""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0.0) + value
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        """Registra uma amostra no histograma."""
+        if not self.enabled:
+            return
+        key = (name, tuple(sorted(labels.items())))
+        slot = bisect_left(self.buckets, value)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = _Histogram(len(self.buckets) + 1)
+            histogram.counts[slot] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def timer(self, name: str, **labels: str) -> ContextManager:
+        """Context manager que mede o bloco e registra a duracao em `name`."""
+        if not self.enabled:
+            return _NULL_TIMER
+        return _Timer(self, name, labels)
+
+    def reset(self) -> None:
+        """Zera todas as series."""
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def snapshot(self) -> dict:
+        """Copia serializavel das series."""
+        with self._lock:
+            counters = [
+                {"name": name, "labels": dict(labels), "value": value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+            histograms = [
+                {
+                    "name": name,
+                    "labels": dict(labels),
+                    "count": histogram.count,
+                    "sum": round(histogram.sum, 6),
+                    "buckets": dict(zip(self._bucket_labels(), _cumulative(histogram.counts))),
+                }
+                for (name, labels), histogram in sorted(self._histograms.items())
+            ]
+        return {"counters": counters, "histograms": histograms}
+
+    def render_prometheus(self) -> str:
+        """Texto no formato de exposicao do Prometheus (0.0.4)."""
+        snapshot = self.snapshot()
+        lines: List[str] = []
+        seen = set()
+        for kind, series in (("counter", snapshot["counters"]), ("histogram", snapshot["histograms"])):
+            for item in series:
+                name = item["name"]
+                if name not in seen:
+                    seen.add(name)
+                    lines.append(f"# HELP {name} {DESCRIPTIONS.get(name, name)}")
+                    lines.append(f"# TYPE {name} {kind}")
+                labels = item["labels"]
+                if kind == "counter":
+                    lines.append(f"{name}{_format_labels(labels)} {_format_value(item['value'])}")
+                    continue
+                for le, count in item["buckets"].items():
+                    lines.append(f"{name}_bucket{_format_labels({**labels, 'le': le})} {count}")
+                lines.append(f"{name}_sum{_format_labels(labels)} {_format_value(item['sum'])}")
+                lines.append(f"{name}_count{_format_labels(labels)} {item['count']}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def write_jsonl(self, path: Path) -> None:
+        """Acrescenta um snapshot com timestamp ao arquivo JSONL."""
+        if not self.enabled:
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({"timestamp": time.time(), **self.snapshot()}, ensure_ascii=False)
+        with open(path, "a", encoding="utf-8") as handle:
+            handle.write(line + "\n")
+
+    def _bucket_labels(self) -> List[str]:
+        """Limites `le` dos buckets, terminando em +Inf."""
+        return [_format_value(bound) for bound in self.buckets] + ["+Inf"]
+
+
+def _cumulative(counts: Sequence[int]) -> List[int]:
+    """Contagens acumuladas (formato `le` do Prometheus)."""
+    total = 0
+    result = []
+    for count in counts:
+        total += count
+        result.append(total)
+    return result
+
+
+def _format_labels(labels: Dict[str, str]) -> str:
+    """{chave="valor",...} com escape de barra, aspas e quebra de linha."""
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def _escape(value: object) -> str:
+    """Escape de valor de label do Prometheus."""
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Numero sem casas decimais desnecessarias."""
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+_REGISTRY = MetricsRegistry()
+
+
+def get_metrics() -> MetricsRegistry:
+    """Registry global do processo (desabilitado ate `configure_metrics`)."""
+    return _REGISTRY
+
+
+def configure_metrics(enabled: bool) -> MetricsRegistry:
+    """Liga ou desliga a coleta no registry global."""
+    _REGISTRY.enabled = enabled
+    return _REGISTRY
+
+
+class MetricsServer:
+    """Endpoint HTTP local com GET /metrics em texto Prometheus (thread daemon)."""
+
+    def __init__(self, registry: MetricsRegistry, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.registry = registry
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def address(self) -> Tuple[str, int]:
+        """Host e porta efetivos."""
+        host, port = self._httpd.server_address[:2]
+        return host, port
+
+    def start(self) -> None:
+        """Sobe o servidor em background."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="metrics", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Encerra o servidor."""
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _handler(self):
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                if self.path.split("?")[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = registry.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
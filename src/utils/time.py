@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, time as dt_time
+from datetime import datetime, timedelta, time as dt_time, timezone
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 
@@ -15,9 +16,15 @@ WEEKDAYS = [
 ]
 
 
+@lru_cache(maxsize=None)
+def get_zone(tz_name: str) -> ZoneInfo:
+    """ZoneInfo em cache por nome."""
+    return ZoneInfo(tz_name)
+
+
 def now_in_tz(tz_name: str) -> datetime:
     """Retorna agora no timezone informado."""
-    return datetime.now(ZoneInfo(tz_name))
+    return datetime.now(get_zone(tz_name))
 
 
 def parse_time_hhmm(value: str) -> dt_time:
@@ -26,16 +33,27 @@ def parse_time_hhmm(value: str) -> dt_time:
     return dt_time(hour=int(hour), minute=int(minute))
 
 
+def next_occurrence(weekday_index: int, target_time: dt_time, zone: ZoneInfo, base: datetime) -> datetime:
+    """Proxima ocorrencia estritamente apos `base`, comparando instantes reais.
+
+    Horarios inexistentes (inicio do horario de verao) sao deslocados para depois
+    da transicao; horarios ambiguos usam a primeira ocorrencia (fold=0).
+    """
+    local = base.astimezone(zone)
+    days_ahead = (weekday_index - local.weekday()) % 7
+    for weeks in range(3):
+        day = local.date() + timedelta(days=days_ahead + 7 * weeks)
+        candidate = _normalize(datetime.combine(day, target_time, tzinfo=zone))
+        if candidate.timestamp() > base.timestamp():
+            return candidate
+    raise RuntimeError("ocorrencia nao encontrada")  # pragma: no cover - inalcancavel
+
+
 def next_datetime_for(weekday: str, time_str: str, tz_name: str, base: datetime) -> datetime:
     """Calcula proxima ocorrencia do dia/horario informado."""
-    target_time = parse_time_hhmm(time_str)
-    weekday_index = WEEKDAYS.index(weekday)
-    days_ahead = (weekday_index - base.weekday()) % 7
-    candidate = datetime.combine(
-        (base + timedelta(days=days_ahead)).date(),
-        target_time,
-        tzinfo=ZoneInfo(tz_name),
-    )
-    if candidate <= base:
-        candidate += timedelta(days=7)
-    return candidate
+    return next_occurrence(WEEKDAYS.index(weekday), parse_time_hhmm(time_str), get_zone(tz_name), base)
+
+
+def _normalize(value: datetime) -> datetime:
+    """Ida e volta por UTC: corrige horarios que caem no buraco do horario de verao."""
+    return value.astimezone(timezone.utc).astimezone(value.tzinfo)
@@ -0,0 +1,126 @@
+import json
+import subprocess
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from src.http_client import HttpClient
+
+
+class StubServer:
+    """Servidor HTTP local que responde com payloads configurados pelo teste."""
+
+    def __init__(self) -> None:
+        self.body = b""
+        self.status = 200
+        self.headers: dict = {}
+        self.requests: list = []
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self._thread = threading.Thread(target=self._httpd.serve_forever, args=(0.05,), daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address
+        return f"http://{host}:{port}"
+
+    def set_json(self, payload, headers=None, status=200) -> None:
+        self.body = json.dumps(payload).encode("utf-8")
+        self.headers = dict(headers or {})
+        self.status = status
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):  # noqa: N802
+                server.requests.append({"path": self.path, "headers": dict(self.headers)})
+                etag = server.headers.get("ETag")
+                if etag and self.headers.get("If-None-Match") == etag:
+                    self.send_response(304)
+                    self.end_headers()
+                    return
+                self.send_response(server.status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(server.body)))
+                for key, value in server.headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(server.body)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def fast_http():
+    client = HttpClient(timeout=5, rate_per_second=1000, burst=10)
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def problemset_payload():
+    return {
+        "status": "OK",
+        "result": {
+            "problems": [
+                {"contestId": 1763, "index": "A", "name": "Absolute Maximization", "rating": 800, "tags": ["greedy", "math"]},
+                {"contestId": 1500, "index": "B", "name": "Two Arrays", "rating": 1400, "tags": ["dp"]},
+                {"contestId": 1200, "index": "C", "name": "No Rating", "tags": ["math"]},
+            ],
+            "problemStatistics": [],
+        },
+    }
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    _git(repo, "init", "-q", "-b", "main")
+    _git(repo, "config", "user.email", "bot@example.com")
+    _git(repo, "config", "user.name", "bot")
+    (repo / "INDEX.md").write_text("# Desafios\n", encoding="utf-8")
+    _git(repo, "add", ".")
+    _git(repo, "commit", "-q", "-m", "init")
+    return repo
+
+
+@pytest.fixture
+def warm_cache(tmp_path, problemset_payload):
+    from src.providers.cache import ProblemsetCache
+
+    cache_path = tmp_path / "cache" / "problemset.json"
+    cache_path.parent.mkdir()
+    cache_path.write_text(
+        json.dumps({"version": "v1", "problems": problemset_payload["result"]["problems"]}),
+        encoding="utf-8",
+    )
+    cache_path.with_name("problemset.json.meta").write_text(
+        json.dumps({"version": "v1", "fetched_at": time.time(), "etag": None, "last_modified": None}),
+        encoding="utf-8",
+    )
+    return ProblemsetCache(path=cache_path, url="http://127.0.0.1:9/unused", ttl_seconds=3600)
@@ -0,0 +1,128 @@
+import asyncio
+import json
+import subprocess
+
+from src.async_runtime import AsyncRuntime
+from src.git_client import GitClient
+from src.providers.codeforces import CodeforcesProvider
+from src.repo_writer import RepoWriter
+from src.scheduler import Scheduler
+from src.settings import Settings
+from src.solver.template_solver import TemplateSolver
+from src.state_store import StateStore, job_key
+
+
+def _runtime(repo, cache, max_retries=0) -> AsyncRuntime:
+    settings = Settings.model_validate(
+        {
+            "repo_path": str(repo),
+            "backoff_seconds": 0,
+            "max_retries": max_retries,
+            "tests": {"mode": "subprocess"},
+            "runtime": {"mode": "async", "status_port": 0},
+            "schedule": {"monday": [{"time": "09:00", "rating_range": [800, 1400]}]},
+        }
+    )
+    scheduler = Scheduler(
+        settings=settings,
+        state_store=StateStore(path=repo / "state" / "state.jsonl"),
+        provider=CodeforcesProvider(cache=cache),
+        solver=TemplateSolver(),
+        writer=RepoWriter(repo_path=repo),
+        git_client=GitClient(repo_path=repo, remote=None, branch="main"),
+    )
+    return AsyncRuntime(scheduler=scheduler)
+
+
+async def _request(address, method, path):
+    reader, writer = await asyncio.open_connection(*address)
+    writer.write(f"{method} {path} HTTP/1.1\r\nHost: x\r\n\r\n".encode())
+    await writer.drain()
+    raw = await reader.read()
+    writer.close()
+    head, body = raw.split(b"\r\n\r\n", 1)
+    return int(head.split()[1]), json.loads(body)
+
+
+def test_concurrent_jobs_commit_serially_and_status_endpoint(git_repo, warm_cache):
+    runtime = _runtime(git_repo, warm_cache)
+    job = runtime.scheduler.settings.schedule["monday"][0]
+
+    async def scenario():
+        await runtime.start()
+        try:
+            problems = await asyncio.gather(runtime.run_job(job), runtime.run_job(job))
+            status_code, status = await _request(runtime.status_address, "GET", "/status")
+            missing, _ = await _request(runtime.status_address, "POST", "/trigger?day=friday")
+            queued, _ = await _request(runtime.status_address, "POST", "/trigger?day=monday&time=09:00")
+            return problems, status_code, status, missing, queued
+        finally:
+            await runtime.stop()
+
+    problems, status_code, status, missing, queued = asyncio.run(scenario())
+
+    assert sorted(problem.problem_id for problem in problems) == ["codeforces:1500:B", "codeforces:1763:A"]
+    assert status_code == 200 and status["completed"] == 2 and status["running"] == []
+    assert (missing, queued) == (404, 202)
+    assert runtime.status()["pending_triggers"] == 1
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=git_repo, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert len(log) == 3
+
+
+def test_push_failure_retries_only_the_push(git_repo, warm_cache):
+    runtime = _runtime(git_repo, warm_cache, max_retries=1)
+    scheduler = runtime.scheduler
+    job = scheduler.settings.schedule["monday"][0]
+    pushes = []
+
+    async def flaky_push():
+        pushes.append(len(pushes))
+        if len(pushes) == 1:
+            raise RuntimeError("git failed: remote indisponivel")
+
+    scheduler.git_client.apush = flaky_push
+
+    async def scenario():
+        await runtime.start()
+        try:
+            return await runtime.run_job(job)
+        finally:
+            await runtime.stop()
+
+    problem = asyncio.run(scenario())
+
+    assert problem is not None and len(pushes) == 2
+    assert set(scheduler.state_store.used_ids()) == {problem.problem_id}
+    assert scheduler.state_store.get_checkpoint(job_key(job.model_dump())) is None
+    assert len(list((git_repo / "challenges").glob("*/*"))) == 1
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=git_repo, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert len(log) == 2
+
+
+def test_abandoned_job_releases_its_problem(git_repo, warm_cache):
+    runtime = _runtime(git_repo, warm_cache)
+    scheduler = runtime.scheduler
+    job = scheduler.settings.schedule["monday"][0]
+    selected = []
+
+    def failing_tests(report):
+        selected.append(scheduler.state_store.get_checkpoint(job_key(job.model_dump()))["problem"])
+        raise RuntimeError("testes falharam")
+
+    scheduler.check_tests = failing_tests
+
+    async def scenario():
+        await runtime.start()
+        try:
+            return await runtime.run_job(job)
+        finally:
+            await runtime.stop()
+
+    assert asyncio.run(scenario()) is None
+    problem_id = "codeforces:{contest_id}:{index}".format(**selected[0])
+    assert problem_id not in runtime._reserved
+    assert runtime.failed == 1
@@ -0,0 +1,38 @@
+import json
+
+from src.executor import SolutionExecutor
+
+
+def _mkdir(path):
+    path.mkdir()
+    return path
+
+
+def _challenge(tmp_path, body):
+    (tmp_path / "solution.py").write_text(body, encoding="utf-8")
+    samples = tmp_path / "samples"
+    samples.mkdir()
+    (samples / "01.in").write_text("2 3\n", encoding="utf-8")
+    (samples / "01.out").write_text("5\n", encoding="utf-8")
+    return tmp_path
+
+
+def test_measures_cases_and_appends_perf(tmp_path):
+    challenge = _challenge(tmp_path, "a, b = map(int, input().split())\nprint(a + b)\n")
+    report = SolutionExecutor().benchmark(challenge)
+
+    case = report.cases[0]
+    assert case.status == "ok" and case.output_matches
+    assert case.cpu_seconds is not None and case.peak_rss_kb
+    entry = json.loads((challenge / "perf.jsonl").read_text(encoding="utf-8"))
+    assert entry["cases"][0]["name"] == "01"
+
+
+def test_flags_cpu_and_memory_limits(tmp_path):
+    slow = SolutionExecutor(time_limit_seconds=1).benchmark(_challenge(_mkdir(tmp_path / "slow"), "while True:\n    pass\n"))
+    big = SolutionExecutor(memory_limit_mb=64).benchmark(
+        _challenge(_mkdir(tmp_path / "big"), "data = bytearray(512 * 1024 * 1024)\n")
+    )
+
+    assert [case.status for case in slow.exceeded] == ["tle"]
+    assert [case.status for case in big.exceeded] == ["mle"]
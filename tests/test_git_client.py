@@ -0,0 +1,58 @@
+import shutil
+import subprocess
+
+import pytest
+
+from src.git_client import GitClient
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout
+
+
+def test_plumbing_commits_only_given_paths(git_repo):
+    challenge = git_repo / "challenges" / "2025-12" / "cf_1_A_x"
+    challenge.mkdir(parents=True)
+    (challenge / "solution.py").write_text("print(1)\n", encoding="utf-8")
+    (challenge / "__pycache__").mkdir()
+    (challenge / "__pycache__" / "solution.cpython-311.pyc").write_bytes(b"\0")
+    (git_repo / ".gitignore").write_text("__pycache__/\n", encoding="utf-8")
+    (git_repo / "INDEX.md").write_text("# Desafios\n- x\n", encoding="utf-8")
+    (git_repo / "scratch.txt").write_text("nao commitar\n", encoding="utf-8")
+
+    client = GitClient(repo_path=git_repo, remote=None, branch="main", mode="plumbing")
+    client.add_paths([challenge, git_repo / "INDEX.md"])
+    client.commit("chore(cf): add x")
+
+    files = _git(git_repo, "show", "--name-only", "--format=%s", "HEAD").split()
+    assert files == ["chore(cf):", "add", "x", "INDEX.md", "challenges/2025-12/cf_1_A_x/solution.py"]
+    status = _git(git_repo, "status", "--porcelain")
+    assert "INDEX.md" not in status and "cf_1_A_x" not in status
+    assert "scratch.txt" in status
+
+
+def test_plumbing_refuses_empty_commit(git_repo):
+    client = GitClient(repo_path=git_repo, remote=None, branch="main", mode="plumbing")
+    client.add_paths([git_repo / "INDEX.md"])
+    with pytest.raises(RuntimeError):
+        client.commit("vazio")
+
+
+def test_plumbing_stages_files_removed_from_challenge(git_repo):
+    challenge = git_repo / "challenges" / "2025-12" / "cf_1_A_x"
+    challenge.mkdir(parents=True)
+    (challenge / "solution.py").write_text("print(1)\n", encoding="utf-8")
+    (challenge / "notes.md").write_text("rascunho\n", encoding="utf-8")
+    client = GitClient(repo_path=git_repo, remote=None, branch="main", mode="plumbing")
+    client.add_paths([challenge])
+    client.commit("chore(cf): add x")
+
+    shutil.rmtree(challenge)
+    challenge.mkdir()
+    (challenge / "solution.py").write_text("print(2)\n", encoding="utf-8")
+    client.add_paths([challenge])
+    client.commit("chore(cf): rewrite x")
+
+    tracked = _git(git_repo, "ls-tree", "-r", "--name-only", "HEAD", "challenges").split()
+    assert tracked == ["challenges/2025-12/cf_1_A_x/solution.py"]
+    assert _git(git_repo, "status", "--porcelain", "challenges") == ""
@@ -0,0 +1,36 @@
+import time
+
+import pytest
+
+from src.http_client import CircuitOpenError, HttpClient, TokenBucket
+
+
+def test_token_bucket_spaces_calls():
+    bucket = TokenBucket(rate_per_second=20, capacity=1)
+    start = time.perf_counter()
+    for _ in range(4):
+        bucket.acquire()
+    assert time.perf_counter() - start >= 0.14
+
+
+def test_circuit_opens_after_repeated_errors(stub_server):
+    stub_server.set_json({"status": "FAILED"}, status=503)
+    client = HttpClient(timeout=5, rate_per_second=1000, burst=10, failure_threshold=2, reset_seconds=0.2)
+
+    for _ in range(2):
+        assert client.get(stub_server.url).status_code == 503
+    with pytest.raises(CircuitOpenError):
+        client.get(stub_server.url)
+    assert len(stub_server.requests) == 2
+
+    time.sleep(0.25)
+    stub_server.set_json({"status": "OK"})
+    assert client.get(stub_server.url).status_code == 200
+    assert client.breaker.state == "closed"
+
+    metrics = client.metrics.snapshot()
+    assert metrics["requests"] == 3 and metrics["rejected"] == 1 and metrics["errors"] == 2
+    assert metrics["status_counts"] == {503: 2, 200: 1}
+    assert metrics["bytes_received"] == 2 * len(b'{"status": "FAILED"}') + len(b'{"status": "OK"}')
+    assert stub_server.requests[-1]["headers"]["Accept-Encoding"] == "gzip"
+    client.close()
@@ -0,0 +1,49 @@
+import json
+
+from src.providers.base import Problem
+from src.repo_writer import RepoWriter
+from src.solver.template_solver import TemplateSolver
+
+
+def _problem(index="A", name="Absolute Maximization", rating=800, tags=("greedy", "math")):
+    return Problem(
+        source="codeforces",
+        contest_id=1763,
+        index=index,
+        name=name,
+        rating=rating,
+        tags=list(tags),
+        url=f"https://codeforces.com/problemset/problem/1763/{index}",
+    )
+
+
+def _write(writer, problem):
+    return writer.write_problem(problem, TemplateSolver().generate(problem, "python"), "UTC")
+
+
+def test_retry_does_not_duplicate_index_entry(tmp_path):
+    writer = RepoWriter(repo_path=tmp_path)
+    problem = _problem()
+    _write(writer, problem)
+    _write(writer, problem)
+    _write(writer, _problem(index="B", name="Pipe | Dream", rating=None, tags=()))
+
+    index = writer.index_path.read_text(encoding="utf-8")
+    assert index.count("Absolute Maximization") == 1
+    assert index.count("\n## ") == 1
+    assert "| 800 | greedy, math |" in index
+    assert "Pipe \\| Dream" in index and "| N/A | N/A |" in index
+    manifest = json.loads(writer.manifest_path.read_text(encoding="utf-8"))
+    assert sorted(manifest) == ["codeforces:1763:A", "codeforces:1763:B"]
+
+
+def test_reindex_rebuilds_same_index_from_disk(tmp_path):
+    writer = RepoWriter(repo_path=tmp_path)
+    _write(writer, _problem())
+    _write(writer, _problem(index="B", name="Other"))
+    expected = writer.index_path.read_text(encoding="utf-8")
+
+    writer.manifest_path.unlink()
+    writer.index_path.unlink()
+    assert RepoWriter(repo_path=tmp_path).reindex() == 2
+    assert writer.index_path.read_text(encoding="utf-8") == expected
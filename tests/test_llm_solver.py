@@ -0,0 +1,112 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.providers.base import Problem
+from src.solver.cache import SolutionCache
+from src.solver.llm_solver import LLMSolver, SolverTimeoutError, extract_code
+from src.solver.stub_backend import StubBackend
+
+
+def _problem(index="A"):
+    return Problem(
+        source="codeforces",
+        contest_id=1500,
+        index=index,
+        name=f"Problem {index}",
+        rating=1200,
+        tags=("dp",),
+        url=f"https://codeforces.com/problemset/problem/1500/{index}",
+    )
+
+
+class _CountingBackend(StubBackend):
+    """Stub que registra o pico de chamadas simultaneas."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.active = 0
+        self.peak = 0
+        self._gauge = threading.Lock()
+
+    def complete(self, prompt, timeout):
+        with self._gauge:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        try:
+            return super().complete(prompt, timeout)
+        finally:
+            with self._gauge:
+                self.active -= 1
+
+
+def test_rerun_reuses_cached_response(tmp_path):
+    backend = StubBackend()
+    first = LLMSolver(backend, SolutionCache(tmp_path)).generate(_problem(), "cpp")
+    again = LLMSolver(backend, SolutionCache(tmp_path)).generate(_problem(), "cpp")
+
+    assert backend.calls == 1
+    assert again.solution == first.solution
+    assert again.solution.startswith("// Gerado por stub-1")
+    assert again.solution_filename == "solution.cpp"
+
+    LLMSolver(StubBackend(model="stub-2"), SolutionCache(tmp_path)).generate(_problem(), "cpp")
+    assert len(list(tmp_path.glob("*/*.json"))) == 2
+
+
+def test_concurrent_generation_respects_in_flight_limit(tmp_path):
+    backend = _CountingBackend(latency_seconds=0.05)
+    solver = LLMSolver(backend, SolutionCache(tmp_path), max_in_flight=2)
+    problems = [_problem(index) for index in "ABCDEF"] * 2
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda problem: solver.generate(problem, "python"), problems))
+
+    assert backend.peak == 2
+    assert backend.calls == 6
+
+
+def test_slow_backend_times_out_without_caching(tmp_path):
+    solver = LLMSolver(StubBackend(latency_seconds=5), SolutionCache(tmp_path), timeout_seconds=0.1)
+
+    start = time.monotonic()
+    with pytest.raises(TimeoutError):
+        solver.generate(_problem(), "python")
+    assert time.monotonic() - start < 1
+    assert not list(tmp_path.glob("*/*.json"))
+    assert issubclass(SolverTimeoutError, TimeoutError)
+
+
+class _LateBackend(StubBackend):
+    """Stub que ignora o timeout recebido."""
+
+    def complete(self, prompt, timeout):
+        time.sleep(self.latency_seconds)
+        return super().complete(prompt, timeout=self.latency_seconds + 1)
+
+
+def test_late_response_is_cached_and_waiters_honor_timeout(tmp_path):
+    backend = _LateBackend(latency_seconds=0.3)
+    solver = LLMSolver(backend, SolutionCache(tmp_path), timeout_seconds=0.1)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        leader = pool.submit(solver.generate, _problem(), "python")
+        time.sleep(0.02)
+        start = time.monotonic()
+        with pytest.raises(SolverTimeoutError):
+            solver.generate(_problem(), "python")
+        assert time.monotonic() - start < 0.25
+        assert leader.result().solution
+
+    solver.generate(_problem(), "python")
+    assert backend.calls == 1
+    assert solver._key_locks == {}
+
+
+def test_extract_code_prefers_fenced_block():
+    assert extract_code("Segue:\n```go\npackage main\n```\nfim") == "package main"
+    assert extract_code("print(1)\n") == "print(1)"
+    with pytest.raises(ValueError):
+        extract_code("```\n\n```")
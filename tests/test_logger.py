@@ -0,0 +1,83 @@
+import json
+import logging
+import sys
+
+import pytest
+from pydantic import ValidationError
+
+from src.settings import LoggingSettings
+from src.utils.logger import LEVEL_ENV, JsonFormatter, configure_logging, get_logger, log_context, shutdown_logging
+
+
+@pytest.fixture(autouse=True)
+def reset_logging(monkeypatch):
+    monkeypatch.delenv(LEVEL_ENV, raising=False)
+    yield
+    monkeypatch.delenv(LEVEL_ENV, raising=False)
+    configure_logging()
+    shutdown_logging()
+
+
+class _Counting:
+    def __init__(self):
+        self.calls = 0
+
+    def __str__(self):
+        self.calls += 1
+        return "valor"
+
+
+def test_json_file_output_carries_context(tmp_path):
+    path = tmp_path / "logs" / "autofeedr.log"
+    configure_logging(json_format=True, file_path=path)
+    logger = get_logger("test_logger")
+
+    with log_context(job="abc123", problem_id="codeforces:1:A"):
+        with log_context(stage="solve"):
+            logger.info("ola %s", "mundo")
+        logger.warning("fora da etapa")
+    shutdown_logging()
+
+    first, second = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert first["message"] == "ola mundo"
+    assert first["level"] == "INFO"
+    assert (first["job"], first["problem_id"], first["stage"]) == ("abc123", "codeforces:1:A", "solve")
+    assert "stage" not in second
+    assert second["job"] == "abc123"
+
+
+def test_json_output_keeps_exc_info_without_dispatcher():
+    logger = logging.getLogger("test_logger.direct")
+    try:
+        raise ValueError("quebrou")
+    except ValueError:
+        record = logger.makeRecord(logger.name, logging.ERROR, __file__, 0, "falhou", None, sys.exc_info())
+
+    payload = json.loads(JsonFormatter().format(record))
+    assert payload["message"] == "falhou"
+    assert "ValueError: quebrou" in payload["exc"]
+
+
+def test_filtered_level_skips_formatting():
+    configure_logging(level="WARNING")
+    logger = get_logger("test_logger")
+    value = _Counting()
+
+    logger.info("ignorado %s", value)
+    logger.warning("registrado %s", value)
+    shutdown_logging()
+
+    assert value.calls == 1
+
+
+def test_env_level_overrides_settings(monkeypatch):
+    monkeypatch.setenv(LEVEL_ENV, "debug")
+    configure_logging(level="ERROR")
+
+    assert get_logger("test_logger").isEnabledFor(logging.DEBUG)
+
+
+def test_logging_settings_reject_unknown_level():
+    assert LoggingSettings(level="warning").level == "WARNING"
+    with pytest.raises(ValidationError):
+        LoggingSettings(level="verbose")
@@ -0,0 +1,98 @@
+import json
+import urllib.request
+
+import pytest
+
+from src.git_client import GitClient
+from src.providers.codeforces import CodeforcesProvider
+from src.repo_writer import RepoWriter
+from src.scheduler import Scheduler
+from src.settings import Settings
+from src.solver.template_solver import TemplateSolver
+from src.state_store import StateStore
+from src.utils.metrics import CACHE_TOTAL, STAGE_SECONDS, MetricsRegistry, MetricsServer, configure_metrics
+
+
+@pytest.fixture
+def global_metrics():
+    registry = configure_metrics(True)
+    registry.reset()
+    yield registry
+    configure_metrics(False)
+    registry.reset()
+
+
+def test_prometheus_text_has_cumulative_buckets():
+    registry = MetricsRegistry(enabled=True, buckets=(0.1, 1.0))
+    registry.observe(STAGE_SECONDS, 0.05, stage="test")
+    registry.observe(STAGE_SECONDS, 0.5, stage="test")
+    registry.observe(STAGE_SECONDS, 3.0, stage="test")
+    registry.inc(CACHE_TOTAL, cache='a"b', result="hit")
+
+    text = registry.render_prometheus()
+
+    assert "# TYPE autofeedr_stage_seconds histogram" in text
+    assert 'autofeedr_stage_seconds_bucket{stage="test",le="0.1"} 1' in text
+    assert 'autofeedr_stage_seconds_bucket{stage="test",le="1"} 2' in text
+    assert 'autofeedr_stage_seconds_bucket{stage="test",le="+Inf"} 3' in text
+    assert 'autofeedr_stage_seconds_count{stage="test"} 3' in text
+    assert 'autofeedr_cache_requests_total{cache="a\\"b",result="hit"} 1' in text
+
+
+def test_disabled_registry_records_nothing(tmp_path):
+    registry = MetricsRegistry(enabled=False)
+    with registry.timer(STAGE_SECONDS, stage="select") as timer:
+        registry.inc(CACHE_TOTAL)
+
+    assert timer is None
+    assert registry.snapshot() == {"counters": [], "histograms": []}
+    registry.write_jsonl(tmp_path / "metrics.jsonl")
+    assert not (tmp_path / "metrics.jsonl").exists()
+
+
+def test_metrics_server_exposes_registry():
+    registry = MetricsRegistry(enabled=True)
+    registry.inc(CACHE_TOTAL, cache="problemset", result="hit")
+    server = MetricsServer(registry, port=0)
+    server.start()
+    try:
+        host, port = server.address
+        with urllib.request.urlopen(f"http://{host}:{port}/metrics", timeout=5) as resp:
+            body = resp.read().decode("utf-8")
+            assert resp.headers["Content-Type"].startswith("text/plain")
+    finally:
+        server.stop()
+
+    assert 'autofeedr_cache_requests_total{cache="problemset",result="hit"} 1' in body
+
+
+def test_job_stages_are_timed_and_exported(git_repo, warm_cache, global_metrics):
+    settings = Settings.model_validate(
+        {
+            "repo_path": str(git_repo),
+            "git_remote": None,
+            "max_retries": 0,
+            "metrics": {"enabled": True, "jsonl_path": "state/metrics.jsonl"},
+            "schedule": {"monday": [{"time": "09:00", "rating_range": [800, 1400]}]},
+        }
+    )
+    scheduler = Scheduler(
+        settings=settings,
+        state_store=StateStore(path=git_repo / "state" / "state.jsonl"),
+        provider=CodeforcesProvider(cache=warm_cache),
+        solver=TemplateSolver(),
+        writer=RepoWriter(repo_path=git_repo),
+        git_client=GitClient(repo_path=git_repo, remote=None, branch="main"),
+    )
+    try:
+        scheduler.run_once()
+    finally:
+        scheduler.close()
+
+    lines = (git_repo / "state" / "metrics.jsonl").read_text(encoding="utf-8").splitlines()
+    snapshot = json.loads(lines[-1])
+    stages = {item["labels"]["stage"] for item in snapshot["histograms"] if item["name"] == STAGE_SECONDS}
+    assert stages == {"select", "solve", "write", "test", "commit", "push"}
+    counters = {(item["name"], tuple(sorted(item["labels"].items()))): item["value"] for item in snapshot["counters"]}
+    assert counters[("autofeedr_jobs_total", (("status", "ok"),))] == 1
+    assert counters[(CACHE_TOTAL, (("cache", "problemset"), ("result", "hit")))] >= 1
@@ -0,0 +1,46 @@
+import random
+
+from src.providers import base
+from src.providers.index import ProblemIndex
+
+
+def _catalog(size: int) -> list:
+    tags = ["math", "greedy", "dp", "graphs"]
+    return [
+        {
+            "contestId": 1000 + i,
+            "index": "A",
+            "name": f"P{i}",
+            "rating": 800 + (i % 10) * 100,
+            "tags": [tags[i % 4], tags[(i + 1) % 4]],
+        }
+        for i in range(size)
+    ]
+
+
+def test_candidates_intersect_rating_and_tags():
+    index = ProblemIndex.build(_catalog(200) + [{"contestId": 1, "index": "A", "tags": ["math"]}], "v1")
+    positions = index.candidates(1000, 1200, ["math", "greedy"])
+    assert positions
+    for pos in positions:
+        problem = index.problems[pos]
+        assert 1000 <= problem.rating <= 1200
+        assert {"math", "greedy"} <= set(problem.tags)
+    assert "codeforces:1:A" not in index.ids
+
+
+def test_pick_respects_exclusions():
+    index = ProblemIndex.build(_catalog(40), "v1")
+    eligible = [index.ids[pos] for pos in index.candidates(800, 900, None)]
+    used = set(eligible[:-1])
+    pid, _ = index.pick(800, 900, None, exclude=used, rng=random.Random(7))
+    assert pid == eligible[-1]
+    assert index.pick(800, 900, None, exclude=set(eligible)) is None
+
+
+def test_build_precomputes_slugs_in_batch(monkeypatch):
+    monkeypatch.setattr(base, "_slug_cache", {})
+    ProblemIndex.build([{"contestId": 1, "index": "A", "name": "Two  Arrays!", "rating": 800, "tags": []}], "v1")
+
+    assert base._slug_cache == {"Two  Arrays!": "two-arrays"}
+    assert base.slugify("Two  Arrays!") == "two-arrays"
@@ -0,0 +1,45 @@
+import dataclasses
+import json
+
+import pytest
+
+from src.providers.base import Problem, slugify, slugify_many
+
+
+def _legacy_slug(name):
+    safe = "".join(ch.lower() if ch.isalnum() else "-" for ch in name).strip("-")
+    while "--" in safe:
+        safe = safe.replace("--", "-")
+    return safe
+
+
+NAMES = ["Absolute Maximization", "  A--B__c  ", "Ação & Reação!", "K-th Path (hard version)", "???", "x_y"]
+
+
+def test_slug_matches_previous_rules():
+    assert [slugify(name) for name in NAMES] == [_legacy_slug(name) for name in NAMES]
+    assert slugify_many(NAMES) == [_legacy_slug(name) for name in NAMES]
+
+
+def test_problem_is_frozen_and_roundtrips_checkpoints():
+    legacy = {
+        "source": "codeforces",
+        "contest_id": 1,
+        "index": "A",
+        "name": "???",
+        "rating": None,
+        "tags": ["math"],
+        "url": "u",
+    }
+    problem = Problem(**legacy)
+    assert (problem.problem_id, problem.slug, problem.tags) == ("codeforces:1:A", "1a", ("math",))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        problem.name = "x"
+    assert not hasattr(problem, "__dict__")
+
+    restored = Problem.from_dict(json.loads(json.dumps(dataclasses.asdict(problem))))
+    assert restored == problem and restored.slug == "1a"
+    renamed = Problem.from_dict({**dataclasses.asdict(problem), "name": "Two Arrays", "slug": "stale"})
+    assert (renamed.slug, renamed.problem_id) == ("two-arrays", "codeforces:1:A")
+    with pytest.raises(TypeError):
+        Problem(**dataclasses.asdict(problem))
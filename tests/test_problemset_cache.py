@@ -0,0 +1,46 @@
+import requests
+
+from src.providers.cache import ProblemsetCache
+from src.providers.codeforces import CodeforcesProvider
+
+
+def test_warm_cache_skips_network(tmp_path, stub_server, problemset_payload):
+    stub_server.set_json(problemset_payload)
+    cache = ProblemsetCache(path=tmp_path / "problemset.json", url=stub_server.url, ttl_seconds=3600)
+    provider = CodeforcesProvider(cache=cache)
+
+    problem = provider.fetch_problem("easy", None, ["math"], used_ids=set())
+    assert problem.problem_id == "codeforces:1763:A"
+
+    reloaded = ProblemsetCache(path=tmp_path / "problemset.json", url=stub_server.url, ttl_seconds=3600)
+    assert len(reloaded.get().problems) == 3
+    assert len(stub_server.requests) == 1
+
+
+def test_revalidates_with_etag(tmp_path, stub_server, problemset_payload, fast_http):
+    stub_server.set_json(problemset_payload, headers={"ETag": '"v1"'})
+    cache = ProblemsetCache(path=tmp_path / "problemset.json", url=stub_server.url, ttl_seconds=0, http=fast_http)
+    first = cache.get()
+    second = cache.get()
+
+    assert second.version == first.version == '"v1"'
+    assert stub_server.requests[-1]["headers"]["If-None-Match"] == '"v1"'
+
+
+def test_serves_stale_snapshot_when_api_fails(tmp_path, stub_server, problemset_payload, fast_http):
+    stub_server.set_json(problemset_payload)
+    cache = ProblemsetCache(path=tmp_path / "problemset.json", url=stub_server.url, ttl_seconds=0, http=fast_http)
+    cache.get()
+
+    stub_server.set_json({"status": "FAILED"}, status=503)
+    assert len(cache.get().problems) == 3
+
+
+def test_cold_cache_propagates_errors(tmp_path, stub_server):
+    stub_server.set_json({"status": "FAILED"}, status=503)
+    cache = ProblemsetCache(path=tmp_path / "problemset.json", url=stub_server.url)
+    try:
+        cache.get()
+    except requests.HTTPError:
+        return
+    raise AssertionError("esperava HTTPError com cache frio")
@@ -0,0 +1,42 @@
+import json
+
+import pytest
+
+from src.providers.problemset import ProblemRecord, iter_problem_records, parse_problemset
+
+
+def _chunks(data: bytes, size: int):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 4096])
+def test_streaming_parse_matches_full_parse(problemset_payload, size):
+    problemset_payload["result"]["problems"][0]["name"] = "Ação, [ok]"
+    data = json.dumps(problemset_payload, ensure_ascii=False, indent=1).encode("utf-8")
+
+    records = parse_problemset(_chunks(data, size))
+
+    expected = [ProblemRecord.from_dict(problem) for problem in problemset_payload["result"]["problems"]]
+    assert records == expected
+    assert records[0].name == "Ação, [ok]" and records[2].rating is None
+
+
+def test_stops_before_problem_statistics(problemset_payload):
+    head = json.dumps(problemset_payload)[: -len('"problemStatistics": []}}')].encode("utf-8")
+    consumed = []
+
+    def stream():
+        consumed.append(head)
+        yield head
+        consumed.append(b"invalid")
+        yield b'"problemStatistics": [not json'
+
+    assert len(list(iter_problem_records(stream()))) == 3
+    assert consumed == [head]
+
+
+def test_api_error_and_truncated_payload():
+    with pytest.raises(RuntimeError, match="Codeforces API error"):
+        parse_problemset([b'{"status": "FAILED", "comment": "limit"}'])
+    with pytest.raises(ValueError):
+        parse_problemset([b'{"status": "OK", "result": {"problems": [{"contestId": 1'])
@@ -0,0 +1,101 @@
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.providers.base import Problem
+from src.providers.codeforces import CodeforcesProvider
+from src.providers.local import DirectoryProvider, LocalJsonProvider
+from src.providers.registry import ProviderRegistry, build_registry
+from src.settings import Settings
+
+
+PROBLEMS = [
+    {"contestId": 1, "index": "A", "name": "Soma", "rating": 800, "tags": ["math"]},
+    {"contestId": 1, "index": "B", "name": "Grafo", "rating": 1600, "tags": ["graphs"]},
+]
+
+
+class _Fixed:
+    """Provider de teste que devolve sempre o mesmo problema apos um atraso."""
+
+    def __init__(self, source: str, delay: float = 0.0, error: Exception | None = None) -> None:
+        self.source = source
+        self.delay = delay
+        self.error = error
+
+    def fetch_problem(self, difficulty, rating_range, tags, used_ids) -> Problem:
+        time.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return Problem(source=self.source, contest_id=1, index="A", name="X", rating=800, tags=(), url="")
+
+
+def test_local_json_provider_reads_api_dump(tmp_path):
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps({"status": "OK", "result": {"problems": PROBLEMS}}), encoding="utf-8")
+    provider = LocalJsonProvider(path, source="local")
+
+    problem = provider.fetch_problem("easy", None, None, used_ids=set())
+
+    assert problem.problem_id == "local:1:A"
+    assert problem.url == "local://local/1/A"
+    with pytest.raises(RuntimeError):
+        provider.fetch_problem("easy", None, None, used_ids={"local:1:A"})
+
+
+def test_directory_provider_skips_invalid_files(tmp_path):
+    for problem in PROBLEMS:
+        (tmp_path / f"{problem['index']}.json").write_text(json.dumps(problem), encoding="utf-8")
+    (tmp_path / "broken.json").write_text("{", encoding="utf-8")
+    provider = DirectoryProvider(tmp_path, source="mirror")
+
+    problem = provider.fetch_problem(None, (1500, 1700), ["graphs"], used_ids=set())
+
+    assert problem.problem_id == "mirror:1:B"
+
+
+def test_unnamed_problems_keep_provider_label(tmp_path):
+    unnamed = [{"contestId": 4, "index": "A", "rating": 800, "tags": []}]
+    snapshot = SimpleNamespace(version="v1", problems=unnamed)
+    codeforces = CodeforcesProvider(cache=SimpleNamespace(get=lambda: snapshot))
+    path = tmp_path / "dump.json"
+    path.write_text(json.dumps({"status": "OK", "result": {"problems": unnamed}}), encoding="utf-8")
+
+    assert codeforces.fetch_problem(None, None, None, used_ids=set()).name == "CF 4A"
+    assert LocalJsonProvider(path, source="local").fetch_problem(None, None, None, set()).name == "LOCAL 4A"
+
+
+def test_fan_out_prefers_first_success_within_budget():
+    registry = ProviderRegistry(
+        {
+            "slow": _Fixed("slow", delay=1.0),
+            "broken": _Fixed("broken", error=RuntimeError("offline")),
+            "fast": _Fixed("fast", delay=0.05),
+        }
+    )
+    try:
+        start = time.monotonic()
+        problem = registry.fetch_problem("easy", None, None, set(), providers=["slow", "broken", "fast"])
+        assert problem.source == "fast"
+        assert time.monotonic() - start < 0.9
+
+        with pytest.raises(RuntimeError, match="sem resposta"):
+            registry.fetch_problem("easy", None, None, set(), providers=["slow", "broken"], budget_seconds=0.1)
+    finally:
+        registry.close()
+
+
+def test_settings_reject_unknown_job_provider(tmp_path):
+    base = {
+        "repo_path": str(tmp_path),
+        "providers": {"local": {"type": "local_json", "path": "dump.json"}},
+        "schedule": {"monday": [{"time": "09:00", "difficulty": "easy", "providers": ["gym"]}]},
+    }
+    with pytest.raises(ValueError):
+        Settings.model_validate(base)
+
+    base["schedule"]["monday"][0]["providers"] = ["local"]
+    registry = build_registry(Settings.model_validate(base))
+    assert registry.names == ["local"]
@@ -0,0 +1,51 @@
+import subprocess
+
+from src.git_client import GitClient
+from src.push_queue import PushQueue
+
+
+def _git(repo, *args):
+    return subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True, text=True).stdout.strip()
+
+
+def _commit(repo, name):
+    (repo / name).write_text(name, encoding="utf-8")
+    _git(repo, "add", name)
+    _git(repo, "commit", "-q", "-m", name)
+
+
+def _bare_remote(tmp_path, repo):
+    remote = tmp_path / "remote.git"
+    _git(tmp_path, "init", "-q", "--bare", str(remote))
+    _git(repo, "remote", "add", "origin", str(remote))
+    return remote
+
+
+def test_coalesces_pending_commits_into_one_push(tmp_path, git_repo):
+    remote = _bare_remote(tmp_path, git_repo)
+    client = GitClient(repo_path=git_repo, remote="origin", branch="main")
+    queue = PushQueue(git_client=client, state_path=tmp_path / "push.json")
+    for name in ("a.txt", "b.txt", "c.txt"):
+        _commit(git_repo, name)
+        queue.enqueue()
+
+    queue.start()
+    assert queue.stop(flush_timeout=10)
+
+    assert queue.pushes == 1
+    assert _git(remote, "rev-parse", "main") == _git(git_repo, "rev-parse", "HEAD")
+
+
+def test_pending_push_survives_restart(tmp_path, git_repo):
+    client = GitClient(repo_path=git_repo, remote="origin", branch="main")
+    queue = PushQueue(git_client=client, state_path=tmp_path / "push.json", backoff_seconds=30)
+    queue.start()
+    _commit(git_repo, "a.txt")
+    queue.enqueue()
+    assert not queue.stop(flush_timeout=0.5)
+
+    remote = _bare_remote(tmp_path, git_repo)
+    resumed = PushQueue(git_client=client, state_path=tmp_path / "push.json")
+    resumed.start()
+    assert resumed.stop(flush_timeout=10)
+    assert _git(remote, "rev-parse", "main") == _git(git_repo, "rev-parse", "HEAD")
@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from src.providers.base import Problem
+from src.repo_writer import RepoWriter
+from src.solver.template_solver import TemplateSolver
+from src.utils import fs
+from src.utils.fs import publish_dir, remove_stale_staging
+
+
+def _problem(index):
+    return Problem(
+        source="codeforces",
+        contest_id=1500,
+        index=index,
+        name=f"Problem {index}",
+        rating=1200,
+        tags=["dp"],
+        url=f"https://codeforces.com/problemset/problem/1500/{index}",
+    )
+
+
+def test_publish_replaces_folder_without_leftovers(tmp_path):
+    target = tmp_path / "month" / "codeforces_1_A_x"
+    publish_dir({"a.txt": "1", "b.txt": "2"}, target)
+    publish_dir({"a.txt": "3"}, target, fsync="full")
+
+    assert sorted(os.listdir(target)) == ["a.txt"]
+    assert (target / "a.txt").read_text(encoding="utf-8") == "3"
+    assert os.listdir(tmp_path / "month") == ["codeforces_1_A_x"]
+
+
+def test_crash_while_staging_keeps_previous_folder(tmp_path, monkeypatch):
+    target = tmp_path / "codeforces_1_A_x"
+    publish_dir({"a.txt": "old"}, target)
+    real_write = fs.write_file
+
+    def _crash(path, content, fsync="none"):
+        if path.name == "b.txt":
+            raise OSError("disco cheio")
+        real_write(path, content, fsync)
+
+    monkeypatch.setattr(fs, "write_file", _crash)
+    with pytest.raises(OSError):
+        publish_dir({"a.txt": "new", "b.txt": "new"}, target)
+
+    assert os.listdir(tmp_path) == ["codeforces_1_A_x"]
+    assert (target / "a.txt").read_text(encoding="utf-8") == "old"
+
+
+def test_stale_cleanup_restores_moved_folder(tmp_path):
+    (tmp_path / ".replaced-codeforces_1_A_x-abcd1234").mkdir()
+    (tmp_path / ".staging-codeforces_1_A_x-abcd1234").mkdir()
+
+    assert remove_stale_staging(tmp_path) == 1
+    assert os.listdir(tmp_path) == ["codeforces_1_A_x"]
+
+
+def test_batch_writes_update_index_once(tmp_path, monkeypatch):
+    writer = RepoWriter(repo_path=tmp_path)
+    solver = TemplateSolver()
+    saves = []
+    monkeypatch.setattr(
+        "src.index_manifest.IndexManifest.save",
+        lambda self, fsync="none": saves.append(len(self.entries)),
+    )
+    problems = [_problem(index) for index in "ABC"]
+
+    paths = [
+        writer.write_problem(problem, solver.generate(problem, "python"), "UTC", update_index=False)
+        for problem in problems
+    ]
+    writer.update_index(list(zip(problems, paths)))
+
+    assert saves == [3]
+    assert all((path / "solution.py").exists() for path in paths)
+    assert writer.index_path.read_text(encoding="utf-8").count("| 1200 | dp |") == 3
@@ -0,0 +1,58 @@
+from datetime import datetime, timedelta
+
+from src.schedule import CompiledSchedule
+from src.settings import JobSettings
+from src.utils.time import get_zone, next_datetime_for
+
+
+NY = "America/New_York"
+
+
+def _job(time_str):
+    return JobSettings(time=time_str, difficulty="easy")
+
+
+def test_spring_forward_gap_shifts_after_transition():
+    base = datetime(2026, 3, 7, 12, 0, tzinfo=get_zone(NY))
+    fire_at = next_datetime_for("sunday", "02:30", NY, base)
+    assert fire_at.isoformat() == "2026-03-08T03:30:00-04:00"
+
+
+def test_fall_back_ambiguous_time_fires_once():
+    schedule = CompiledSchedule.compile({"sunday": [_job("01:30")]}, NY, datetime(2026, 10, 31, tzinfo=get_zone(NY)))
+    _, fire_at = schedule.peek()
+    assert fire_at.isoformat() == "2026-11-01T01:30:00-04:00"
+
+    fired = schedule.pop_due(fire_at)
+    assert len(fired) == 1
+    _, rearmed = schedule.peek()
+    assert rearmed.isoformat() == "2026-11-08T01:30:00-05:00"
+
+
+def test_pop_due_rearms_only_fired_job():
+    zone = get_zone("UTC")
+    now = datetime(2026, 10, 12, 8, 0, tzinfo=zone)  # segunda
+    jobs = {"monday": [_job("09:00"), _job("18:00")], "friday": [_job("07:00")]}
+    schedule = CompiledSchedule.compile(jobs, "UTC", now)
+
+    fired = schedule.pop_due(now + timedelta(hours=1))
+
+    assert [firing.job.time for firing in fired] == ["09:00"]
+    pending = [(entry.compiled.job.time, entry.fire_at.day) for entry in sorted(schedule._heap)]
+    assert pending == [("18:00", 12), ("07:00", 16), ("09:00", 19)]
+
+
+def test_misfire_policy_after_suspend():
+    zone = get_zone("UTC")
+    now = datetime(2026, 10, 12, 8, 0, tzinfo=zone)
+    jobs = {"monday": [_job("09:00")]}
+    resumed = now + timedelta(days=15)
+
+    run_once = CompiledSchedule.compile(jobs, "UTC", now)
+    fired = run_once.pop_due(resumed)
+    assert len(fired) == 1 and fired[0].misfired
+    assert run_once.peek()[1] > resumed
+
+    skip = CompiledSchedule.compile(jobs, "UTC", now, misfire_policy="skip")
+    assert skip.pop_due(resumed) == []
+    assert skip.peek()[1] > resumed
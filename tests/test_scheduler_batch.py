@@ -0,0 +1,202 @@
+import subprocess
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from src.git_client import GitClient
+from src.providers.codeforces import CodeforcesProvider
+from src.repo_writer import RepoWriter
+from src.scheduler import Scheduler
+from src.settings import JobSettings, Settings
+from src.solver.template_solver import TemplateSolver
+from src.state_store import StateStore, job_key
+
+
+_created: list = []
+
+
+@pytest.fixture(autouse=True)
+def _close_schedulers():
+    yield
+    while _created:
+        _created.pop().close()
+
+
+class FailingSolver(TemplateSolver):
+    """Gera testes que sempre falham."""
+
+    def __init__(self):
+        super().__init__()
+        self.problems = []
+
+    def generate(self, problem, language):
+        self.problems.append(problem.problem_id)
+        return replace(super().generate(problem, language), tests="def test_fail():\n    assert False\n")
+
+
+def _scheduler(repo, cache, solver=None, max_retries=0) -> Scheduler:
+    settings = Settings.model_validate(
+        {
+            "repo_path": str(repo),
+            "git_remote": None,
+            "backoff_seconds": 0,
+            "max_retries": max_retries,
+            "schedule": {"monday": [{"time": "09:00", "rating_range": [800, 1400]}]},
+        }
+    )
+    scheduler = Scheduler(
+        settings=settings,
+        state_store=StateStore(path=repo / "state" / "state.jsonl"),
+        provider=CodeforcesProvider(cache=cache),
+        solver=solver or TemplateSolver(),
+        writer=RepoWriter(repo_path=repo),
+        git_client=GitClient(repo_path=repo, remote=None, branch="main"),
+    )
+    _created.append(scheduler)
+    return scheduler
+
+
+def test_batch_never_selects_same_problem_twice(git_repo, warm_cache):
+    scheduler = _scheduler(git_repo, warm_cache)
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+
+    report = scheduler.run_batch([job, job, job])
+
+    assert sorted(report.completed) == ["codeforces:1500:B", "codeforces:1763:A"]
+    assert len(report.failed) == 1
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=git_repo, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert len(log) == 3
+
+
+def test_backfill_single_commit_and_resume(git_repo, warm_cache):
+    scheduler = _scheduler(git_repo, warm_cache)
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+
+    report = scheduler.run_backfill(job, count=2, batch_id="seed")
+    assert len(report.completed) == 2
+
+    resumed = _scheduler(git_repo, warm_cache).run_backfill(job, count=2, batch_id="seed")
+    assert resumed.completed == []
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=git_repo, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert log[0] == "chore(cf): add 2 challenges (seed)"
+    assert len(log) == 2
+
+
+def test_retry_resumes_from_checkpoint_with_same_problem(tmp_path, git_repo, warm_cache):
+    scheduler = _scheduler(git_repo, warm_cache)
+    scheduler.git_client.remote = "origin"
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+
+    scheduler.run_once(job)
+    checkpoint = scheduler.state_store.get_checkpoint(job_key(job.model_dump()))
+    assert checkpoint["stage"] == "committed"
+
+    remote = tmp_path / "remote.git"
+    subprocess.run(["git", "init", "-q", "--bare", str(remote)], check=True)
+    subprocess.run(["git", "remote", "add", "origin", str(remote)], cwd=git_repo, check=True)
+    scheduler.run_once(job)
+
+    problem = checkpoint["problem"]
+    assert set(scheduler.state_store.used_ids()) == {f"codeforces:{problem['contest_id']}:{problem['index']}"}
+    assert scheduler.state_store.get_checkpoint(job_key(job.model_dump())) is None
+    assert len(list((git_repo / "challenges").glob("*/*"))) == 1
+    log = subprocess.run(
+        ["git", "log", "--format=%s"], cwd=git_repo, capture_output=True, text=True, check=True
+    ).stdout.splitlines()
+    assert len(log) == 2
+
+
+def test_batch_retry_keeps_problem_and_removes_failed_folder(git_repo, warm_cache):
+    solver = FailingSolver()
+    scheduler = _scheduler(git_repo, warm_cache, solver=solver, max_retries=1)
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+
+    report = scheduler.run_batch([job])
+
+    assert report.completed == [] and len(report.failed) == 1
+    assert len(solver.problems) == 2 and len(set(solver.problems)) == 1
+    assert list((git_repo / "challenges").glob("*/*")) == []
+
+
+def test_backfill_resume_discards_uncommitted_folders(git_repo, warm_cache):
+    scheduler = _scheduler(git_repo, warm_cache)
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+    orphan = git_repo / "challenges" / "2024-01" / "codeforces_1_A_orphan"
+    orphan.mkdir(parents=True)
+    (orphan / "README.md").write_text("# orphan\n", encoding="utf-8")
+    scheduler.state_store.load()
+    scheduler.state_store.save_checkpoint("batch:seed", {"stage": "tested", "pending": [str(orphan)]})
+
+    report = scheduler.run_backfill(job, count=1, batch_id="seed")
+
+    assert len(report.completed) == 1
+    assert not orphan.exists()
+    assert scheduler.state_store.get_checkpoint("batch:seed") is None
+
+
+def test_final_test_failure_leaves_no_folder_or_index_line(git_repo, warm_cache):
+    scheduler = _scheduler(git_repo, warm_cache, solver=FailingSolver())
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+
+    scheduler.run_once(job)
+
+    assert list((git_repo / "challenges").glob("*/*")) == []
+    assert (git_repo / "INDEX.md").read_text(encoding="utf-8") == "# Desafios\n"
+    assert scheduler.state_store.get_checkpoint(job_key(job.model_dump())) is None
+
+
+def test_new_firing_closes_checkpoint_left_by_previous_one(git_repo, warm_cache):
+    scheduler = _scheduler(git_repo, warm_cache)
+    scheduler.git_client.remote = "origin"
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+    key = job_key(job.model_dump())
+
+    scheduler._execute_job(job, firing="2024-01-01T09:00:00+00:00")
+    first = scheduler.state_store.get_checkpoint(key)
+    scheduler._execute_job(job, firing="2024-01-08T09:00:00+00:00")
+    second = scheduler.state_store.get_checkpoint(key)
+
+    first_id = "codeforces:{contest_id}:{index}".format(**first["problem"])
+    assert first_id in scheduler.state_store.used_ids()
+    assert second["firing"] == "2024-01-08T09:00:00+00:00"
+    assert second["problem"] != first["problem"]
+    assert len(list((git_repo / "challenges").glob("*/*"))) == 2
+
+
+def test_restart_resumes_job_interrupted_after_tests(git_repo, warm_cache, monkeypatch):
+    scheduler = _scheduler(git_repo, warm_cache)
+    job = JobSettings(time="09:00", rating_range=(800, 1400))
+    key = job_key(job.model_dump())
+    firing = "2024-01-01T09:00:00+00:00"
+
+    def crash(*args, **kwargs):
+        raise KeyboardInterrupt
+
+    monkeypatch.setattr(scheduler, "_commit", crash)
+    with pytest.raises(KeyboardInterrupt):
+        scheduler._execute_job(job, firing=firing)
+    checkpoint = scheduler.state_store.get_checkpoint(key)
+    assert checkpoint["stage"] == "tested"
+
+    restarted = _scheduler(git_repo, warm_cache)
+    assert restarted.interrupted_jobs() == [(job, firing)]
+    for pending_job, pending_firing in restarted.interrupted_jobs():
+        restarted._execute_job(pending_job, firing=pending_firing)
+
+    problem_id = "codeforces:{contest_id}:{index}".format(**checkpoint["problem"])
+    assert list(restarted.state_store.used_ids()) == [problem_id]
+    assert restarted.state_store.get_checkpoint(key) is None
+    assert [p.name for p in (git_repo / "challenges").glob("*/*")] == [Path(checkpoint["challenge_dir"]).name]
+    status = subprocess.run(
+        ["git", "status", "--porcelain", "challenges", "INDEX.md"],
+        cwd=git_repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout
+    assert status == ""
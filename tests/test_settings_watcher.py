@@ -0,0 +1,68 @@
+import json
+import os
+from datetime import datetime
+
+from src.schedule import CompiledSchedule
+from src.settings import Settings
+from src.settings_watcher import SettingsWatcher
+from src.utils.time import get_zone
+
+
+def _payload(**overrides):
+    payload = {
+        "repo_path": "/tmp/repo",
+        "timezone": "UTC",
+        "schedule": {
+            "monday": [{"time": "09:00", "difficulty": "easy"}],
+            "friday": [{"time": "18:00", "difficulty": "hard"}],
+        },
+    }
+    payload.update(overrides)
+    return payload
+
+
+def _write(path, payload, bump):
+    path.write_text(json.dumps(payload) if isinstance(payload, dict) else payload, encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + bump * 1_000_000_000))
+
+
+def test_reload_keeps_old_config_on_invalid_file(tmp_path):
+    path = tmp_path / "settings.json"
+    _write(path, _payload(), 0)
+    watcher = SettingsWatcher(path, Settings.load(str(path)))
+    assert watcher.poll() is None
+
+    _write(path, '{"repo_path": ', 1)
+    assert watcher.poll() is None
+    _write(path, _payload(schedule={}), 2)
+    assert watcher.poll() is None
+    assert watcher.current.schedule["monday"][0].time == "09:00"
+
+    changed = _payload(
+        repo_path="/elsewhere",
+        execution={"time_limit_seconds": 9},
+        pipeline={"test_concurrency": 9},
+    )
+    changed["schedule"]["monday"][0]["time"] = "10:00"
+    _write(path, changed, 3)
+    reloaded = watcher.poll()
+    assert reloaded.schedule["monday"][0].time == "10:00"
+    assert reloaded.repo_path == "/tmp/repo"
+    assert reloaded.execution.time_limit_seconds != 9
+    assert reloaded.pipeline.test_concurrency != 9
+
+
+def test_schedule_update_recomputes_only_changed_jobs():
+    now = datetime(2026, 10, 12, 8, 0, tzinfo=get_zone("UTC"))
+    settings = Settings.model_validate(_payload())
+    schedule = CompiledSchedule.compile(settings.schedule, "UTC", now)
+    friday = next(entry for entry in schedule._heap if entry.compiled.day == "friday")
+
+    edited = _payload()
+    edited["schedule"]["monday"][0]["difficulty"] = "medium"
+    added, removed = schedule.update(Settings.model_validate(edited).schedule, now)
+
+    assert (added, removed) == (1, 1)
+    assert friday in schedule._heap
+    assert schedule.peek()[0].difficulty == "medium"
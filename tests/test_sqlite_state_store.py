@@ -0,0 +1,49 @@
+from datetime import datetime, timedelta
+
+from src.sqlite_state_store import SqliteStateStore
+from src.state_store import StateStore
+
+
+def _completed(pid: str, days_ago: int = 0) -> dict:
+    source, contest_id, index = pid.split(":")
+    return {
+        "problem_id": pid,
+        "source": source,
+        "contest_id": int(contest_id),
+        "index": index,
+        "slug": "x",
+        "timestamp": (datetime.now() - timedelta(days=days_ago)).isoformat(),
+    }
+
+
+def test_imports_json_state_losslessly(tmp_path):
+    journal = StateStore(path=tmp_path / "state.jsonl")
+    journal.load()
+    journal.mark_completed(_completed("codeforces:1:A", days_ago=30))
+    journal.mark_failed({"timestamp": "t", "error": "boom", "job": {"time": "09:00"}})
+
+    store = SqliteStateStore(path=tmp_path / "state.sqlite3")
+    store.load()
+
+    assert store.is_completed("codeforces:1:A")
+    assert store.completed_since(365) == journal.data["completed"]
+    assert store.failure_counts_by_job() == {'{"time": "09:00"}': 1}
+
+
+def test_queries_and_concurrent_reader(tmp_path):
+    writer = SqliteStateStore(path=tmp_path / "state.sqlite3")
+    writer.load()
+    writer.mark_completed(_completed("codeforces:1:A", days_ago=10))
+    writer.mark_completed(_completed("codeforces:2:B"))
+    writer.mark_completed(_completed("gym:3:C"))
+
+    reader = SqliteStateStore(path=tmp_path / "state.sqlite3", read_only=True)
+    reader.load()
+    writer.mark_completed(_completed("codeforces:4:D"))
+
+    assert [item["problem_id"] for item in reader.completed_since(2)] == [
+        "codeforces:2:B",
+        "gym:3:C",
+        "codeforces:4:D",
+    ]
+    assert reader.used_ids("gym") == {"gym:3:C"}
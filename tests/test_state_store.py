@@ -0,0 +1,78 @@
+import json
+
+import pytest
+
+from src.state_store import StateStore
+
+
+def _record(pid: str) -> dict:
+    return {"problem_id": pid, "source": "codeforces", "timestamp": "2025-12-01T09:00:00"}
+
+
+def test_appends_and_replays_journal(tmp_path):
+    store = StateStore(path=tmp_path / "state.jsonl")
+    store.load()
+    store.mark_completed(_record("codeforces:1:A"))
+    store.mark_failed({"timestamp": "2025-12-01T09:00:00", "error": "boom", "job": {}})
+
+    assert len((tmp_path / "state.jsonl").read_text(encoding="utf-8").splitlines()) == 2
+
+    reloaded = StateStore(path=tmp_path / "state.jsonl")
+    reloaded.load()
+    assert reloaded.is_completed("codeforces:1:A")
+    assert "codeforces:1:A" in reloaded.used_ids()
+    assert reloaded.data["failed"][0]["error"] == "boom"
+
+
+def test_compacts_superseded_entries(tmp_path):
+    store = StateStore(path=tmp_path / "state.jsonl", compact_every=2)
+    store.load()
+    for _ in range(3):
+        store.mark_completed(_record("codeforces:1:A"))
+
+    lines = (tmp_path / "state.jsonl").read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1
+    assert len(store.data["completed"]) == 1
+
+
+def test_migrates_legacy_state_json(tmp_path):
+    legacy = {"completed": [_record("codeforces:1763:A")], "failed": [{"error": "x"}]}
+    (tmp_path / "state.json").write_text(json.dumps(legacy), encoding="utf-8")
+
+    store = StateStore(path=tmp_path / "state.jsonl")
+    store.load()
+
+    assert store.data == legacy
+    assert (tmp_path / "state.jsonl").exists()
+
+
+def test_ignores_truncated_last_line(tmp_path):
+    path = tmp_path / "state.jsonl"
+    path.write_text(
+        json.dumps({"op": "completed", "record": _record("codeforces:1:A")}) + "\n" + '{"op": "comp',
+        encoding="utf-8",
+    )
+    store = StateStore(path=path)
+    store.load()
+    store.mark_completed(_record("codeforces:2:B"))
+
+    reloaded = StateStore(path=path)
+    reloaded.load()
+    assert reloaded.used_ids() == {"codeforces:1:A", "codeforces:2:B"}
+
+
+def test_read_only_tolerates_torn_line_without_rewriting(tmp_path):
+    path = tmp_path / "state.jsonl"
+    content = json.dumps({"op": "completed", "record": _record("codeforces:1:A")}) + "\n" + '{"op": "comp'
+    path.write_text(content, encoding="utf-8")
+
+    reader = StateStore(path=path, read_only=True, compact_every=1)
+    reader.load()
+
+    assert set(reader.used_ids()) == {"codeforces:1:A"}
+    assert path.read_text(encoding="utf-8") == content
+    with pytest.raises(RuntimeError):
+        reader.mark_completed(_record("codeforces:2:B"))
+    missing = StateStore(path=tmp_path / "other.jsonl", read_only=True)
+    missing.load()
+    assert not missing.path.exists()
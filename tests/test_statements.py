@@ -0,0 +1,108 @@
+import gzip
+import subprocess
+import sys
+from pathlib import Path
+
+from src.providers.base import Problem
+from src.providers.statements import Sample, StatementCache, StatementFetcher, parse_samples
+from src.repo_writer import RepoWriter
+from src.solver.cache import SolutionCache
+from src.solver.llm_solver import LLMSolver
+from src.solver.stub_backend import StubBackend
+from src.solver.template_solver import TemplateSolver
+
+
+FIXTURES = Path(__file__).parent / "fixtures" / "statements"
+
+SUM_PAGE = (
+    '<div class="sample-test"><div class="input"><div class="title">Input</div><pre>1 2<br />3<br /></pre></div>'
+    '<div class="output"><div class="title">Output</div><pre>6</pre></div></div>'
+)
+
+
+def _problem(url):
+    return Problem(source="codeforces", contest_id=1, index="A", name="Soma", rating=800, tags=(), url=url)
+
+
+def test_parse_current_markup_with_line_divs():
+    html = (FIXTURES / "codeforces_1763_A.html").read_text(encoding="utf-8")
+
+    assert parse_samples(html) == [
+        Sample(input="4\n3\n1 0 1\n2\n5 5\n7\n1 2 4 8 16 32 64\n5\n2 3 4 5 6\n", output="1\n0\n127\n7\n")
+    ]
+
+
+def test_parse_legacy_markup_with_br_and_entities():
+    html = (FIXTURES / "codeforces_4_A.html").read_text(encoding="utf-8")
+
+    assert parse_samples(html) == [
+        Sample(input="8\n", output="YES\n"),
+        Sample(input="1 < 2\na & b\n", output="NO\n"),
+    ]
+
+
+def test_cache_hit_regenerates_offline(tmp_path, stub_server, fast_http):
+    stub_server.body = SUM_PAGE.encode("utf-8")
+    problem = _problem(f"{stub_server.url}/problemset/problem/1/A")
+    cache = StatementCache(tmp_path / "statements")
+
+    assert StatementFetcher(cache, fast_http).samples(problem) == [Sample(input="1 2\n3\n", output="6\n")]
+    stub_server.status = 500
+    assert StatementFetcher(StatementCache(tmp_path / "statements"), fast_http).samples(problem)
+    assert len(stub_server.requests) == 1
+    with gzip.open(tmp_path / "statements" / "codeforces" / "1_A.json.gz", "rt", encoding="utf-8") as handle:
+        assert '"problem_id": "codeforces:1:A"' in handle.read()
+
+
+def _run_challenge(challenge_dir):
+    return subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "test_solution.py"],
+        cwd=challenge_dir,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_samples_become_pytest_cases(tmp_path, stub_server, fast_http):
+    stub_server.body = SUM_PAGE.encode("utf-8")
+    problem = _problem(f"{stub_server.url}/problemset/problem/1/A")
+    templates = TemplateSolver(statements=StatementFetcher(StatementCache(tmp_path / "statements"), fast_http))
+    baseline_dir = RepoWriter(repo_path=tmp_path / "baseline").write_problem(
+        problem, templates.generate(problem, "python"), "UTC"
+    )
+    solved = LLMSolver(StubBackend(), SolutionCache(tmp_path / "solutions"), templates=templates)
+    solved_dir = RepoWriter(repo_path=tmp_path / "solved").write_problem(
+        problem, solved.generate(problem, "python"), "UTC"
+    )
+
+    assert (baseline_dir / "samples" / "01.in").read_text(encoding="utf-8") == "1 2\n3\n"
+    assert "1 passed, 1 xfailed" in _run_challenge(baseline_dir)
+    assert "2 passed" in _run_challenge(solved_dir)
+    assert len(stub_server.requests) == 1
+
+
+def test_stub_answers_keep_real_samples_xfail(tmp_path, stub_server, fast_http):
+    stub_server.body = (FIXTURES / "codeforces_4_A.html").read_bytes()
+    problem = _problem(f"{stub_server.url}/problemset/problem/4/A")
+    templates = TemplateSolver(statements=StatementFetcher(StatementCache(tmp_path / "statements"), fast_http))
+    solver = LLMSolver(StubBackend(), SolutionCache(tmp_path / "solutions"), templates=templates, baseline=True)
+    challenge_dir = RepoWriter(repo_path=tmp_path / "repo").write_problem(
+        problem, solver.generate(problem, "python"), "UTC"
+    )
+
+    output = _run_challenge(challenge_dir)
+    assert "1 passed, 2 xfailed" in output
+
+
+def test_empty_samples_expire(tmp_path, stub_server, fast_http):
+    stub_server.body = b"<html>Just a moment...</html>"
+    problem = _problem(f"{stub_server.url}/problemset/problem/1/A")
+    cache = StatementCache(tmp_path / "statements")
+
+    assert StatementFetcher(cache, fast_http).samples(problem) == []
+    assert cache.get(problem.problem_id) == []
+    stub_server.body = SUM_PAGE.encode("utf-8")
+    expired = StatementCache(tmp_path / "statements", empty_ttl_seconds=0)
+
+    assert StatementFetcher(expired, fast_http).samples(problem) == [Sample(input="1 2\n3\n", output="6\n")]
+    assert len(stub_server.requests) == 2
@@ -0,0 +1,63 @@
+import os
+import shutil
+import subprocess
+import sys
+
+import pytest
+
+from src.providers.base import Problem
+from src.repo_writer import RepoWriter
+from src.solver.template_engine import CompiledTemplate, TemplateEngine
+from src.solver.template_solver import TemplateSolver
+
+
+PROBLEM = Problem(
+    source="codeforces",
+    contest_id=1500,
+    index="B",
+    name="Soma {x} $y",
+    rating=None,
+    tags=(),
+    url="https://codeforces.com/problemset/problem/1500/B",
+)
+
+
+def test_compiled_template_keeps_literal_braces_and_dollars():
+    template = CompiledTemplate.compile("t", "int main() { return $$1; } // ${name} $url")
+
+    assert template.render({"name": "{a}", "url": "u"}) == "int main() { return $1; } // {a} u"
+    with pytest.raises(ValueError):
+        CompiledTemplate.compile("t", "custo: $ 5")
+
+
+def test_engine_compiles_each_language_once(monkeypatch):
+    engine = TemplateEngine()
+    solver = TemplateSolver(engine=engine)
+    for language in engine.languages:
+        solver.generate(PROBLEM, language)
+    monkeypatch.setattr(TemplateEngine, "_compile", lambda *args: pytest.fail("template relido"))
+
+    artifacts = {language: solver.generate(PROBLEM, language) for language in engine.languages}
+
+    assert sorted(artifacts) == ["cpp", "go", "java", "python"]
+    assert artifacts["java"].solution_filename == "Solution.java"
+    assert "Problema: Soma {x} $y" in artifacts["cpp"].solution
+    assert "- Rating: N/A" in artifacts["go"].readme
+    with pytest.raises(ValueError):
+        engine.get("rust")
+
+
+@pytest.mark.skipif(shutil.which("g++") is None, reason="g++ nao instalado")
+def test_cpp_challenge_harness_compiles(tmp_path):
+    writer = RepoWriter(repo_path=tmp_path)
+    challenge_dir = writer.write_problem(PROBLEM, TemplateSolver().generate(PROBLEM, "cpp"), "UTC")
+
+    assert sorted(os.listdir(challenge_dir)) == ["README.md", "notes.md", "solution.cpp", "test_solution.py"]
+    result = subprocess.run(
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider", "test_solution.py"],
+        cwd=challenge_dir,
+        capture_output=True,
+        text=True,
+    )
+    assert result.returncode == 0, result.stdout
+    assert "1 passed" in result.stdout
@@ -0,0 +1,64 @@
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.test_runner import TestRunner
+
+
+def _challenge(root, name, answer, extra=""):
+    path = root / name
+    path.mkdir()
+    (path / "solution.py").write_text(f"ANSWER = {answer}\n", encoding="utf-8")
+    (path / "test_solution.py").write_text(
+        textwrap.dedent(
+            f"""
+            import pytest
+            import solution
+
+
+            def test_answer():
+                {extra or "pass"}
+                assert solution.ANSWER == {answer}
+
+
+            @pytest.mark.skip(reason="placeholder")
+            def test_placeholder():
+                pass
+            """
+        ),
+        encoding="utf-8",
+    )
+    return path
+
+
+def test_inprocess_isolates_solution_modules(tmp_path):
+    runner = TestRunner(cwd=tmp_path, mode="inprocess")
+    first = runner.run(_challenge(tmp_path, "a", 1))
+    second = runner.run(_challenge(tmp_path, "b", 2))
+
+    assert first.ok and second.ok
+    assert (second.passed, second.skipped) == (1, 1)
+
+
+def test_inprocess_reports_failures_and_timeouts(tmp_path):
+    runner = TestRunner(cwd=tmp_path, mode="inprocess", timeout_seconds=0.5)
+    failing = runner.run(_challenge(tmp_path, "a", 1, extra="solution.ANSWER = 3"))
+    slow = runner.run(_challenge(tmp_path, "b", 2, extra="import time; time.sleep(5)"))
+
+    assert not failing.ok and failing.failed == 1
+    assert slow.timed_out and not slow.ok
+
+
+@pytest.mark.parametrize("mode", ["inprocess", "subprocess"])
+def test_runs_from_worker_threads(tmp_path, mode):
+    runner = TestRunner(cwd=tmp_path, mode=mode, workers=2)
+    challenges = [_challenge(tmp_path, f"c{i}", i) for i in range(3)]
+    try:
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            reports = list(pool.map(runner.run, challenges))
+    finally:
+        runner.close()
+
+    assert [report.passed for report in reports] == [1, 1, 1]
+    assert all(report.ok for report in reports)